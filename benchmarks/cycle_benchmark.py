@@ -0,0 +1,197 @@
+"""
+BU DOSYA: OBISNotifier.check_grades_once() döngüsünü çevrimdışı ölçen benchmark betiğidir.
+
+Varsayılan olarak süreç içinde taklit OBIS sunucusu (fake_obis_server.py) başlatılır.
+HAR modları:
+    --har-record kayit.har   Tek döngüyü (gerçek veya taklit sunucuya karşı) HAR'a kaydeder.
+    --har-replay kayit.har   Ağa çıkmadan kayıttan tekrar oynatır (yalnızca tarayıcı motoru).
+
+Örnekler:
+    python benchmarks/cycle_benchmark.py --cycles 20 --latency-ms 150
+    python benchmarks/cycle_benchmark.py --engine http --cycles 50 --fail-rate 0.05 --json sonuc.json
+    python benchmarks/cycle_benchmark.py --obis-url "https://obisnet.adu.edu.tr/GIRIS?sw=OBIS&u=o" \\
+        --student-id 221805001 --password ... --har-record obis.har
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from playwright.sync_api import BrowserContext  # noqa: E402
+
+from config import OBISSelectors  # noqa: E402
+from core.notifier import OBISNotifier  # noqa: E402
+from services.browser import get_navigation_profile  # noqa: E402
+from services.browser_pool import BrowserPool  # noqa: E402
+from utils.date_utils import get_current_semester  # noqa: E402
+from fake_obis_server import FakeOBISConfig, FakeOBISServer  # noqa: E402
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _har_meta_path(har_path: str) -> str:
+    return har_path + ".meta.json"
+
+
+def _make_har_setup(har_path: str, record: bool):
+    """BrowserPool.context_setup kancası: context'i HAR kaydına/tekrarına bağlar."""
+    def setup(context: BrowserContext) -> None:
+        if record:
+            context.route_from_har(har_path, update=True, update_content="embed")
+        else:
+            context.route_from_har(har_path, not_found="abort")
+    return setup
+
+
+def summarize(durations: List[float], results: List[Dict[str, Any]], wall_time: float) -> Dict[str, Any]:
+    """Döngü sürelerinden özet istatistik üretir."""
+    ok = [d for d, r in zip(durations, results) if r.get("success")]
+    return {
+        "cycles": len(durations),
+        "success": len(ok),
+        "failed": len(durations) - len(ok),
+        "mean_s": round(statistics.mean(durations), 3) if durations else 0.0,
+        "p50_s": round(_percentile(durations, 50), 3),
+        "p95_s": round(_percentile(durations, 95), 3),
+        "min_s": round(min(durations), 3) if durations else 0.0,
+        "max_s": round(max(durations), 3) if durations else 0.0,
+        "throughput_per_min": round(len(durations) / wall_time * 60, 2) if wall_time else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OBIS kontrol döngüsü benchmark'ı")
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--engine", choices=("browser", "http"), default="browser")
+    parser.add_argument("--browser", default="chromium")
+    parser.add_argument("--profile", choices=("fast", "humanlike"), default="fast")
+    parser.add_argument("--watch-all", action="store_true", help="generate_semester_list() dönemlerini de izle")
+    parser.add_argument("--obis-url", default=None, help="Taklit sunucu yerine bu adrese bağlan")
+    parser.add_argument("--student-id", default="221805001")
+    parser.add_argument("--password", default="test")
+    parser.add_argument("--semester", default=None)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--jitter-ms", type=int, default=0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--captcha-rate", type=float, default=0.0)
+    parser.add_argument("--change-every", type=int, default=0)
+    parser.add_argument("--har-record", default=None)
+    parser.add_argument("--har-replay", default=None)
+    parser.add_argument("--trace-slow-s", type=float, default=None,
+                        help="Bu süreyi aşan veya başarısız döngülerin Playwright izini sakla")
+    parser.add_argument("--trace-dir", default="traces", help="Saklanan izlerin klasörü")
+    parser.add_argument("--json", default=None, help="Özet sonucu bu dosyaya yaz")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(asctime)s - %(levelname)s - %(message)s")
+
+    if (args.har_record or args.har_replay) and args.engine != "browser":
+        parser.error("HAR kayıt/tekrar yalnızca tarayıcı motoruyla kullanılabilir.")
+
+    # --- Hedef sunucu ---
+    server: Optional[FakeOBISServer] = None
+    if args.har_replay:
+        with open(_har_meta_path(args.har_replay), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        obis_url = meta["obis_url"]
+        args.student_id = meta.get("student_id", args.student_id)
+    elif args.obis_url:
+        obis_url = args.obis_url
+    else:
+        server = FakeOBISServer(FakeOBISConfig(
+            student_id=args.student_id, password=args.password,
+            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+            fail_rate=args.fail_rate, captcha_rate=args.captcha_rate,
+            change_every=args.change_every
+        )).start()
+        obis_url = server.login_url
+    OBISSelectors.OBIS_URL = obis_url
+
+    if args.har_record and args.cycles != 1:
+        print("HAR kaydı tek döngüyle yapılır (--cycles 1).")
+        args.cycles = 1
+
+    har_path = args.har_record or args.har_replay
+    pool = BrowserPool(
+        browser_type=args.browser,
+        headless=True,
+        slow_mo=get_navigation_profile(args.profile)["slow_mo"],
+        context_setup=_make_har_setup(har_path, record=bool(args.har_record)) if har_path else None
+    )
+
+    durations: List[float] = []
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="obis_bench_") as data_dir:
+        settings = {
+            "student_id": args.student_id,
+            "obis_password": args.password,
+            "semester": args.semester or get_current_semester(),
+            "watch_all_semesters": args.watch_all,
+            "browser": args.browser,
+            "navigation_profile": args.profile,
+            "fetch_engine": args.engine,
+            "notification_methods": [],
+            "data_dir": data_dir,
+            "trace_mode": args.trace_slow_s is not None,
+            "trace_slow_threshold_s": args.trace_slow_s or 0,
+            "trace_dir": os.path.abspath(args.trace_dir),
+        }
+        notifier = OBISNotifier(settings, browser_pool=pool)
+        # Benchmark hataları ölçer; art arda hata durdurması devre dışı
+        notifier.stop_on_failures = False
+
+        wall_start = time.perf_counter()
+        try:
+            for cycle in range(1, args.cycles + 1):
+                start = time.perf_counter()
+                result = notifier.check_grades_once()
+                elapsed = time.perf_counter() - start
+                durations.append(elapsed)
+                results.append(result)
+                status = "OK " if result.get("success") else "ERR"
+                print(f"[{cycle:>3}/{args.cycles}] {status} {elapsed:6.2f} sn  {result.get('message', '')}")
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            fingerprint_stats = notifier.get_fingerprint_stats()
+            snapshot_cache_stats = notifier.get_snapshot_cache_stats()
+            notifier.cancel()
+            pool.shutdown()
+
+    summary = summarize(durations, results, wall_time)
+    summary.update({"engine": args.engine, "profile": args.profile, "browser": args.browser,
+                    "mode": "har-replay" if args.har_replay else ("har-record" if args.har_record else "live"),
+                    "fingerprint_hit_rate": fingerprint_stats["hit_rate"],
+                    "snapshot_cache": snapshot_cache_stats})
+    if server:
+        summary["server_stats"] = dict(server.stats)
+        server.stop()
+
+    if args.har_record:
+        with open(_har_meta_path(args.har_record), "w", encoding="utf-8") as f:
+            json.dump({"obis_url": obis_url, "student_id": args.student_id}, f, indent=2)
+        print(f"HAR kaydedildi: {args.har_record}")
+
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
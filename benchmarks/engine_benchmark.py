@@ -0,0 +1,75 @@
+"""
+BU DOSYA: Kurulu tarayıcı motorlarını taklit OBIS sunucusuna (veya --obis-url
+adresine) karşı giriş + notlar akışıyla ölçen komut satırı betiğidir.
+Uygulamadaki "Otomatik" tarayıcı ayarıyla aynı servisi (services/engine_benchmark.py) kullanır.
+
+Örnekler:
+    python benchmarks/engine_benchmark.py --cycles 3
+    python benchmarks/engine_benchmark.py --stand-in --engines chromium
+    python benchmarks/engine_benchmark.py --save --json motorlar.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from config import OBISSelectors  # noqa: E402
+from services.engine_benchmark import ENGINE_BENCHMARK_FILE, SUPPORTED_ENGINES, benchmark_engines  # noqa: E402
+from fake_obis_server import FakeOBISConfig, FakeOBISServer  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tarayıcı motoru benchmark'ı")
+    parser.add_argument("--engines", nargs="+", choices=SUPPORTED_ENGINES, default=list(SUPPORTED_ENGINES))
+    parser.add_argument("--cycles", type=int, default=2)
+    parser.add_argument("--stand-in", action="store_true", help="Sunucu yerine bellek içi temsili not sayfası kullan")
+    parser.add_argument("--obis-url", default=None, help="Taklit sunucu yerine bu adrese bağlan")
+    parser.add_argument("--student-id", default="221805001")
+    parser.add_argument("--password", default="test")
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--save", action="store_true", help="Sonucu uygulamanın 'auto' ayarının okuduğu dosyaya yaz")
+    parser.add_argument("--json", default=None, help="Raporu bu dosyaya da yaz")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(asctime)s - %(levelname)s - %(message)s")
+
+    server: Optional[FakeOBISServer] = None
+    if not args.stand_in:
+        if args.obis_url:
+            OBISSelectors.OBIS_URL = args.obis_url
+        else:
+            server = FakeOBISServer(FakeOBISConfig(student_id=args.student_id, password=args.password,
+                                                   latency_ms=args.latency_ms)).start()
+            OBISSelectors.OBIS_URL = server.login_url
+
+    student_id = None if args.stand_in else args.student_id
+    password = None if args.stand_in else args.password
+    try:
+        if args.save:
+            report = benchmark_engines(student_id, password, args.engines, args.cycles)
+        else:
+            with tempfile.TemporaryDirectory(prefix="obis_engine_") as tmp:
+                report = benchmark_engines(student_id, password, args.engines, args.cycles,
+                                           path=os.path.join(tmp, "engine_benchmark.json"))
+    finally:
+        if server:
+            server.stop()
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if args.save:
+        print(f"Kaydedildi: {ENGINE_BENCHMARK_FILE}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
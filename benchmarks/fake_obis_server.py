@@ -0,0 +1,484 @@
+"""
+BU DOSYA: Gerçek obisnet.adu.edu.tr yerine kullanılabilen yerel OBIS taklit sunucusudur.
+
+`OBISSelectors` içindeki tüm seçicileri (login formu, Telerik menü ağacı,
+dönem RadComboBox'ı, not tablosu, rapor görüntüleyici PDF dışa aktarımı) aynı
+id/name değerleriyle üretir. Gecikme ve hata enjeksiyonu ayarlanabilir; böylece
+BrowserService, HttpFetchService ve OBISNotifier çevrimdışı ölçülebilir.
+
+Kullanım:
+    python benchmarks/fake_obis_server.py --port 8765 --latency-ms 120 --fail-rate 0.05
+    set OBIS_URL=http://127.0.0.1:8765/GIRIS?sw=OBIS&u=o
+"""
+
+import argparse
+import base64
+import html
+import json
+import logging
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from config import OBISSelectors  # noqa: E402
+from utils.date_utils import generate_semester_list  # noqa: E402
+
+LOGIN_PATH = "/GIRIS"
+HOME_PATH = "/Default.aspx"
+GRADES_PATH = "/NotGoruntule.aspx"
+GRADUATION_PATH = "/MezuniyetKontrol.aspx"
+REPORT_PATH = "/Reserved.ReportViewerWebControl.axd"
+STATS_PATH = "/__stats"
+
+SESSION_COOKIE = "ASP.NET_SessionId"
+
+# Seçicilerden türetilen id/name değerleri (tek kaynak: config.OBISSelectors)
+_USERNAME_NAME = OBISSelectors.LOGIN_USERNAME_INPUT.split('"')[1]
+_PASSWORD_NAME = OBISSelectors.LOGIN_PASSWORD_INPUT.split('"')[1]
+_LOGIN_BUTTON_ID = OBISSelectors.LOGIN_BUTTON.lstrip("#")
+_COMBO_ARROW_ID = OBISSelectors.SEMESTER_COMBOBOX_ARROW.lstrip("#")
+_COMBO_DROPDOWN_ID = OBISSelectors.SEMESTER_DROPDOWN_LIST.lstrip("#")
+_COMBO_INPUT_ID = _COMBO_ARROW_ID.replace("_Arrow", "_Input")
+_REPORT_BUTTON_ID = OBISSelectors.PROFILE_DOWNLOAD_BUTTON.lstrip("#")
+_REPORT_MENU_ID = OBISSelectors.PROFILE_DOWNLOAD_MENU.lstrip("#")
+
+_COURSES = (
+    ("BİL101 Programlamaya Giriş", "AA"),
+    ("MAT101 Matematik I", "BA"),
+    ("FİZ101 Fizik I", "BB"),
+    ("TÜR101 Türk Dili I", "AA"),
+    ("İNG101 İngilizce I", "CB"),
+    ("BİL103 Bilgisayar Mühendisliğine Giriş", "BA"),
+)
+
+_WINANSI_FALLBACK = str.maketrans("İıŞşĞğ", "IiSsGg")
+
+
+class FakeOBISConfig:
+    """Taklit sunucunun davranış ayarları."""
+
+    def __init__(self,
+                 student_id: str = "221805001",
+                 password: str = "test",
+                 latency_ms: int = 0,
+                 jitter_ms: int = 0,
+                 fail_rate: float = 0.0,
+                 drop_rate: float = 0.0,
+                 captcha_rate: float = 0.0,
+                 change_every: int = 0,
+                 session_ttl: int = 0,
+                 viewstate_kb: int = 40,
+                 semesters: Optional[List[str]] = None,
+                 seed: Optional[int] = None):
+        self.student_id = student_id
+        self.password = password
+        self.latency_ms = latency_ms          # Her isteğe eklenen sabit gecikme
+        self.jitter_ms = jitter_ms            # 0..jitter_ms arası rastgele ek gecikme
+        self.fail_rate = fail_rate            # HTTP 500 dönme olasılığı
+        self.drop_rate = drop_rate            # Yanıt vermeden bağlantıyı kapatma olasılığı
+        self.captcha_rate = captcha_rate      # Login sayfasında reCAPTCHA çıkma olasılığı
+        self.change_every = change_every      # Her N tablo gösteriminde bir not değişir (0: hiç)
+        self.session_ttl = session_ttl        # Oturum ömrü (sn, 0: sınırsız)
+        self.viewstate_kb = viewstate_kb      # __VIEWSTATE boyutu (gerçek sayfa ağırlığı için)
+        self.semesters = semesters or _default_semesters()
+        self.random = random.Random(seed)
+
+
+def _default_semesters() -> List[str]:
+    """generate_semester_list() dönemleri + iki eski dönem."""
+    current = generate_semester_list()
+    first_year = int(current[0].split("/")[0])
+    older = [f"{first_year - 1:02d}/{first_year:02d} Bahar", f"{first_year - 1:02d}/{first_year:02d} Güz"]
+    return list(reversed(current)) + older
+
+
+def build_pdf(lines: List[str]) -> bytes:
+    """Tek sayfalık, Helvetica (WinAnsi) metin içeren minimal bir PDF üretir."""
+    def escape(text: str) -> str:
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    body = "BT /F1 9 Tf 40 800 Td 13 TL " + " ".join(f"({escape(line)}) Tj T*" for line in lines) + " ET"
+    stream = body.encode("cp1252", errors="replace")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + obj + b"\nendobj\n"
+
+    xref_offset = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+class FakeOBISServer(ThreadingHTTPServer):
+    """OBIS sayfalarını üreten çok thread'li HTTP sunucusu. Durum bellekte tutulur."""
+
+    daemon_threads = True
+
+    def __init__(self, config: Optional[FakeOBISConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _FakeOBISHandler)
+        self.config = config or FakeOBISConfig()
+        self.lock = threading.Lock()
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self.stats: Dict[str, int] = {}
+        self.grade_renders = 0
+        self.grade_bumps: Dict[Tuple[str, int], int] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def login_url(self) -> str:
+        """OBIS_URL olarak kullanılacak adres."""
+        return f"{self.base_url}{LOGIN_PATH}?sw=OBIS&u=o"
+
+    def start(self) -> "FakeOBISServer":
+        """Sunucuyu arka plan thread'inde başlatır."""
+        self._thread = threading.Thread(target=self.serve_forever, name="FakeOBIS", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def count(self, key: str) -> None:
+        with self.lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def grades_for(self, semester: str) -> List[Tuple[str, str, str, str, str]]:
+        """Döneme ait (ders, sınavlar, harf, kredi, sonuç) satırlarını üretir."""
+        with self.lock:
+            self.grade_renders += 1
+            change_every = self.config.change_every
+            if change_every and self.grade_renders % change_every == 0:
+                index = self.config.random.randrange(len(_COURSES))
+                key = (semester, index)
+                self.grade_bumps[key] = self.grade_bumps.get(key, 0) + 1
+            bumps = dict(self.grade_bumps)
+
+        seed = sum(ord(c) for c in semester)
+        rows = []
+        for index, (course, letter) in enumerate(_COURSES):
+            vize = 40 + (seed + index * 7) % 55
+            final = min(100, 45 + (seed + index * 11) % 50 + bumps.get((semester, index), 0))
+            rows.append((course, f"Vize : {vize}  Final : {final}", letter, "6", "Geçti"))
+        return rows
+
+
+class _FakeOBISHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeOBISServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logging.debug("FakeOBIS: " + format % args)
+
+    # ================= YARDIMCILAR =================
+
+    def _inject(self) -> bool:
+        """Gecikme ve hata enjeksiyonu. Yanıt üretildiyse True döner."""
+        cfg = self.server.config
+        delay = cfg.latency_ms + (cfg.random.uniform(0, cfg.jitter_ms) if cfg.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000)
+
+        if cfg.drop_rate and cfg.random.random() < cfg.drop_rate:
+            self.server.count("dropped")
+            self.close_connection = True
+            self.connection.close()
+            return True
+        if cfg.fail_rate and cfg.random.random() < cfg.fail_rate:
+            self.server.count("failed")
+            self._send(500, "<html><body><h1>Server Error in '/' Application.</h1></body></html>")
+            return True
+        return False
+
+    def _send(self, status: int, body: Any, content_type: str = "text/html; charset=utf-8",
+              headers: Optional[Dict[str, str]] = None) -> None:
+        data = body if isinstance(body, bytes) else body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect(self, location: str, cookie: Optional[str] = None) -> None:
+        headers = {"Location": location}
+        if cookie:
+            headers["Set-Cookie"] = cookie
+        self._send(302, "", headers=headers)
+
+    def _session(self) -> Optional[Dict[str, Any]]:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        token = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+        if not token:
+            return None
+        with self.server.lock:
+            session = self.server.sessions.get(token)
+            ttl = self.server.config.session_ttl
+            if session and ttl and time.monotonic() - session["created"] > ttl:
+                del self.server.sessions[token]
+                return None
+        return session
+
+    def _form(self) -> Dict[str, str]:
+        length = int(self.headers.get("Content-Length", "0"))
+        raw = self.rfile.read(length).decode("utf-8") if length else ""
+        return {key: values[0] for key, values in parse_qs(raw, keep_blank_values=True).items()}
+
+    def _viewstate(self) -> str:
+        size = max(1, self.server.config.viewstate_kb) * 1024
+        return base64.b64encode(secrets.token_bytes(size * 3 // 4)).decode()
+
+    # ================= SAYFALAR =================
+
+    def _page(self, title: str, content: str, menu: bool = True, extra_head: str = "") -> str:
+        return f"""<!DOCTYPE html>
+<html lang="tr"><head><meta charset="utf-8"><title>{title}</title>{extra_head}
+<style>.rtLI ul {{ padding-left: 16px; }} .rtTop {{ cursor: pointer; padding: 4px; }}</style></head>
+<body><form method="post" id="aspnetForm" action="">
+<input type="hidden" name="__EVENTTARGET" id="__EVENTTARGET" value="">
+<input type="hidden" name="__EVENTARGUMENT" id="__EVENTARGUMENT" value="">
+<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{self._viewstate()}">
+<input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="{secrets.token_hex(32)}">
+{self._menu() if menu else ""}
+<div id="content">{content}</div>
+</form>
+<script>
+document.querySelectorAll('.rtLI > .rtTop').forEach(function (top) {{
+    top.addEventListener('click', function () {{
+        var sub = top.parentElement.querySelector('ul');
+        if (sub) sub.style.display = sub.style.display === 'none' ? 'block' : 'none';
+    }});
+}});
+</script></body></html>"""
+
+    @staticmethod
+    def _menu() -> str:
+        def group(title: str, items: List[Tuple[str, str]]) -> str:
+            links = "".join(f'<li class="rtLI"><a class="rtIn" href="{href}">{text}</a></li>' for text, href in items)
+            return (f'<li class="rtLI"><div class="rtTop"><span class="rtIn">{title}</span></div>'
+                    f'<ul class="rtUL" style="display:none">{links}</ul></li>')
+
+        return ('<div class="RadTreeView"><ul class="rtUL">'
+                + group("Ders Kayıt İşlemleri", [("Ders Kayıt", "#")])
+                + group("Not Sınav İşlemleri", [("Öğrenci Not Görüntüle", GRADES_PATH)])
+                + group("Mezuniyet İşlemleri", [("Öğrenci Mezuniyet Kontrol", GRADUATION_PATH)])
+                + group("Açık Rıza İşlemleri", [("Açık Rıza Metni", "#")])
+                + "</ul></div>")
+
+    def _login_page(self, error: str = "") -> str:
+        captcha = ""
+        cfg = self.server.config
+        if cfg.captcha_rate and cfg.random.random() < cfg.captcha_rate:
+            self.server.count("captcha")
+            captcha = '<div class="g-recaptcha" data-sitekey="fake-site-key"></div>'
+        content = f"""<div class="login">
+<input type="text" name="{_USERNAME_NAME}">
+<input type="password" name="{_PASSWORD_NAME}">
+{captcha}
+<input type="submit" name="{OBISSelectors.LOGIN_BUTTON_NAME}" id="{_LOGIN_BUTTON_ID}" value="Giriş Yap">
+<span class="error">{html.escape(error)}</span></div>"""
+        return self._page("OBİS Giriş", content, menu=False)
+
+    def _grades_page(self, session: Dict[str, Any]) -> str:
+        cfg = self.server.config
+        selected = session.get("semester")
+        items = "".join(f'<li class="rcbItem">{html.escape(s)}</li>' for s in cfg.semesters)
+
+        table = ""
+        if selected:
+            rows = "".join(
+                "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>"
+                for row in self.server.grades_for(selected)
+            )
+            table = (f'<table id="{OBISSelectors.GRADES_TABLE_ID}" class="rgMasterTable">'
+                     "<thead><tr><th>Ders</th><th>Sınavlar</th><th>Harf Notu</th><th>Kredi</th><th>Sonuç</th></tr></thead>"
+                     f"<tbody>{rows}</tbody></table>")
+
+        content = f"""
+<div class="RadComboBox">
+  <input id="{_COMBO_INPUT_ID}" name="{OBISSelectors.SEMESTER_COMBOBOX_NAME}" value="{html.escape(selected or 'Seçiniz')}" readonly>
+  <a id="{_COMBO_ARROW_ID}" href="javascript:void(0)">&#9660;</a>
+</div>
+<input type="hidden" id="{OBISSelectors.SEMESTER_COMBOBOX_CLIENT_STATE}" name="{OBISSelectors.SEMESTER_COMBOBOX_CLIENT_STATE}" value="">
+<div id="{_COMBO_DROPDOWN_ID}" style="display:none"><ul class="rcbList">{items}</ul></div>
+{table}
+<script>
+document.getElementById('{_COMBO_ARROW_ID}').addEventListener('click', function () {{
+    var dd = document.getElementById('{_COMBO_DROPDOWN_ID}');
+    dd.style.display = dd.style.display === 'none' ? 'block' : 'none';
+}});
+document.querySelectorAll('#{_COMBO_DROPDOWN_ID} li').forEach(function (li, index) {{
+    li.addEventListener('click', function () {{
+        var text = li.textContent.trim();
+        document.getElementById('{_COMBO_INPUT_ID}').value = text;
+        document.getElementById('{OBISSelectors.SEMESTER_COMBOBOX_CLIENT_STATE}').value =
+            JSON.stringify({{value: text, text: text, enabled: true}});
+        document.getElementById('__EVENTTARGET').value = '{OBISSelectors.SEMESTER_COMBOBOX_NAME}';
+        document.getElementById('__EVENTARGUMENT').value = JSON.stringify({{Command: 'Select', Index: index}});
+        document.getElementById('aspnetForm').submit();
+    }});
+}});
+</script>"""
+        return self._page("Öğrenci Not Görüntüle", content)
+
+    def _graduation_page(self) -> str:
+        content = f"""
+<div class="ReportViewer">
+  <input type="button" id="{_REPORT_BUTTON_ID}" value="Dışa Aktar">
+  <div id="{_REPORT_MENU_ID}" style="display:none">
+    <a title="Word" href="#">Word</a>
+    <a title="PDF" href="{REPORT_PATH}?OpType=Export&amp;Format=PDF">PDF</a>
+  </div>
+</div>
+<script>
+document.getElementById('{_REPORT_BUTTON_ID}').addEventListener('click', function () {{
+    document.getElementById('{_REPORT_MENU_ID}').style.display = 'block';
+}});
+</script>"""
+        return self._page("Öğrenci Mezuniyet Kontrol", content)
+
+    def _graduation_pdf(self) -> bytes:
+        cfg = self.server.config
+        lines = [
+            "OGRENCI MEZUNIYET KONTROL RAPORU",
+            f"{cfg.student_id}   Test Ogrenci   3   3,12   Bilgisayar Muhendisligi",
+            "120   30   10   160   150   60   20   240",
+        ]
+        for course, letter in _COURSES:
+            # Helvetica/WinAnsi ğ, ş, ı, İ karakterlerini içermez
+            lines.append(f"{course.translate(_WINANSI_FALLBACK)}   23/24 Güz   {letter}   6")
+        return build_pdf(lines)
+
+    # ================= YÖNLENDİRME =================
+
+    def do_GET(self) -> None:
+        path = urlparse(self.path).path
+        self.server.count(f"GET {path}")
+
+        if path == STATS_PATH:
+            with self.server.lock:
+                payload = json.dumps({"stats": self.server.stats, "sessions": len(self.server.sessions)})
+            return self._send(200, payload, "application/json")
+
+        if self._inject():
+            return
+
+        if path == LOGIN_PATH:
+            return self._send(200, self._login_page())
+
+        session = self._session()
+        if session is None:
+            return self._redirect(f"{LOGIN_PATH}?sw=OBIS&u=o")
+
+        if path in ("/", HOME_PATH):
+            return self._send(200, self._page("OBİS", "<h2>Hoş geldiniz</h2>"))
+        if path == GRADES_PATH:
+            session["semester"] = None
+            return self._send(200, self._grades_page(session))
+        if path == GRADUATION_PATH:
+            return self._send(200, self._graduation_page())
+        if path == REPORT_PATH:
+            return self._send(200, self._graduation_pdf(), "application/pdf",
+                              {"Content-Disposition": 'attachment; filename="MezuniyetKontrol.pdf"'})
+        return self._send(404, "<html><body>Bulunamadı</body></html>")
+
+    def do_POST(self) -> None:
+        path = urlparse(self.path).path
+        self.server.count(f"POST {path}")
+        form = self._form()
+
+        if self._inject():
+            return
+
+        if "__VIEWSTATE" not in form:
+            return self._send(500, "<html><body>Validation of viewstate MAC failed.</body></html>")
+
+        if path == LOGIN_PATH:
+            cfg = self.server.config
+            if (form.get(_USERNAME_NAME) == f"{cfg.student_id}@stu.adu.edu.tr"
+                    and form.get(_PASSWORD_NAME) == cfg.password):
+                token = secrets.token_hex(12)
+                with self.server.lock:
+                    self.server.sessions[token] = {"created": time.monotonic(), "semester": None}
+                self.server.count("login_ok")
+                return self._redirect(HOME_PATH, f"{SESSION_COOKIE}={token}; Path=/; HttpOnly")
+            self.server.count("login_failed")
+            return self._send(200, self._login_page("Kullanıcı adı veya şifre hatalı."))
+
+        session = self._session()
+        if session is None:
+            return self._redirect(f"{LOGIN_PATH}?sw=OBIS&u=o")
+
+        if path == GRADES_PATH:
+            if form.get("__EVENTTARGET") == OBISSelectors.SEMESTER_COMBOBOX_NAME:
+                semester = form.get(OBISSelectors.SEMESTER_COMBOBOX_NAME, "")
+                session["semester"] = semester if semester in self.server.config.semesters else None
+            return self._send(200, self._grades_page(session))
+
+        return self._send(404, "<html><body>Bulunamadı</body></html>")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Yerel OBIS taklit sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--student-id", default="221805001")
+    parser.add_argument("--password", default="test")
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--jitter-ms", type=int, default=0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--captcha-rate", type=float, default=0.0)
+    parser.add_argument("--change-every", type=int, default=0)
+    parser.add_argument("--session-ttl", type=int, default=0)
+    parser.add_argument("--viewstate-kb", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    config = FakeOBISConfig(
+        student_id=args.student_id, password=args.password,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        fail_rate=args.fail_rate, drop_rate=args.drop_rate, captcha_rate=args.captcha_rate,
+        change_every=args.change_every, session_ttl=args.session_ttl,
+        viewstate_kb=args.viewstate_kb, seed=args.seed
+    )
+    server = FakeOBISServer(config, args.host, args.port)
+    logging.info(f"Taklit OBIS hazır. OBIS_URL={server.login_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
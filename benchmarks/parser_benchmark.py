@@ -0,0 +1,99 @@
+"""
+BU DOSYA: Not tablosu ayrıştırıcı arka uçlarını (services/html_parsers.py) aynı
+sayfa üzerinde karşılaştıran benchmark betiğidir. Her arka ucun çıktısının eski
+tam sayfa BeautifulSoup ayrıştırmasıyla birebir aynı olduğu da doğrulanır.
+
+Sayfa kaynağı:
+    --html sayfa.html   Kaydedilmiş gerçek bir OBIS not sayfası
+    (varsayılan)        Taklit OBIS sunucusundan HTTP motoruyla alınan not sayfası
+
+Örnekler:
+    python benchmarks/parser_benchmark.py --iterations 200
+    python benchmarks/parser_benchmark.py --viewstate-kb 150 --json parser.json
+    python benchmarks/parser_benchmark.py --html kayit/NotGoruntule.html
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from config import OBISSelectors  # noqa: E402
+from services.html_parsers import TableNotFound, available_backends, get_row_parser  # noqa: E402
+from services.http_fetch import HttpFetchService  # noqa: E402
+from utils.date_utils import get_current_semester  # noqa: E402
+from fake_obis_server import FakeOBISConfig, FakeOBISServer  # noqa: E402
+
+
+def _fetch_fake_page(viewstate_kb: int) -> str:
+    """Taklit sunucuyu başlatıp seçili dönemin not sayfasını döner."""
+    config = FakeOBISConfig(viewstate_kb=viewstate_kb)
+    server = FakeOBISServer(config).start()
+    OBISSelectors.OBIS_URL = server.login_url
+    http = HttpFetchService()
+    try:
+        semester = get_current_semester()
+        pages = http.fetch_semesters_html(config.student_id, config.password, [semester])
+        if not pages or isinstance(pages.get(semester), Exception):
+            raise RuntimeError("Taklit sunucudan not sayfası alınamadı.")
+        return pages[semester]
+    finally:
+        http.close()
+        server.stop()
+
+
+def _run(backend: str, html_content: str) -> Any:
+    try:
+        return get_row_parser(backend)(html_content, OBISSelectors.GRADES_TABLE_ID)
+    except TableNotFound:
+        return "TABLO_YOK"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Not tablosu ayrıştırıcı benchmark'ı")
+    parser.add_argument("--html", default=None, help="Ayrıştırılacak kayıtlı sayfa")
+    parser.add_argument("--viewstate-kb", type=int, default=40, help="Taklit sayfanın __VIEWSTATE boyutu")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--json", default=None, help="Sonucu bu dosyaya yaz")
+    args = parser.parse_args()
+
+    if args.html:
+        with open(args.html, "r", encoding="utf-8") as f:
+            html_content = f.read()
+    else:
+        html_content = _fetch_fake_page(args.viewstate_kb)
+
+    reference = _run("soup", html_content)
+    results: Dict[str, Dict[str, Any]] = {}
+    for backend in available_backends():
+        identical = _run(backend, html_content) == reference
+        durations = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            _run(backend, html_content)
+            durations.append(time.perf_counter() - start)
+        results[backend] = {
+            "identical": identical,
+            "mean_ms": round(statistics.mean(durations) * 1000, 3),
+            "min_ms": round(min(durations) * 1000, 3),
+        }
+
+    baseline = results["soup"]["mean_ms"]
+    print(f"Sayfa: {len(html_content) / 1024:.1f} KB, {args.iterations} tekrar")
+    for backend, r in results.items():
+        speedup = baseline / r["mean_ms"] if r["mean_ms"] else 0.0
+        status = "aynı" if r["identical"] else "FARKLI"
+        print(f"  {backend:<11} {r['mean_ms']:8.3f} ms  x{speedup:5.1f}  çıktı: {status}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"page_kb": round(len(html_content) / 1024, 1), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
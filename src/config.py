@@ -3,6 +3,8 @@ BU DOSYA: Proje genelindeki constant'ları,
 versiyon bilgisini ve HTML/CSS Selector'ları barındırır.
 """
 
+import os
+
 # !Uygulama Versiyonu
 CURRENT_VERSION = "v3.0"
 
@@ -11,7 +13,16 @@ class OBISSelectors:
     OBIS sistemi web arayüzü için gerekli HTML/CSS Selector'ları tutar.
     """
     # !--- Genel ---
-    OBIS_URL = "https://obisnet.adu.edu.tr/GIRIS?sw=OBIS&u=o"
+    # OBIS_URL ortam değişkeni yerel test sunucusuna (benchmarks/fake_obis_server.py) yönlendirmek içindir
+    OBIS_URL = os.environ.get("OBIS_URL", "https://obisnet.adu.edu.tr/GIRIS?sw=OBIS&u=o")
+
+    # !--- Bekleme Süreleri (ms) ---
+    # Her Playwright işleminin varsayılan zaman aşımı (Playwright varsayılanı 30 sn)
+    STEP_TIMEOUT_MS = 20000
+    # Giriş butonundan sonra menünün gelmesi için beklenecek en uzun süre
+    LOGIN_RESULT_TIMEOUT_MS = 15000
+    # Dönem seçimi sonrası postback yanıtı için beklenecek en uzun süre
+    POSTBACK_TIMEOUT_MS = 10000
 
     # !--- Giriş Ekranı ---
     # Kullanıcı adı input alanı (name attribute ile seçim)
@@ -20,9 +31,16 @@ class OBISSelectors:
     LOGIN_PASSWORD_INPUT = 'input[name="ctl00$ctl00$cphMain$cphContent$loginRecaptcha$Password"]'
     # Giriş butonu ID'si
     LOGIN_BUTTON = '#ctl00_ctl00_cphMain_cphContent_loginRecaptcha_btnGiris'
+    # Giriş butonunun form alan adı (HTTP motoru postback'i için)
+    LOGIN_BUTTON_NAME = 'ctl00$ctl00$cphMain$cphContent$loginRecaptcha$btnGiris'
+    # Başarılı girişte menüde görünen başlıklar
+    LOGIN_SUCCESS_MARKERS = ("Ders Kayıt İşlemleri", "Not Sınav İşlemleri", "Açık Rıza İşlemleri")
+    # Bilgiler hatalıyken login formuyla birlikte dönen uyarıdaki ifadeler (küçük harfle aranır)
+    LOGIN_FAILURE_MARKERS = ("hatalı", "yanlış", "geçersiz")
     
     # !--- Navigasyon Menüsü ---
     # Soldaki menü öğesi
+    MENU_ITEM = '.rtLI'
     MENU_NOT_SINAV = '.rtLI:has-text("Not Sınav İşlemleri")'
     MENU_OGRENCI_NOT = '.rtIn:has-text("Öğrenci Not Görüntüle")'
     
@@ -31,12 +49,17 @@ class OBISSelectors:
     SEMESTER_COMBOBOX_ARROW = '#ctl00_ctl00_cphMain_cphContent_cmbDonem_Arrow'
     # Dropdown list
     SEMESTER_DROPDOWN_LIST = '#ctl00_ctl00_cphMain_cphContent_cmbDonem_DropDown'
+    # RadComboBox form alan adı ve client state alanı (HTTP motoru postback'i için)
+    SEMESTER_COMBOBOX_NAME = 'ctl00$ctl00$cphMain$cphContent$cmbDonem'
+    SEMESTER_COMBOBOX_CLIENT_STATE = 'ctl00_ctl00_cphMain_cphContent_cmbDonem_ClientState'
 
     # !--- Not Tablosu ---
     # .Tablonun ham ID'si (BeautifulSoup için)
     GRADES_TABLE_ID = "ctl00_ctl00_cphMain_cphContent_rgridOgrenciDersNot_ctl00"
     # Playwright için ID seçici (# ile başlar)
     GRADES_TABLE_SELECTOR = f'#{GRADES_TABLE_ID}'
+    # Dönem değiştirirken önceki dönemin (işaretlenmiş) tablosunu hariç tutan seçici
+    FRESH_GRADES_TABLE_SELECTOR = f'#{GRADES_TABLE_ID}:not([data-obis-stale])'
 
     # !--- Öğrenci Bilgileri Menüsü ---
     MENU_PROFILE = '.rtLI:has-text("Mezuniyet İşlemleri")'
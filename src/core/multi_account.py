@@ -0,0 +1,229 @@
+"""
+BU DOSYA: Tek bir makineden birden fazla öğrenci hesabını izleyen
+çoklu hesap zamanlayıcısını barındırır.
+
+Her hesabın kendi OBISNotifier örneği (kendi veri klasörü, hata sayacı ve
+bildirim alıcıları) vardır. Aynı anda en fazla `max_parallel` hesap kontrol
+edilir; her paralel slotun kendine ait bir tarayıcı havuzu bulunur.
+Sıradaki hesap her zaman "en uzun süredir bekleyen" hesaptır; yavaş bir
+hesap yalnızca kendi slotunu meşgul eder, diğerlerinin döngüsünü bekletmez.
+
+Yapılandırma: %LOCALAPPDATA%/OBISNotifier/accounts.json
+{
+    "max_parallel": 2,
+    "check_interval": 20,
+    "accounts": [
+        {"student_id": "221805001", "semester": "24/25 Bahar", "notification_recipients": ["a@b.com"]}
+    ]
+}
+Şifreler `keyring` kasasından (SessionManager ile aynı servis adı) okunur.
+"""
+
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import keyring
+
+from core.notifier import OBISNotifier
+from services.browser import get_navigation_profile
+from services.browser_pool import BrowserPool
+from services.engine_benchmark import resolve_browser_type
+from services.session import APP_NAME
+from services.storage import open_document
+from utils.system import get_user_data_dir
+
+ACCOUNTS_FILE = os.path.join(get_user_data_dir(), "accounts.json")
+SETTINGS_FILE = os.path.join(get_user_data_dir(), "settings.json")
+
+
+class AccountState:
+    """Tek bir hesabın zamanlayıcı içindeki durumu."""
+
+    def __init__(self, student_id: str, notifier: OBISNotifier):
+        self.student_id = student_id
+        self.notifier = notifier
+        self.enabled: bool = True
+        self.in_flight: bool = False
+        self.next_due: float = 0.0           # time.monotonic() cinsinden
+        self.run_count: int = 0
+        self.last_result: Optional[Dict[str, Any]] = None
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self.notifier.consecutive_failures
+
+
+def load_accounts_config(path: str = ACCOUNTS_FILE) -> Optional[Dict[str, Any]]:
+    """accounts.json dosyasını okur. Dosya yoksa veya bozuksa None döner."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not data.get("accounts"):
+            logging.error("accounts.json içinde hesap tanımı yok.")
+            return None
+        return data
+    except Exception as e:
+        logging.error(f"Hesap yapılandırması okunamadı: {e}")
+        return None
+
+
+class MultiAccountScheduler:
+    """Hesapların fetch -> parse -> karşılaştır -> bildir döngülerini sınırlı paralellikle yürütür."""
+
+    def __init__(self, accounts: List[Dict[str, Any]], base_settings: Dict[str, Any], max_parallel: int = 2):
+        self.max_parallel = max(1, max_parallel)
+        self.interval_seconds = int(base_settings.get("check_interval", 20)) * 60
+
+        # Her paralel slot kendi tarayıcı havuzunu (thread + tarayıcı süreci) taşır
+        browser_type = resolve_browser_type(base_settings.get("browser", "chromium"))
+        slow_mo = get_navigation_profile(base_settings.get("navigation_profile", "fast"))["slow_mo"]
+        self._pools: List[BrowserPool] = [
+            BrowserPool(browser_type=browser_type, headless=True, slow_mo=slow_mo)
+            for _ in range(self.max_parallel)
+        ]
+        self._free_pools: "queue.Queue[BrowserPool]" = queue.Queue()
+        for pool in self._pools:
+            self._free_pools.put(pool)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="OBISAccount")
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+        self.accounts: List[AccountState] = []
+        for account in accounts:
+            state = self._create_account(account, base_settings)
+            if state:
+                self.accounts.append(state)
+
+    def _create_account(self, account: Dict[str, Any], base_settings: Dict[str, Any]) -> Optional[AccountState]:
+        student_id = str(account.get("student_id", "")).strip()
+        if not student_id:
+            return None
+
+        try:
+            password = keyring.get_password(APP_NAME, student_id)
+        except Exception as e:
+            logging.error(f"[{student_id}] Kasa (Keyring) okuma hatası: {e}")
+            password = None
+        if not password:
+            logging.error(f"[{student_id}] Şifre kasada bulunamadı, hesap atlanıyor.")
+            return None
+
+        safe_id = re.sub(r"[^0-9A-Za-z_-]", "_", student_id)
+        settings = dict(base_settings)
+        settings.update(account)
+        settings["student_id"] = student_id
+        settings["obis_password"] = password
+        settings["data_dir"] = os.path.join(get_user_data_dir(), "accounts", safe_id)
+
+        # Havuz her çalıştırmada boş slottan atanır
+        notifier = OBISNotifier(settings, browser_pool=self._pools[0])
+        return AccountState(student_id, notifier)
+
+    # ================= ÇALIŞTIRMA =================
+
+    def _run_account(self, state: AccountState) -> None:
+        """Bir hesabın tek döngüsünü boş bir tarayıcı slotunda yürütür."""
+        pool = self._free_pools.get()
+        try:
+            state.notifier.browser_pool = pool
+            start = time.monotonic()
+            result = state.notifier.check_grades_once()
+            elapsed = time.monotonic() - start
+
+            state.last_result = result
+            logging.info(f"[{state.student_id}] Döngü tamamlandı ({elapsed:.1f} sn): {result.get('message', '')}")
+
+            if result.get("should_stop"):
+                state.enabled = False
+                logging.error(f"[{state.student_id}] Ardışık hatalar nedeniyle hesap devre dışı bırakıldı.")
+        except Exception as e:
+            logging.error(f"[{state.student_id}] Beklenmeyen hata: {e}")
+        finally:
+            self._free_pools.put(pool)
+            with self._lock:
+                state.run_count += 1
+                state.in_flight = False
+                state.next_due = time.monotonic() + self.interval_seconds
+            self._wakeup.set()
+
+    def _dispatch_due(self) -> int:
+        """Zamanı gelmiş hesapları en uzun bekleyenden başlayarak boş slotlara dağıtır."""
+        now = time.monotonic()
+        dispatched = 0
+        with self._lock:
+            in_flight = sum(1 for a in self.accounts if a.in_flight)
+            due = sorted(
+                (a for a in self.accounts if a.enabled and not a.in_flight and a.next_due <= now),
+                key=lambda a: a.next_due
+            )
+            for state in due[:max(0, self.max_parallel - in_flight)]:
+                state.in_flight = True
+                self._executor.submit(self._run_account, state)
+                dispatched += 1
+        return dispatched
+
+    def run_round(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Tüm aktif hesapları bir kez kontrol eder ve sonuçları döner (bloklar)."""
+        with self._lock:
+            targets = {s.student_id: s.run_count + 1 for s in self.accounts if s.enabled}
+            for state in self.accounts:
+                state.next_due = 0.0
+
+        while True:
+            self._dispatch_due()
+            with self._lock:
+                done = all(s.run_count >= targets[s.student_id] or (not s.enabled and not s.in_flight)
+                           for s in self.accounts if s.student_id in targets)
+            if done:
+                break
+            self._wakeup.wait(timeout=1.0)
+            self._wakeup.clear()
+
+        return {s.student_id: s.last_result for s in self.accounts}
+
+    def run_forever(self, stop_event: threading.Event) -> None:
+        """`stop_event` set edilene kadar hesapları kendi aralıklarıyla kontrol eder."""
+        logging.info(f"Çoklu hesap zamanlayıcısı başladı: {len(self.accounts)} hesap, {self.max_parallel} paralel slot.")
+        while not stop_event.is_set():
+            self._dispatch_due()
+            if not any(a.enabled for a in self.accounts):
+                logging.error("Aktif hesap kalmadı, zamanlayıcı durduruluyor.")
+                break
+            self._wakeup.wait(timeout=1.0)
+            self._wakeup.clear()
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Çalışan döngülerin bitmesini bekler ve tüm tarayıcı havuzlarını kapatır."""
+        self._executor.shutdown(wait=True)
+        for pool in self._pools:
+            pool.shutdown()
+        logging.info("Çoklu hesap zamanlayıcısı durduruldu.")
+
+
+def create_scheduler_from_files() -> Optional[MultiAccountScheduler]:
+    """settings.json (ortak ayarlar) + accounts.json ile zamanlayıcı oluşturur."""
+    config = load_accounts_config()
+    if not config:
+        return None
+
+    base_settings: Dict[str, Any] = open_document(SETTINGS_FILE).load() or {}
+
+    if "check_interval" in config:
+        base_settings["check_interval"] = config["check_interval"]
+
+    return MultiAccountScheduler(
+        accounts=config["accounts"],
+        base_settings=base_settings,
+        max_parallel=int(config.get("max_parallel", 2))
+    )
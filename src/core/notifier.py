@@ -10,41 +10,78 @@ kontrollü şekilde yönetilir.
 
 import logging
 import os
-from typing import Dict, Any, Optional, Callable
+import time
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from playwright.sync_api import BrowserContext
 
 # Servisler
-from services.browser import BrowserService
+from services.browser import BrowserService, get_navigation_profile
+from services.browser_pool import BrowserPool
+from services.engine_benchmark import resolve_browser_type
+from services.grade_history import GradeHistoryStore
+from services.grade_record import GradeRecord
 from services.grades import GradeService
+from services.http_fetch import HttpFetchService, HttpEngineUnavailable
 from services.notification import NotificationService
-from services.storage import GradeStorageService
+from services.request_filter import RequestFilter
+from services.session_state import SessionStateStore
+from services.trace_recorder import TraceRecorder
+from services.storage import GradeStorageService, create_grade_storage, semester_grades_path, migrate_legacy_grades_file
+from utils.date_utils import generate_semester_list
 from utils.system import get_user_data_dir
 
 
+# Ön ısıtma sonucunun kontrol döngüsünde geçerli sayılacağı en uzun süre
+PREWARM_MAX_AGE_SECONDS = 120
+
+
 class OBISNotifier:
     """
     Ana kontrol sınıfı. Servisleri başlatır ve tek bir kontrol döngüsünü yürütür.
     Facade Design Pattern benzeri bir yapı sunar.
     """
 
-    def __init__(self, settings: Dict[str, Any]) -> None:
+    def __init__(self, settings: Dict[str, Any], browser_pool: Optional[BrowserPool] = None) -> None:
+        """
+        Args:
+            settings: Ayarlar sözlüğü (settings.json + oturum bilgileri)
+            browser_pool: Dışarıdan paylaşılan tarayıcı havuzu. Verilmezse notifier kendi havuzunu açar.
+        """
         self.settings = settings
 
         # --- Ayarlar ---
         self.student_id: str = settings.get("student_id", "")
         self.password: str = settings.get("obis_password", "")
         self.semester: str = settings.get("semester", "")
-        self.browser_type: str = settings.get("browser", "chromium")
+        # İzlenen dönemler: ilk eleman her zaman aktif dönemdir. Ek dönemler aynı oturumda sırayla çekilir.
+        watched = settings.get("watched_semesters") or (generate_semester_list() if settings.get("watch_all_semesters") else [])
+        self.watched_semesters: List[str] = [self.semester] + [s for s in watched if s and s != self.semester]
+        # "auto": kayıtlı motor ölçümüne göre en hızlı motor
+        self.browser_type: str = resolve_browser_type(settings.get("browser", "chromium"))
+        self.navigation_profile: str = settings.get("navigation_profile", "fast")
+        # "browser": Yalnızca Playwright | "http": Önce tarayıcısız motor, gerekirse Playwright
+        self.fetch_engine: str = settings.get("fetch_engine", "browser")
         self.stop_on_failures: bool = True
+        # Süre bütçeleri: tek adım (Playwright zaman aşımı) ve tüm tarayıcı döngüsü (watchdog)
+        self.step_budget_s: float = float(settings.get("step_budget_s", 20))
+        self.cycle_budget_s: float = float(settings.get("cycle_budget_s", 120))
 
         # --- Callback (Dashboard Timeline) ---
         # timeline_callback(mesaj: str, tip: str) -> Dashboard timeline'a düşürülecek
         self.timeline_callback: Optional[Callable[[str, str], None]] = settings.get("timeline_callback", None)
 
+        # --- Hesaba özel veri dizini (çoklu hesap modunda her hesabın kendi klasörü vardır) ---
+        self.data_dir: str = settings.get("data_dir") or get_user_data_dir()
+        os.makedirs(self.data_dir, exist_ok=True)
+
         # --- Servislerin Başlatılması (Dependency Injection) ---
 
-        # 1. Dosya Kayıt Servisi
-        json_path = os.path.join(get_user_data_dir(), "grades_data.json")
-        self.storage_service = GradeStorageService(json_path)
+        # 1. Dosya Kayıt Servisi (her dönemin kendi dosyası vardır)
+        migrate_legacy_grades_file(self.data_dir, self.semester)
+        self._storage_services: Dict[str, GradeStorageService] = {}
+        self.storage_service = self._storage_for(self.semester)
 
         # 2. Bildirim Servisi
         sender_email = settings.get("sender_email", "")
@@ -62,28 +99,82 @@ class OBISNotifier:
             sender_email=sender_email,
             sender_password=gmail_password,
             notification_methods=settings.get("notification_methods", ["email"]),
-            timeline_callback=self.timeline_callback
+            timeline_callback=self.timeline_callback,
+            recipients=settings.get("notification_recipients")
         )
 
         # 3. Not İşleme Servisi
-        self.grade_service = GradeService()
+        self.grade_service = GradeService(settings.get("html_parser", "auto"))
 
-        # 4. Tarayıcı Servisi (Henüz başlatılmaz, ihtiyaç olunca açılır)
+        # 4. Tarayıcı Servisi (Havuzdan alınan context'e bağlanır)
+        self.request_filter = RequestFilter(
+            enabled=settings.get("block_resources", True),
+            blocked_types=settings.get("blocked_resource_types"),
+            allowlist=settings.get("resource_allowlist")
+        )
         self.browser_service = BrowserService(
             browser_type=self.browser_type,
-            headless=True
+            headless=True,
+            navigation_profile=self.navigation_profile,
+            request_filter=self.request_filter,
+            step_timeout_ms=int(self.step_budget_s * 1000)
         )
 
+        # 5. Tarayıcı Havuzu (Tarayıcı süreci döngüler arasında açık kalır)
+        self._owns_pool = browser_pool is None
+        self.browser_pool = browser_pool or BrowserPool(
+            browser_type=self.browser_type,
+            headless=True,
+            max_cycles=int(settings.get("browser_recycle_cycles", 50)),
+            max_rss_mb=int(settings.get("browser_max_rss_mb", 700)),
+            slow_mo=get_navigation_profile(self.navigation_profile)["slow_mo"]
+        )
+
+        # 6. Koşullu Playwright izi (yalnızca yavaş/başarısız döngüler diske yazılır)
+        self.trace_recorder = TraceRecorder(
+            trace_dir=settings.get("trace_dir") or os.path.join(self.data_dir, "traces"),
+            enabled=settings.get("trace_mode", False),
+            slow_threshold_s=float(settings.get("trace_slow_threshold_s", 20)),
+            max_total_mb=int(settings.get("trace_max_mb", 200))
+        )
+
+        # 7. Tarayıcı Oturum Deposu (Login adımını atlamak için şifreli çerezler)
+        self.session_state_store = SessionStateStore(self.data_dir)
+
+        # 8. Tarayıcısız HTTP Motoru (yalnızca fetch_engine="http" ise kullanılır)
+        self.http_service: Optional[HttpFetchService] = HttpFetchService() if self.fetch_engine == "http" else None
+
+        # 9. Not Değişikliği Geçmişi (yalnızca eklenen JSONL kaydı + zaman sorguları)
+        self.grade_history = GradeHistoryStore(self.data_dir, account=self.student_id)
+
         # Durum Takibi
         self.consecutive_failures: int = 0
         self.is_cancelled: bool = False
 
+        # Tablo parmak izi kısa devresi: tablo değişmediyse ayrıştırma/karşılaştırma/kayıt atlanır
+        self.fingerprint_checks: int = 0
+        self.fingerprint_hits: int = 0
+
+        # Ön ısıtma: ("session" | "login", time.monotonic()) — bir sonraki kontrolde tüketilir
+        self._prewarm_future: Optional[Future] = None
+        self._warm_state: Optional[Tuple[str, float]] = None
+
+    def _storage_for(self, semester: str) -> GradeStorageService:
+        """Döneme ait kayıt servisini döner (gerekirse oluşturur)."""
+        if semester not in self._storage_services:
+            self._storage_services[semester] = create_grade_storage(semester_grades_path(self.data_dir, semester))
+        return self._storage_services[semester]
+
     def cancel(self) -> None:
         """Devam etmekte olan asenkron kontrolleri anında iptal eder."""
         self.is_cancelled = True
         try:
-            if hasattr(self, 'browser_service') and self.browser_service:
-                self.browser_service.close_browser()
+            if getattr(self, '_prewarm_future', None):
+                self._prewarm_future.cancel()  # Henüz başlamadıysa kuyruktan düşer
+            if hasattr(self, 'http_service') and self.http_service:
+                self.http_service.close()
+            if getattr(self, '_owns_pool', False) and self.browser_pool:
+                self.browser_pool.shutdown()
         except Exception as e:
             logging.error(f"İptal işlemi sırasında hata: {e}")
 
@@ -95,10 +186,238 @@ class OBISNotifier:
             except Exception:
                 pass  # Sinyal bağlantısı kopmuş olabilir, sessizce geç
 
+    def _login_or_restore(self, saved_session: Optional[Dict[str, Any]]) -> bool:
+        """Kayıtlı oturumu doğrular, geçersizse tam giriş yapıp yeni oturumu kaydeder."""
+        warm_state, self._warm_state = self._warm_state, None
+        is_warm = warm_state is not None and time.monotonic() - warm_state[1] < PREWARM_MAX_AGE_SECONDS
+
+        if is_warm and warm_state[0] == "session":
+            # Ön ısıtma oturumu az önce doğruladı, tekrar istek atılmaz
+            logging.info("Ön ısıtılmış oturum kullanılıyor.")
+            return True
+
+        # Ön ısıtmada login formu açıldıysa oturum doğrulama istekleri atlanır
+        if not (is_warm and warm_state[0] == "login"):
+            # Paylaşılan havuzda canlı tutulan (önceden giriş yapılmış) sayfa varsa onu kullan
+            if self.browser_service.resume_session():
+                return True
+        else:
+            saved_session = None
+
+        if saved_session and self.browser_service.restore_session(saved_session["home_url"]):
+            return True
+
+        if not self.browser_service.login(self.student_id, self.password):
+            self.session_state_store.clear(self.student_id)
+            return False
+
+        exported = self.browser_service.export_session()
+        if exported:
+            self.session_state_store.save(self.student_id, exported["storage_state"], exported["home_url"])
+        return True
+
+    def prewarm(self) -> Optional[Future]:
+        """
+        Planlı kontrolden önce (havuz thread'inde) tarayıcıyı başlatır ve sayfayı hazırlar:
+        canlı/kayıtlı oturum geçerliyse doğrular, değilse login formunu açar.
+        Sistem durdurulursa `cancel()` kuyruktaki ön ısıtmayı iptal eder.
+        """
+        if self.http_service or self.is_cancelled:
+            return None
+        if self._prewarm_future and not self._prewarm_future.done():
+            return self._prewarm_future
+
+        saved_session = self.session_state_store.load(self.student_id)
+        self._prewarm_future = self.browser_pool.submit(
+            lambda context: self._run_prewarm(context, saved_session),
+            storage_state=saved_session["storage_state"] if saved_session else None,
+            session_key=self.student_id
+        )
+        return self._prewarm_future
+
+    def _run_prewarm(self, context: BrowserContext, saved_session: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Havuz thread'inde çalışır. Hazırlanan durumu ("session" | "login") döner."""
+        # Context kapanacaksa (canlı tutulmuyorsa) sayfa hazırlamak anlamsız; tarayıcı zaten başlatıldı
+        if self.is_cancelled or not self.browser_pool.keep_sessions:
+            return None
+
+        self.browser_service.attach_context(context)
+        try:
+            if self.browser_service.resume_session() or (
+                    saved_session and self.browser_service.restore_session(saved_session["home_url"])):
+                state = "session"
+            elif not self.is_cancelled and self.browser_service.open_login_page():
+                state = "login"
+            else:
+                return None
+
+            self._warm_state = (state, time.monotonic())
+            logging.info(f"Ön ısıtma tamamlandı ({state}): {self.browser_service.get_timing_report()}")
+            return state
+        finally:
+            self.browser_service.detach_context()
+
+    def _run_browser_steps(self,
+                           context: BrowserContext,
+                           saved_session: Optional[Dict[str, Any]] = None) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Havuz thread'inde çalışır: Giriş (veya kayıtlı oturum) -> Notlar sayfası -> Dönem tabloları.
+
+        Returns:
+            (giriş başarılı mı, {dönem: tablo satırları | None | Exception})
+        """
+        self.browser_service.attach_context(context)
+        tracing = self.trace_recorder.begin(context)
+        logged_in, results = False, {}
+        try:
+            if self._login_or_restore(saved_session):
+                logged_in = True
+                results = self.browser_service.fetch_semesters(self.watched_semesters)
+            return logged_in, results
+        finally:
+            if tracing:
+                # Yalnızca giriş veya aktif dönem hatası döngüyü başarısız sayar (iz saklanır);
+                # ek dönem hataları _compare_extra_semesters'ta loglanır
+                active_rows = results.get(self.semester)
+                failed = not logged_in or active_rows is None or isinstance(active_rows, Exception)
+                self.trace_recorder.finish(context, failed, label=self.student_id)
+            logging.info(f"Tarayıcı adım süreleri: {self.browser_service.get_timing_report()}")
+            logging.info(f"Ağ istekleri: {self.request_filter.get_report()}")
+            self.browser_service.detach_context()
+
+    def _fetch_grades_page(self) -> Tuple[bool, Dict[str, Any]]:
+        """
+        İzlenen dönemlerin not tablosu satırlarını seçili motorla, tek oturumda getirir.
+        HTTP motoru captcha/beklenmeyen sayfa görürse Playwright yoluna düşülür.
+
+        Returns:
+            (giriş başarılı mı, {dönem: tablo satırları | None | Exception})
+        """
+        if self.http_service:
+            try:
+                pages = self.http_service.fetch_semesters_html(self.student_id, self.password, self.watched_semesters)
+                if pages is None:
+                    return False, {}
+                return True, {
+                    semester: page if isinstance(page, Exception) else self.grade_service.extract_rows(page)
+                    for semester, page in pages.items()
+                }
+            except HttpEngineUnavailable as e:
+                logging.warning(f"HTTP motoru kullanılamadı, tarayıcıya geçiliyor: {e}")
+            except Exception as e:
+                logging.warning(f"HTTP motoru hatası, tarayıcıya geçiliyor: {e}")
+
+        saved_session = self.session_state_store.load(self.student_id)
+        # Takılan bir sayfa döngüyü (ve Dashboard'daki is_checking bayrağını) sınırsız tutamaz
+        return self.browser_pool.run_with_budget(
+            lambda context: self._run_browser_steps(context, saved_session),
+            cycle_budget_s=self.cycle_budget_s,
+            step_budget_s=self.step_budget_s,
+            current_step=self.browser_service.get_current_step,
+            storage_state=saved_session["storage_state"] if saved_session else None,
+            session_key=self.student_id
+        )
+
+    def _table_fingerprints(self, semester_rows: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """İzlenen her dönemin tablo parmak izini döner (tablo okunamadıysa None)."""
+        return {
+            semester: None if isinstance(rows, Exception) else self.grade_service.fingerprint_rows(rows)
+            for semester, rows in semester_rows.items()
+        }
+
+    def _is_table_unchanged(self, semester: str, fingerprints: Dict[str, Optional[str]]) -> bool:
+        """Dönemin tablosu son kayıttakiyle birebir aynıysa True döner."""
+        fingerprint = fingerprints.get(semester)
+        return fingerprint is not None and fingerprint == self._storage_for(semester).get_fingerprint()
+
+    def get_fingerprint_stats(self) -> Dict[str, Any]:
+        """Parmak izi kısa devresinin isabet istatistiğini döner."""
+        rate = self.fingerprint_hits / self.fingerprint_checks if self.fingerprint_checks else 0.0
+        return {"checks": self.fingerprint_checks, "hits": self.fingerprint_hits, "hit_rate": round(rate, 3)}
+
+    def get_snapshot_cache_stats(self) -> Dict[str, int]:
+        """Dönem kayıtlarının bellek önbelleği isabet/ıska sayıları (SQLite arka ucunda önbellek yoktur)."""
+        hits = sum(getattr(storage, "cache_hits", 0) for storage in self._storage_services.values())
+        misses = sum(getattr(storage, "cache_misses", 0) for storage in self._storage_services.values())
+        return {"hits": hits, "misses": misses}
+
+    def _record_fingerprint_check(self, hit: bool) -> None:
+        self.fingerprint_checks += 1
+        if hit:
+            self.fingerprint_hits += 1
+        stats = self.get_fingerprint_stats()
+        logging.info(f"Tablo parmak izi isabet oranı: {stats['hits']}/{stats['checks']} (%{stats['hit_rate'] * 100:.0f})")
+
+    def _compare_extra_semesters(self, semester_rows: Dict[str, Any],
+                                 fingerprints: Dict[str, Optional[str]]) -> Tuple[List[Dict[str, Any]], Dict[str, List[GradeRecord]]]:
+        """
+        Aktif dönem dışındaki izlenen dönemleri kendi kayıtlarıyla karşılaştırır.
+        Bu dönemlerdeki hatalar döngüyü bozmaz; yalnızca loglanır. Bir dönemin
+        ilk kaydı bildirim üretmez, karşılaştırma için temel olarak saklanır.
+        Tablosu son kayıttakiyle aynı olan dönem ayrıştırılmadan atlanır.
+
+        Returns:
+            (değişiklikler, {dönem: kaydedilecek notlar})
+        """
+        changes: List[Dict[str, Any]] = []
+        snapshots: Dict[str, List[GradeRecord]] = {}
+
+        for semester in self.watched_semesters[1:]:
+            rows = semester_rows.get(semester)
+            if isinstance(rows, Exception):
+                logging.warning(f"İzlenen dönem atlandı ({semester}): {rows}")
+                continue
+            if self._is_table_unchanged(semester, fingerprints):
+                continue
+
+            grades = self.grade_service.parse_grade_rows(rows)
+            if grades is None:
+                logging.warning(f"İzlenen dönem için not tablosu boş: {semester}")
+                continue
+
+            old_data = self._storage_for(semester).load_previous_grades()
+            snapshots[semester] = grades
+            if not old_data:
+                logging.info(f"'{semester}' dönemi için ilk kayıt oluşturuluyor (bildirim gönderilmez).")
+                # Bildirim yok, ancak geçmiş bu dönemin başlangıç halini bilmeli
+                baseline, _ = self.grade_service.compare_grades(None, grades, semester)
+                self._record_history(semester, baseline)
+                continue
+
+            self._seed_history(semester, old_data)
+            semester_changes, _ = self.grade_service.compare_grades(old_data, grades, semester)
+            for change in semester_changes:
+                change["donem"] = semester
+            changes.extend(semester_changes)
+
+        return changes, snapshots
+
+    def _seed_history(self, semester: str, old_data: Optional[Dict[str, Any]]) -> None:
+        """Dönemin geçmişi henüz yoksa kayıtlı son not listesini başlangıç hali olarak ekler."""
+        if not old_data or not old_data.get("grades"):
+            return
+        try:
+            added = self.grade_history.seed_snapshot(semester, old_data["grades"], old_data.get("timestamp"))
+            if added:
+                logging.info(f"Not geçmişi '{semester}' dönemi için kayıtlı notlardan başlatıldı ({added} ders).")
+        except Exception as e:
+            logging.error(f"Not geçmişi başlatılamadı ({semester}): {e}")
+
+    def _record_history(self, semester: str, changes: List[Dict[str, Any]]) -> None:
+        """Değişiklikleri dönemlerine göre geçmişe ekler; geçmiş hatası döngüyü bozmaz."""
+        by_semester: Dict[str, List[Dict[str, Any]]] = {}
+        for change in changes:
+            by_semester.setdefault(change.get("donem", semester), []).append(change)
+        for change_semester, semester_changes in by_semester.items():
+            try:
+                self.grade_history.record_changes(change_semester, semester_changes)
+            except Exception as e:
+                logging.error(f"Not geçmişi güncellenemedi ({change_semester}): {e}")
+
     def check_grades_once(self) -> Dict[str, Any]:
         """
         Tek bir kontrol döngüsünü yürütür:
-        Tarayıcı Aç -> Giriş -> Notları Al -> Kapat -> Karşılaştır -> Bildir
+        Context Aç -> Giriş -> Notları Al -> Context Kapat -> Karşılaştır -> Bildir
 
         Returns:
             Sonuç sözlüğü:
@@ -120,26 +439,48 @@ class OBISNotifier:
             if self.is_cancelled:
                 raise Exception("İşlem kullanıcı tarafından iptal edildi.")
 
-            # --- Adım 1: Tarayıcı İşlemleri ---
-            self.browser_service.start_browser()
+            # --- Adım 1: Sayfa Getirme (HTTP motoru veya havuzdaki tarayıcı) ---
+            logged_in, semester_rows = self._fetch_grades_page()
 
-            if self.browser_service.login(self.student_id, self.password):
+            if logged_in:
                 # Login başarılı — ama sayaç henüz sıfırlanmaz.
                 # Tüm süreç (navigasyon + parse + kayıt) başarılı tamamlanırsa sıfırlanır.
 
                 try:
-                    if not self.browser_service.navigate_to_grades(self.semester):
-                        raise Exception("Notlar sayfasına gidilemedi.")
-                        
-                    html_content = self.browser_service.get_page_content()
+                    grade_rows = semester_rows.get(self.semester)
+                    if isinstance(grade_rows, Exception):
+                        raise grade_rows
+
+                    # --- Kısa Devre: Tablolar son kayıttakiyle aynıysa işlenecek bir şey yok ---
+                    fingerprints = self._table_fingerprints(semester_rows)
+                    # Okunamayan (hata/boş tablo) ek dönemler kısa devreyi engellemez; bu dönemler
+                    # bu döngüde zaten işlenemez. Aktif dönemin tablosu her zaman eşleşmelidir.
+                    gated = [self.semester] + [s for s in self.watched_semesters[1:] if fingerprints.get(s) is not None]
+                    unchanged = all(self._is_table_unchanged(s, fingerprints) for s in gated)
+                    self._record_fingerprint_check(unchanged)
+                    if unchanged:
+                        self._emit_timeline("Kontrol tamamlandı, değişiklik yok.", "info")
+                        logging.info("Not tablosu değişmemiş (parmak izi eşleşti), işleme atlandı.")
+                        self.consecutive_failures = 0
+                        result["success"] = True
+                        result["message"] = "Değişiklik yok"
+                        return result
 
                     # --- Adım 2: Veri İşleme ---
-                    new_grades = self.grade_service.parse_grades(html_content)
+                    new_grades = self.grade_service.parse_grade_rows(grade_rows)
 
                     if new_grades is not None:
                         # --- Adım 3: Karşılaştırma ve Kayıt ---
                         old_data = self.storage_service.load_previous_grades()
-                        changes, status_msg = self.grade_service.compare_grades(old_data, new_grades)
+                        self._seed_history(self.semester, old_data)
+                        changes, status_msg = self.grade_service.compare_grades(old_data, new_grades, self.semester)
+                        for change in changes:
+                            change["donem"] = self.semester
+
+                        extra_changes, extra_snapshots = self._compare_extra_semesters(semester_rows, fingerprints)
+                        if extra_changes:
+                            changes.extend(extra_changes)
+                            status_msg = "Değişiklik bulundu"
 
                         if changes:
                             # --- Adım 4: Bildirim ---
@@ -159,7 +500,10 @@ class OBISNotifier:
                             self._emit_timeline("Kontrol tamamlandı, değişiklik yok.", "info")
                             logging.info("Herhangi bir değişiklik bulunamadı.")
 
-                        self.storage_service.save_grades(new_grades)
+                        self.storage_service.save_grades(new_grades, self.semester, fingerprints.get(self.semester))
+                        for semester, grades in extra_snapshots.items():
+                            self._storage_for(semester).save_grades(grades, semester, fingerprints.get(semester))
+                        self._record_history(self.semester, changes)
 
                         # Tüm döngü başarıyla tamamlandı — sayacı sıfırla
                         self.consecutive_failures = 0
@@ -233,10 +577,6 @@ class OBISNotifier:
 
             return result
 
-        finally:
-            # Kaynakları temizle
-            self.browser_service.close_browser()
-
     def send_test_notification(self) -> None:
         """Kullanıcı isteğiyle test bildirimi gönderir (Wrapper)."""
         self.notification_service.send_test_notification()
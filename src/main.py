@@ -9,6 +9,7 @@ sys.dont_write_bytecode = True  # __pycache__ klasörünü oluşturmaz
 import os
 import ctypes
 import logging
+import threading
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QFont, QIcon
 
@@ -16,6 +17,9 @@ from PyQt6.QtGui import QFont, QIcon
 from utils.logger_qt import qt_logger
 from ui.main_window import MainWindow
 from ui.styles.theme import OBISFonts
+from core.multi_account import create_scheduler_from_files
+from services.browser_broker import shutdown_browser_broker
+from services.system_check import cleanup_incomplete_browsers, ensure_browsers_installed
 
 # Playwright tarayıcı dosyalarının merkezi konumu.
 _playwright_dir = os.path.join(os.getenv('LOCALAPPDATA', ''), "OBISNotifier", "Playwright")
@@ -48,8 +52,35 @@ def setup_logging():
     # 2. Qt Signal Handler (UI için)
     logger.addHandler(qt_logger)
 
+def run_multi_account():
+    """
+    Arayüzsüz çoklu hesap modu (`python src/main.py --accounts`).
+    Hesaplar accounts.json dosyasından okunur, Ctrl+C ile durdurulur.
+    Arayüzdeki açılış kontrolü gibi önce Playwright tarayıcıları doğrulanır (eksikse kurulur).
+    """
+    if not ensure_browsers_installed():
+        cleanup_incomplete_browsers()
+        logging.error("Çoklu hesap modu başlatılamadı: tarayıcı bileşenleri kurulamadı.")
+        sys.exit(1)
+
+    scheduler = create_scheduler_from_files()
+    if not scheduler or not scheduler.accounts:
+        logging.error("Çoklu hesap modu başlatılamadı: accounts.json veya kasadaki şifreler eksik.")
+        sys.exit(1)
+
+    stop_event = threading.Event()
+    try:
+        scheduler.run_forever(stop_event)
+    except KeyboardInterrupt:
+        stop_event.set()
+        scheduler.shutdown()
+
 def main():
     setup_logging() # Logları başlat
+
+    if "--accounts" in sys.argv:
+        run_multi_account()
+        return
     
     # Windows Taskbar Icon Fix
     try:
@@ -97,6 +128,9 @@ def main():
         except Exception as e:
             logging.error(f"Kapanış temizliği hatası: {e}")
 
+        # Paylaşılan tarayıcıyı (broker) kapat
+        shutdown_browser_broker()
+
     app.aboutToQuit.connect(_cleanup)
     
     sys.exit(app.exec())
@@ -3,48 +3,206 @@ BU DOSYA: Playwright kütüphanesini kullanarak tarayıcı otomasyonu,
 login ve navigation işlemlerini yürütür.
 """
 
+import hashlib
+import io
 import logging
-import os
-from typing import Optional
-from playwright.sync_api import sync_playwright, Browser, Page, Playwright
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from config import OBISSelectors
+from services.request_filter import RequestFilter
+
+# Gezinme profilleri:
+# - fast: Yapay gecikme yok, yalnızca somut seçici/yanıt beklenir.
+# - humanlike: Eski davranış (slow_mo + sabit beklemeler + networkidle).
+NAVIGATION_PROFILES: Dict[str, Dict[str, int]] = {
+    "fast": {"slow_mo": 0, "think_time_ms": 0},
+    "humanlike": {"slow_mo": 500, "think_time_ms": 1000},
+}
+DEFAULT_NAVIGATION_PROFILE = "fast"
+
+# Mezuniyet PDF'inin indirilmesi için beklenecek en uzun süre (ms)
+PDF_DOWNLOAD_TIMEOUT_MS = 60000
+
+
+# Sayfa içinde çalışan çıkarım betikleri. Yalnızca gereken veri Playwright
+# hattından geçer; ViewState ve menüler Python tarafına taşınmaz.
+
+# Hücre metni BeautifulSoup `get_text(strip=True)` ile aynı kurala göre üretilir:
+# her metin düğümü kırpılıp boşluksuz birleştirilir.
+_JS_GRADE_ROWS = """
+(tableId) => {
+    const table = document.getElementById(tableId);
+    if (!table || !table.tBodies.length) return null;
+    const cellText = (cell) => {
+        const walker = document.createTreeWalker(cell, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        while (walker.nextNode()) parts.push(walker.currentNode.nodeValue.trim());
+        return parts.join("");
+    };
+    return Array.from(table.tBodies[0].rows, (row) => Array.from(row.cells, cellText));
+}
+"""
+
+_JS_SEMESTER_SELECTED = """
+([comboName, tableId, semester]) => {
+    const combo = document.getElementsByName(comboName)[0];
+    return !!combo && combo.value.includes(semester) && !!document.getElementById(tableId);
+}
+"""
+
+_JS_MARK_TABLE_STALE = """
+(tableId) => {
+    const table = document.getElementById(tableId);
+    if (table) table.setAttribute("data-obis-stale", "1");
+}
+"""
+
+_JS_LOGIN_MARKERS = """
+([selector, markers]) => {
+    const text = Array.from(document.querySelectorAll(selector), (el) => el.textContent).join("\\n");
+    return markers.every((marker) => text.includes(marker));
+}
+"""
+
+
+def get_navigation_profile(name: str) -> Dict[str, int]:
+    """Profil adına karşılık gelen ayarları döner (bilinmeyen ad -> fast)."""
+    return NAVIGATION_PROFILES.get(name, NAVIGATION_PROFILES[DEFAULT_NAVIGATION_PROFILE])
 
 
 class BrowserService:
     """Tarayıcı yaşam döngüsünü ve sayfa etkileşimlerini yönetir."""
 
-    def __init__(self, browser_type: str = "chromium", headless: bool = True):
+    def __init__(self, browser_type: str = "chromium", headless: bool = True,
+                 navigation_profile: str = DEFAULT_NAVIGATION_PROFILE,
+                 request_filter: Optional[RequestFilter] = None,
+                 step_timeout_ms: int = OBISSelectors.STEP_TIMEOUT_MS):
         self.browser_name = browser_type
         self.headless = headless
+        # Tek bir locator/navigasyon işleminin bekleyebileceği en uzun süre
+        self.step_timeout_ms = step_timeout_ms
+
+        # Gereksiz kaynak isteklerini engelleyen filtre (None ise filtre yok)
+        self.request_filter = request_filter
+
+        # Gezinme profili
+        self.profile_name = navigation_profile if navigation_profile in NAVIGATION_PROFILES else DEFAULT_NAVIGATION_PROFILE
+        self.profile = get_navigation_profile(self.profile_name)
+        self.is_fast = self.profile_name == "fast"
+
+        # Adım süreleri (saniye) — her döngüde sıfırlanır
+        self.step_timings: Dict[str, float] = {}
+        # O an yürüyen adım: (ad, time.monotonic() başlangıcı, süre bütçesi sn) — watchdog başka thread'den okur
+        self._current_step: Optional[Tuple[str, float, float]] = None
         
         # Playwright nesneleri
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
 
+    # ================= ZAMANLAMA =================
+
+    def _step_budget_ms(self, actions: int, extra_wait_ms: int = 0) -> int:
+        """
+        Adımın en kötü durumda sürebileceği toplam süre: her Playwright işlemi kendi zaman
+        aşımını (ve insan benzeri profilde slow_mo gecikmesini) doldurabilir; özel
+        beklemeler (giriş sonucu, postback, indirme) ve sabit bekleme bunun üzerine eklenir.
+        """
+        per_action_ms = self.step_timeout_ms + self.profile["slow_mo"]
+        return actions * per_action_ms + extra_wait_ms + self.profile["think_time_ms"]
+
+    @contextmanager
+    def _step(self, name: str, budget_ms: int) -> Iterator[None]:
+        """
+        Bir adımın süresini ölçer ve `step_timings` içine yazar.
+        `budget_ms` watchdog'un bu adıma tanıdığı süredir (bkz. _step_budget_ms).
+        """
+        start = time.perf_counter()
+        self._current_step = (name, time.monotonic(), budget_ms / 1000)
+        try:
+            yield
+        finally:
+            self._current_step = None
+            self.step_timings[name] = self.step_timings.get(name, 0.0) + (time.perf_counter() - start)
+
+    def get_current_step(self) -> Optional[Tuple[str, float, float]]:
+        """Yürüyen adımın adını, başlangıç zamanını ve süre bütçesini (sn) döner (adım yoksa None)."""
+        return self._current_step
+
+    def reset_timings(self) -> None:
+        self.step_timings = {}
+
+    def get_timing_report(self) -> str:
+        """Örn: 'fast | giris=1.42s, notlar=2.10s, toplam=3.52s'"""
+        parts = [f"{name}={elapsed:.2f}s" for name, elapsed in self.step_timings.items()]
+        total = sum(self.step_timings.values())
+        parts.append(f"toplam={total:.2f}s")
+        return f"{self.profile_name} | " + ", ".join(parts)
+
+    def _think(self) -> None:
+        """Yalnızca insan benzeri profilde sabit bekleme uygular."""
+        think_ms = self.profile["think_time_ms"]
+        if think_ms and self.page:
+            self.page.wait_for_timeout(think_ms)
+
+    def _settle(self) -> None:
+        """İnsan benzeri profilde ağın durulmasını bekler (fast profilde atlanır)."""
+        if not self.is_fast and self.page:
+            self.page.wait_for_load_state('networkidle')
+
+    def attach_context(self, context: BrowserContext) -> None:
+        """
+        Dışarıda (BrowserPool) yönetilen bir context'e bağlanır. Canlı tutulan
+        context'lerde mevcut sayfa yeniden kullanılır, yoksa yeni sayfa açılır.
+        Bu modda tarayıcının yaşam döngüsü havuza aittir.
+        """
+        self.context = context
+        self.context.set_default_timeout(self.step_timeout_ms)
+        self.context.set_default_navigation_timeout(self.step_timeout_ms)
+        self.page = context.pages[0] if context.pages else context.new_page()
+        self.reset_timings()
+        if self.request_filter:
+            self.request_filter.attach(self.page)
+
+    def detach_context(self) -> None:
+        """Havuzdan alınan context referanslarını bırakır (kapatma havuza aittir)."""
+        if self.request_filter and self.page:
+            self.request_filter.detach(self.page)
+        self.context = None
+        self.page = None
+
     def start_browser(self) -> None:
         """Playwright motorunu ve tarayıcıyı başlatır."""
         logging.info("Tarayıcı başlatılıyor...")
-        
-        self.playwright = sync_playwright().start()
-        
-        browsers = {
-            "chromium": self.playwright.chromium,
-            "firefox": self.playwright.firefox,
-            "webkit": self.playwright.webkit
-        }
-        
-        launcher = browsers.get(self.browser_name, self.playwright.chromium)
-        
-        # .Tarayıcıyı aç
-        self.browser = launcher.launch(
-            headless=self.headless,
-            slow_mo=500 # İnsan benzeri davranış için gecikme
-        )
-        
-        # Sayfa boyutlarını ayarla (Responsive tasarımlarda sorun olmaması için)
-        self.page = self.browser.new_page()
-        self.page.set_viewport_size({"width": 1280, "height": 720})
+        self.reset_timings()
+
+        with self._step("baslatma", self._step_budget_ms(3)):
+            self.playwright = sync_playwright().start()
+
+            browsers = {
+                "chromium": self.playwright.chromium,
+                "firefox": self.playwright.firefox,
+                "webkit": self.playwright.webkit
+            }
+
+            launcher = browsers.get(self.browser_name, self.playwright.chromium)
+
+            # .Tarayıcıyı aç (slow_mo yalnızca insan benzeri profilde > 0)
+            self.browser = launcher.launch(
+                headless=self.headless,
+                slow_mo=self.profile["slow_mo"]
+            )
+
+            # Sayfa boyutlarını ayarla (Responsive tasarımlarda sorun olmaması için)
+            self.page = self.browser.new_page()
+            self.page.set_viewport_size({"width": 1280, "height": 720})
+            self.page.set_default_timeout(self.step_timeout_ms)
+            if self.request_filter:
+                self.request_filter.attach(self.page)
 
     def close_browser(self) -> None:
         """Tarayıcıyı ve kaynakları temizler."""
@@ -55,6 +213,10 @@ class BrowserService:
                 self.playwright.stop()
         except Exception as e:
             logging.error(f"Tarayıcı kapatılırken hata: {e}")
+        finally:
+            self.browser = None
+            self.playwright = None
+            self.page = None
 
     def login(self, student_id: str, password: str) -> bool:
         """
@@ -71,24 +233,38 @@ class BrowserService:
 
         try:
             email = f"{student_id}@stu.adu.edu.tr"
-            
-            # Login sayfasına git
-            self.page.goto(OBISSelectors.OBIS_URL)
-            self.page.wait_for_load_state('networkidle')
 
-            # Selectors sınıfından seçicileri kullan
-            self.page.locator(OBISSelectors.LOGIN_USERNAME_INPUT).fill(email)
-            self.page.locator(OBISSelectors.LOGIN_PASSWORD_INPUT).fill(password)
-            
-            self.page.wait_for_timeout(1000)
+            # goto, networkidle, 2 x fill, click, networkidle, menü kontrolü + giriş sonucu beklemesi
+            with self._step("giris", self._step_budget_ms(7, OBISSelectors.LOGIN_RESULT_TIMEOUT_MS)):
+                # Login sayfasına git (fast: form DOM'a gelince devam edilir).
+                # Ön ısıtmada form zaten açılmışsa tekrar yüklenmez.
+                if not self._is_on_login_page():
+                    self.page.goto(OBISSelectors.OBIS_URL, wait_until='domcontentloaded' if self.is_fast else 'load')
+                self._settle()
 
-            # Giriş butonuna tıkla
-            self.page.locator(OBISSelectors.LOGIN_BUTTON).click()
+                # Selectors sınıfından seçicileri kullan
+                self.page.locator(OBISSelectors.LOGIN_USERNAME_INPUT).fill(email)
+                self.page.locator(OBISSelectors.LOGIN_PASSWORD_INPUT).fill(password)
 
-            self.page.wait_for_load_state('networkidle')
+                self._think()
+
+                # Giriş butonuna tıkla
+                self.page.locator(OBISSelectors.LOGIN_BUTTON).click()
+
+                if self.is_fast:
+                    # Başarılı girişte menü DOM'a gelir; gelmezse giriş başarısızdır
+                    try:
+                        self.page.locator(OBISSelectors.MENU_NOT_SINAV).first.wait_for(
+                            state='attached', timeout=OBISSelectors.LOGIN_RESULT_TIMEOUT_MS)
+                    except PlaywrightTimeoutError:
+                        pass
+                else:
+                    self.page.wait_for_load_state('networkidle')
+
+                success = self._check_login_success()
 
             # Başarılı olup olmadığını kontrol et
-            if self._check_login_success():
+            if success:
                 logging.info("Giriş başarılı!")
                 return True
             else:
@@ -99,50 +275,153 @@ class BrowserService:
             logging.error(f"Giriş sırasında hata: {str(e)}")
             return False
 
+    def _is_on_login_page(self) -> bool:
+        try:
+            return self.page is not None and self.page.locator(OBISSelectors.LOGIN_USERNAME_INPUT).count() > 0
+        except Exception:
+            return False
+
+    def open_login_page(self) -> bool:
+        """Login formunu önceden açar (ön ısıtma). Form DOM'a gelince döner."""
+        if not self.page:
+            return False
+        try:
+            with self._step("giris_sayfasi", self._step_budget_ms(2)):
+                self.page.goto(OBISSelectors.OBIS_URL, wait_until='domcontentloaded')
+                self.page.locator(OBISSelectors.LOGIN_USERNAME_INPUT).wait_for(state='attached')
+            return True
+        except Exception as e:
+            logging.warning(f"Login sayfası önceden açılamadı: {e}")
+            return False
+
+    def restore_session(self, home_url: str) -> bool:
+        """
+        Kayıtlı çerezlerle açılmış context'te oturumun hâlâ geçerli olup olmadığını
+        ana sayfaya tek bir istek atarak doğrular (login formu doldurulmaz).
+
+        Returns:
+            Oturum geçerli ise True.
+        """
+        if not self.page:
+            return False
+
+        try:
+            with self._step("oturum_dogrulama", self._step_budget_ms(2)):
+                self.page.goto(home_url, wait_until='domcontentloaded')
+                is_valid = self._check_login_success()
+            if is_valid:
+                logging.info("Kayıtlı oturum geçerli, giriş adımı atlandı.")
+                return True
+        except Exception as e:
+            logging.warning(f"Kayıtlı oturum doğrulanamadı: {e}")
+
+        logging.info("Kayıtlı oturumun süresi dolmuş, tam giriş yapılacak.")
+        return False
+
+    def resume_session(self) -> bool:
+        """
+        Canlı tutulan sayfa daha önce giriş yapmışsa, bulunduğu adrese tek istek
+        atarak oturumun hâlâ geçerli olduğunu doğrular.
+        """
+        if not self.page or not self.page.url.startswith("http"):
+            return False
+        return self.restore_session(self.page.url)
+
+    def export_session(self) -> Optional[Dict[str, Any]]:
+        """Giriş yapılmış context'in storage state'ini ve mevcut sayfa adresini döner."""
+        if not self.context or not self.page:
+            return None
+        try:
+            return {
+                "storage_state": self.context.storage_state(),
+                "home_url": self.page.url
+            }
+        except Exception as e:
+            logging.warning(f"Oturum bilgisi alınamadı: {e}")
+            return None
+
     def _check_login_success(self) -> bool:
-        """Sayfa içeriğinde başarı belirteçlerini arar."""
+        """Menü öğelerinde başarı belirteçlerini arar (tüm sayfa serileştirilmez)."""
         try:
             if not self.page: return False
-            content = self.page.content()
             # Başarılı girişte görünen menüler
-            return "Ders Kayıt İşlemleri" in content and "Not Sınav İşlemleri" in content and "Açık Rıza İşlemleri" in content
+            return bool(self.page.evaluate(
+                _JS_LOGIN_MARKERS,
+                [OBISSelectors.MENU_ITEM, list(OBISSelectors.LOGIN_SUCCESS_MARKERS)]
+            ))
         except Exception:
             return False
 
     def navigate_to_grades(self, semester: str) -> bool:
         """
         Notlar sayfasına gider ve ilgili dönemi seçer.
+        Yalnızca motor ölçümü (engine_benchmark) kullanır; not kontrolü tüm dönemleri
+        tek sayfada gezen fetch_semesters'ı kullanır.
         """
+        return self.open_grades_page() and self.select_semester(semester)
+
+    def open_grades_page(self) -> bool:
+        """Menüden 'Öğrenci Not Görüntüle' sayfasını açar."""
         logging.info("Notlar sayfasına gidiliyor...")
 
         if not self.page: return False
 
         try:
-            # 1. Menüleri aç
-            self.page.locator(OBISSelectors.MENU_NOT_SINAV).click()
-            self.page.locator(OBISSelectors.MENU_OGRENCI_NOT).click()
-            
-            # 2. Dönem Combobox'ını aç
-            self.page.locator(OBISSelectors.SEMESTER_COMBOBOX_ARROW).click()
-            
-            # 3. Dropdown görünürlüğünü bekle
-            dropdown_list = self.page.locator(OBISSelectors.SEMESTER_DROPDOWN_LIST)
-            dropdown_list.wait_for(state='visible')
+            with self._step("notlar", self._step_budget_ms(3)):
+                # 1. Menüleri aç
+                self.page.locator(OBISSelectors.MENU_NOT_SINAV).click()
+                self.page.locator(OBISSelectors.MENU_OGRENCI_NOT).click()
+                self.page.locator(OBISSelectors.SEMESTER_COMBOBOX_ARROW).wait_for(state='visible')
+            return True
 
-            # 4. Dönem metnine göre seç
-            semester_item = self.page.locator(f'li:has-text("{semester}")')
-            
-            if semester_item.count() == 0:
-                 error_msg = f"Seçilen dönem ({semester}) listede bulunamadı."
-                 logging.error(error_msg)
-                 raise ValueError(error_msg)
-            
-            semester_item.click()
-            
-            self.page.wait_for_load_state('networkidle')
-            
-            # 5. Tablonun yüklenmesini bekle
-            self.page.wait_for_selector(OBISSelectors.GRADES_TABLE_SELECTOR, state='visible')
+        except Exception as e:
+            logging.error(f"Notlar sayfasına geçişte hata: {str(e)}")
+            return False
+
+    def select_semester(self, semester: str) -> bool:
+        """
+        Açık olan notlar sayfasında dönem combobox'ından ilgili dönemi seçer
+        ve tablonun yenilenmesini bekler. Aynı oturumda art arda çağrılabilir.
+        """
+        if not self.page: return False
+
+        try:
+            # 2 x evaluate, açma tıklaması, liste beklemesi, sayım, seçim tıklaması,
+            # networkidle, tablo beklemesi + postback beklemesi
+            with self._step(f"donem:{semester}", self._step_budget_ms(8, OBISSelectors.POSTBACK_TIMEOUT_MS)):
+                # Dönem zaten seçiliyse ve tablo görünüyorsa postback'e gerek yok
+                if self.page.evaluate(_JS_SEMESTER_SELECTED,
+                                      [OBISSelectors.SEMESTER_COMBOBOX_NAME, OBISSelectors.GRADES_TABLE_ID, semester]):
+                    return True
+
+                # Önceki dönemin tablosu işaretlenir; yeni tablo gelene kadar beklenir
+                self.page.evaluate(_JS_MARK_TABLE_STALE, OBISSelectors.GRADES_TABLE_ID)
+
+                # 2. Dönem Combobox'ını aç
+                self.page.locator(OBISSelectors.SEMESTER_COMBOBOX_ARROW).click()
+
+                # 3. Dropdown görünürlüğünü bekle
+                dropdown_list = self.page.locator(OBISSelectors.SEMESTER_DROPDOWN_LIST)
+                dropdown_list.wait_for(state='visible')
+
+                # 4. Dönem metnine göre seç
+                semester_item = dropdown_list.locator(f'li:has-text("{semester}")')
+
+                if semester_item.count() == 0:
+                     error_msg = f"Seçilen dönem ({semester}) listede bulunamadı."
+                     logging.error(error_msg)
+                     # Açık kalan listeyi kapat (sonraki dönem seçimini engellemesin)
+                     self.page.keyboard.press("Escape")
+                     raise ValueError(error_msg)
+
+                if self.is_fast:
+                    self._click_and_wait_postback(semester_item.first)
+                else:
+                    semester_item.first.click()
+                    self.page.wait_for_load_state('networkidle')
+
+                # 5. Yeni tablonun yüklenmesini bekle
+                self.page.wait_for_selector(OBISSelectors.FRESH_GRADES_TABLE_SELECTOR, state='visible')
 
             return True
             
@@ -150,65 +429,110 @@ class BrowserService:
             # Dönem bulunamadı gibi yapısal hatalar üst katmana (notifier) iletilmeli
             raise
         except Exception as e:
-            logging.error(f"Notlar sayfasına geçişte hata: {str(e)}")
+            logging.error(f"Dönem seçiminde hata ({semester}): {str(e)}")
             return False
 
-    def get_page_content(self) -> str:
-        """Sayfanın o anki HTML içeriğini döner."""
-        if self.page:
-            return self.page.content()
-        return ""
+    def fetch_semesters(self, semesters: List[str]) -> Dict[str, Any]:
+        """
+        Aynı oturumda dönemleri sırayla seçip her birinin tablo satırlarını toplar.
 
-    def download_graduation_pdf(self) -> str:
+        Returns:
+            {dönem: satır listesi | None (tablo yok) | Exception (seçilemedi)}
         """
-        Mezuniyet sayfasına gider, PDF'i indirir ve dosya yolunu döner.
+        results: Dict[str, Any] = {}
+        if not self.open_grades_page():
+            error = Exception("Notlar sayfasına gidilemedi.")
+            return {semester: error for semester in semesters}
+
+        for semester in semesters:
+            try:
+                if self.select_semester(semester):
+                    results[semester] = self.extract_grade_rows()
+                else:
+                    results[semester] = Exception(f"Dönem seçilemedi: {semester}")
+            except Exception as e:
+                results[semester] = e
+        return results
+
+    def _click_and_wait_postback(self, locator) -> None:
+        """Tıklamanın tetiklediği ASP.NET postback (POST) yanıtını bekler."""
+        try:
+            with self.page.expect_response(lambda r: r.request.method == "POST",
+                                           timeout=OBISSelectors.POSTBACK_TIMEOUT_MS):
+                locator.click()
+        except PlaywrightTimeoutError:
+            # Postback yakalanamadıysa tablo seçicisi beklenerek devam edilir
+            logging.debug("Dönem seçimi sonrası postback yanıtı yakalanamadı.")
+
+    def extract_grade_rows(self) -> Optional[List[List[str]]]:
+        """
+        Not tablosu satırlarını sayfa içinde hücre metinlerine çevirip döner.
+
+        Returns:
+            Satır başına hücre metinleri listesi, tablo yoksa None.
+        """
+        if not self.page: return None
+        return self.page.evaluate(_JS_GRADE_ROWS, OBISSelectors.GRADES_TABLE_ID)
+
+    def download_graduation_pdf(self) -> Optional[Tuple[io.BytesIO, str]]:
+        """
+        Mezuniyet sayfasına gider, PDF'i indirir ve bellekte döner.
+        Sabit bir geçici dosya kullanılmadığı için eşzamanlı indirmeler çakışmaz.
+
+        Returns:
+            (PDF içeriği, SHA-256 özeti) veya hata durumunda None
         """
         logging.info("Mezuniyet sayfasına gidiliyor...")
-        if not self.page: return ""
+        if not self.page: return None
 
         try:
-            # 1. Menüleri aç
-            self.page.locator(OBISSelectors.MENU_PROFILE).click()
-            self.page.locator(OBISSelectors.MENU_PROFILE_INFO).click()
-            
-            # 2. Sayfanın yüklenmesini bekle
-            self.page.wait_for_load_state('networkidle')
+            # 2 x menü tıklaması, networkidle, 2 x tıklama, 2 x bekleme + indirme beklemesi
+            with self._step("pdf", self._step_budget_ms(7, PDF_DOWNLOAD_TIMEOUT_MS)):
+                # 1. Menüleri aç
+                self.page.locator(OBISSelectors.MENU_PROFILE).click()
+                self.page.locator(OBISSelectors.MENU_PROFILE_INFO).click()
 
-            # 2. İndirme menüsünü açacak butona tıkla
-            download_button = self.page.locator(OBISSelectors.PROFILE_DOWNLOAD_BUTTON)
-            download_button.click()
+                # 2. Sayfanın yüklenmesini bekle (fast: rapor görüntüleyici butonu beklenir)
+                self._settle()
 
-            # 3. Menünün açılması için kısa bir süre bekle
-            download_menu = self.page.locator(OBISSelectors.PROFILE_DOWNLOAD_MENU)
-            download_menu.wait_for(state='visible')
+                # 2. İndirme menüsünü açacak butona tıkla
+                download_button = self.page.locator(OBISSelectors.PROFILE_DOWNLOAD_BUTTON)
+                download_button.click()
 
-            # 4. PDF butonuna tıkla
-            pdf_button = self.page.locator(OBISSelectors.PROFILE_DOWNLOAD_PDF_OPTION)
-            self.page.wait_for_timeout(1000)
+                # 3. Menünün açılmasını bekle
+                download_menu = self.page.locator(OBISSelectors.PROFILE_DOWNLOAD_MENU)
+                download_menu.wait_for(state='visible')
 
-            # 3."PDF" yazan seçeneğe tıkla ve indirmeyi bekle
-            with self.page.expect_download(timeout=60000) as download_info:
-                pdf_button.click(force=True)
-                logging.info("PDF indiriliyor...")
-            
-            download = download_info.value
-            
-            # 4. İndirmenin bitmesini kesin olarak bekle
-            download_error = download.failure()
+                # 4. PDF butonuna tıkla
+                pdf_button = self.page.locator(OBISSelectors.PROFILE_DOWNLOAD_PDF_OPTION)
+                if self.is_fast:
+                    pdf_button.wait_for(state='visible')
+                else:
+                    self._think()
+
+                # 3."PDF" yazan seçeneğe tıkla ve indirme olayını bekle
+                with self.page.expect_download(timeout=PDF_DOWNLOAD_TIMEOUT_MS) as download_info:
+                    pdf_button.click(force=True)
+                    logging.info("PDF indiriliyor...")
+
+                download = download_info.value
+
+                # 4. İndirmenin bitmesini kesin olarak bekle
+                download_error = download.failure()
             if download_error:
                 logging.error(f"İndirme işlemi başarısız: {download_error}")
-                return ""
+                return None
 
-            # KRİTİK ÇÖZÜM: Çalışma dizini yerine AppData içine kaydet
-            appdata_dir = os.path.join(os.getenv('LOCALAPPDATA'), 'OBISNotifier')
-            os.makedirs(appdata_dir, exist_ok=True) # Klasör yoksa oluştur
-            
-            # Geçici dosyayı AppData içine kaydet (CWD System32 olabilir)
-            temp_path = os.path.join(appdata_dir, "temp_mezuniyet.pdf")
-            download.save_as(temp_path)
-            
-            return temp_path
+            # Playwright indirmeyi context'e ait artefakt dosyasında tutar (context kapanınca silinir).
+            # İçerik doğrudan belleğe alınır; ek bir kopya diske yazılmaz.
+            with open(download.path(), 'rb') as f:
+                content = f.read()
+            if not content:
+                logging.error("İndirilen PDF boş.")
+                return None
+
+            return io.BytesIO(content), hashlib.sha256(content).hexdigest()
             
         except Exception as e:
             logging.error(f"PDF indirme hatası: {str(e)}")
-            return ""
\ No newline at end of file
+            return None
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+BU DOSYA: Uygulama genelinde paylaşılan tek tarayıcı aracısını (broker) barındırır.
+LoginWorker, ProfileUpdateWorker ve not kontrolü (OBISNotifier) aynı tarayıcı
+havuzunu kullanır. Girişte açılan context öğrenci numarasıyla canlı tutulur;
+ilk not kontrolü ve profil yenileme bu oturumu tekrar giriş yapmadan kullanır.
+İşler havuz thread'inde yürütülür ve Qt tarafına Future olarak döner.
+"""
+
+import io
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from typing import Optional, Tuple
+
+from playwright.sync_api import BrowserContext
+
+from services.browser import BrowserService, DEFAULT_NAVIGATION_PROFILE, get_navigation_profile
+from services.browser_pool import BrowserPool
+from services.engine_benchmark import resolve_browser_type
+from services.storage import open_document
+from utils.system import get_user_data_dir
+
+SETTINGS_FILE = os.path.join(get_user_data_dir(), "settings.json")
+
+
+class BrowserBroker:
+    """Paylaşılan tarayıcı havuzu üzerinde giriş ve PDF indirme işlerini yürütür."""
+
+    def __init__(self, browser_type: str = "chromium", navigation_profile: str = DEFAULT_NAVIGATION_PROFILE):
+        self.browser_type = browser_type
+        self.navigation_profile = navigation_profile
+        self.pool = BrowserPool(
+            browser_type=browser_type,
+            headless=True,
+            slow_mo=get_navigation_profile(navigation_profile)["slow_mo"],
+            keep_sessions=True
+        )
+
+    def _service(self) -> BrowserService:
+        return BrowserService(browser_type=self.browser_type, headless=True,
+                              navigation_profile=self.navigation_profile)
+
+    @staticmethod
+    def _ensure_login(service: BrowserService, student_id: str, password: str) -> bool:
+        """Canlı oturum geçerliyse onu kullanır, değilse tam giriş yapar."""
+        return service.resume_session() or service.login(student_id, password)
+
+    # ================= İŞLER =================
+
+    def login(self, student_id: str, password: str) -> "Future[bool]":
+        """Giriş yapar; başarılı oturum sonraki işler için canlı tutulur."""
+        def job(context: BrowserContext) -> bool:
+            service = self._service()
+            service.attach_context(context)
+            try:
+                return self._ensure_login(service, student_id, password)
+            finally:
+                service.detach_context()
+
+        return self.pool.submit(job, session_key=student_id)
+
+    def download_graduation_pdf(self, student_id: str,
+                                password: str) -> "Future[Tuple[bool, Optional[Tuple[io.BytesIO, str]]]]":
+        """
+        Canlı oturumla (gerekirse giriş yaparak) mezuniyet PDF'ini indirir.
+
+        Future sonucu:
+            (giriş başarılı mı, (PDF içeriği, SHA-256) veya None)
+        """
+        def job(context: BrowserContext) -> Tuple[bool, Optional[Tuple[io.BytesIO, str]]]:
+            service = self._service()
+            service.attach_context(context)
+            try:
+                if not self._ensure_login(service, student_id, password):
+                    return False, None
+                return True, service.download_graduation_pdf()
+            finally:
+                service.detach_context()
+
+        return self.pool.submit(job, session_key=student_id)
+
+    def release_session(self, student_id: str) -> "Future[None]":
+        """Öğrencinin canlı tutulan oturumunu kapatır (çıkış yapıldığında)."""
+        return self.pool.release_session(student_id)
+
+    def shutdown(self) -> None:
+        self.pool.shutdown()
+
+
+# ================= PAYLAŞILAN ÖRNEK =================
+
+_broker: Optional[BrowserBroker] = None
+_broker_lock = threading.Lock()
+
+
+def get_browser_broker(browser_type: Optional[str] = None,
+                       navigation_profile: Optional[str] = None) -> BrowserBroker:
+    """
+    Paylaşılan broker'ı döner. Verilen tarayıcı/profil mevcut broker'dan farklıysa
+    (kullanıcı ayarı değiştirdiyse) eski broker kapatılıp yenisi oluşturulur.
+    "auto" tarayıcı değeri kayıtlı motor ölçümüne göre çözülür.
+    """
+    global _broker
+    if browser_type:
+        browser_type = resolve_browser_type(browser_type)
+    with _broker_lock:
+        if _broker is not None:
+            changed = ((browser_type and browser_type != _broker.browser_type) or
+                       (navigation_profile and navigation_profile != _broker.navigation_profile))
+            if not changed:
+                return _broker
+            logging.info("Tarayıcı ayarları değişti, paylaşılan tarayıcı yeniden başlatılacak.")
+            _broker.shutdown()
+
+        _broker = BrowserBroker(browser_type or "chromium", navigation_profile or DEFAULT_NAVIGATION_PROFILE)
+        return _broker
+
+
+def get_configured_browser_broker() -> BrowserBroker:
+    """
+    Paylaşılan broker'ı kayıtlı tarayıcı/profil ayarlarıyla döner. Giriş ve profil yenileme
+    dashboard ile aynı ayarları kullanır; böylece broker yeniden kurulup oturum kaybolmaz.
+    """
+    settings = open_document(SETTINGS_FILE).load() or {}
+    return get_browser_broker(settings.get("browser", "chromium"),
+                              settings.get("navigation_profile", DEFAULT_NAVIGATION_PROFILE))
+
+
+def get_existing_browser_broker() -> Optional[BrowserBroker]:
+    """Paylaşılan broker henüz oluşturulmadıysa None döner (yeni tarayıcı başlatılmaz)."""
+    with _broker_lock:
+        return _broker
+
+
+def shutdown_browser_broker() -> None:
+    """Uygulama kapanırken paylaşılan tarayıcıyı kapatır."""
+    global _broker
+    with _broker_lock:
+        if _broker is not None:
+            _broker.shutdown()
+            _broker = None
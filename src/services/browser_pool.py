@@ -0,0 +1,401 @@
+"""
+BU DOSYA: Uzun ömürlü Playwright tarayıcı havuzunu yönetir.
+Tarayıcı süreci kontrol döngüleri arasında açık tutulur; her döngü için
+temiz bir BrowserContext açılıp kapatılır. Playwright Sync API thread'e bağlı
+olduğundan tüm tarayıcı çağrıları havuzun kendi thread'i üzerinde yürütülür.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional, Set, Tuple, TypeVar
+
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Playwright
+
+# psutil opsiyoneldir; yoksa RSS tabanlı geri dönüşüm devre dışı kalır
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+T = TypeVar("T")
+
+# Aynı anda başlayan havuzların driver süreçlerini karıştırmamak için
+_LAUNCH_LOCK = threading.Lock()
+
+# Watchdog'un işi yoklama aralığı ve adım bütçesine eklenen pay (saniye).
+# Pay sayesinde tek bir işlemde takılan adımı önce Playwright'ın kendi zaman aşımı keser.
+WATCHDOG_POLL_S = 0.5
+WATCHDOG_GRACE_S = 5.0
+# Süreç ağacı sonlandırıldıktan sonra işin çözülmesi için beklenecek süre
+WATCHDOG_KILL_WAIT_S = 10.0
+
+
+class BudgetExceeded(TimeoutError):
+    """İş, adım veya döngü süre bütçesini aştığı için watchdog tarafından kesildi."""
+
+    def __init__(self, message: str, step: Optional[str] = None, killed: bool = True):
+        super().__init__(message)
+        self.step = step
+        # False: tarayıcı süreçleri sonlandırılamadı, havuz thread'i hâlâ takılı işi bekliyor
+        self.killed = killed
+
+
+class BrowserPool:
+    """
+    Tek bir tarayıcı sürecini canlı tutar ve işleri sırayla kendi thread'inde çalıştırır.
+
+    - Her iş için yeni (izole) bir BrowserContext açılır.
+    - Tarayıcı çökmüşse bir sonraki işte otomatik olarak yeniden başlatılır.
+    - `max_cycles` döngü sonra veya süreç ağacı `max_rss_mb` sınırını aşınca tarayıcı geri dönüştürülür.
+    - `keep_sessions` açıksa `session_key` verilen işlerin context'i kapatılmaz; aynı anahtarlı
+      sonraki işler giriş yapılmış aynı context'i (ve sayfasını) kullanır.
+    """
+
+    def __init__(self,
+                 browser_type: str = "chromium",
+                 headless: bool = True,
+                 max_cycles: int = 50,
+                 max_rss_mb: int = 700,
+                 slow_mo: int = 0,
+                 keep_sessions: bool = False,
+                 context_setup: Optional[Callable[[BrowserContext], None]] = None):
+        self.browser_name = browser_type
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.max_cycles = max_cycles
+        self.max_rss_mb = max_rss_mb
+        self.keep_sessions = keep_sessions
+        # Her yeni context açıldığında çağrılır (örn. HAR kayıt/tekrar oynatma)
+        self.context_setup = context_setup
+
+        # Playwright nesneleri (yalnızca havuz thread'inden erişilir)
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self._driver_pid: Optional[int] = None
+        # session_key -> canlı tutulan context (yalnızca keep_sessions=True)
+        self._sessions: Dict[str, BrowserContext] = {}
+
+        # İstatistikler
+        self.cycle_count: int = 0   # Mevcut tarayıcı ile tamamlanan döngü sayısı
+        self.launch_count: int = 0  # Toplam başlatma sayısı
+
+        self._jobs: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        # Watchdog'un sonlandıramadığı (thread'i hâlâ bloke eden) iş; bitene kadar havuz kullanılamaz
+        self._stuck_job: Optional[Future] = None
+
+    # ================= DIŞ API =================
+
+    def submit(self,
+               fn: Callable[[BrowserContext], T],
+               storage_state: Optional[Dict[str, Any]] = None,
+               session_key: Optional[str] = None) -> "Future[T]":
+        """
+        İşi kuyruğa ekler ve sonucunu taşıyan Future döner.
+
+        Args:
+            fn: Havuz thread'inde context ile çağrılacak fonksiyon
+            storage_state: Context'e yüklenecek Playwright storage state (çerezler)
+            session_key: Canlı tutulacak context anahtarı (keep_sessions kapalıysa yok sayılır)
+        """
+        return self._enqueue(("context", fn, storage_state, session_key))
+
+    def run_in_context(self,
+                       fn: Callable[[BrowserContext], T],
+                       storage_state: Optional[Dict[str, Any]] = None,
+                       timeout: Optional[float] = None,
+                       session_key: Optional[str] = None) -> T:
+        """İşi havuz thread'inde (temiz veya canlı tutulan) bir context ile çalıştırır ve sonucu bekler."""
+        return self.submit(fn, storage_state, session_key).result(timeout=timeout)
+
+    def run_with_budget(self,
+                        fn: Callable[[BrowserContext], T],
+                        cycle_budget_s: float,
+                        step_budget_s: Optional[float] = None,
+                        current_step: Optional[Callable[[], Optional[Tuple[str, float, Optional[float]]]]] = None,
+                        storage_state: Optional[Dict[str, Any]] = None,
+                        session_key: Optional[str] = None) -> T:
+        """
+        İşi çalıştırır ve watchdog ile izler. İş (kuyrukta beklediği süre hariç) `cycle_budget_s`,
+        yürüyen adımı kendi bütçesini (yoksa `step_budget_s`) aşarsa tarayıcı süreç ağacı
+        sonlandırılır ve hangi adımın takıldığını taşıyan BudgetExceeded fırlatılır.
+
+        Süreçler sonlandırılamazsa (psutil yok vb.) havuz thread'i takılı kalır; BudgetExceeded
+        `killed=False` ile fırlatılır ve iş kendiliğinden bitene kadar yeni işler reddedilir.
+
+        Args:
+            current_step: Yürüyen adımı (ad, time.monotonic() başlangıcı, bütçe sn | None) olarak döndüren çağrı
+        """
+        future = self.submit(fn, storage_state, session_key)
+        started: Optional[float] = None
+        while True:
+            try:
+                return future.result(timeout=WATCHDOG_POLL_S)
+            except FutureTimeoutError:
+                pass
+
+            now = time.monotonic()
+            if started is None:
+                if not future.running():
+                    continue  # Henüz kuyrukta; bütçe iş başlayınca işler
+                started = now
+
+            step = current_step() if current_step else None
+            step_name = step[0] if step else None
+            step_limit = (step[2] or step_budget_s) if step else None
+            if now - started > cycle_budget_s:
+                reason = f"Döngü süre bütçesi ({cycle_budget_s:.0f} sn) aşıldı"
+                if step_name:
+                    reason += f", takılan adım: '{step_name}'"
+            elif step_limit and now - step[1] > step_limit + WATCHDOG_GRACE_S:
+                reason = f"'{step_name}' adımı süre bütçesini ({step_limit:.0f} sn) aştı"
+            else:
+                continue
+
+            logging.error(f"Watchdog: {reason}. Tarayıcı süreçleri sonlandırılıyor.")
+            if not self.kill_browser():
+                with self._lock:
+                    self._stuck_job = future
+                raise BudgetExceeded(f"{reason}; tarayıcı sonlandırılamadı, iş bitene kadar havuz kullanılamaz.",
+                                     step_name, killed=False)
+            try:
+                future.result(timeout=WATCHDOG_KILL_WAIT_S)
+            except Exception:
+                pass
+            raise BudgetExceeded(f"{reason}; tarayıcı yeniden başlatılacak.", step_name)
+
+    def is_stuck(self) -> bool:
+        """Watchdog'un sonlandıramadığı bir iş havuz thread'ini hâlâ bloke ediyorsa True."""
+        with self._lock:
+            return self._stuck_job is not None and not self._stuck_job.done()
+
+    def warm_up(self) -> "Future[None]":
+        """Tarayıcıyı (gerekirse) iş beklemeden başlatır; başlatma hatası Future'a yansır."""
+        return self._enqueue(("call", self._ensure_browser, None, None))
+
+    def release_session(self, session_key: str) -> "Future[None]":
+        """Canlı tutulan context'i kapatır (örn. çıkış yapıldığında)."""
+        return self._enqueue(("call", lambda: self._close_session(session_key), None, None))
+
+    def _enqueue(self, job: tuple) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                future.set_exception(RuntimeError("Tarayıcı havuzu kapatıldı."))
+                return future
+            if self._stuck_job is not None:
+                if not self._stuck_job.done():
+                    future.set_exception(BudgetExceeded("Tarayıcı havuzu takılı bir işin bitmesini bekliyor.",
+                                                        killed=False))
+                    return future
+                self._stuck_job = None
+            self._ensure_thread()
+            self._jobs.put(job + (future,))
+        return future
+
+    def shutdown(self) -> None:
+        """Havuzu kapatır. Devam eden iş bitince tarayıcı ve Playwright durdurulur."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._thread and self._thread.is_alive():
+                self._jobs.put(None)
+
+    # ================= HAVUZ THREAD'İ =================
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._worker_loop, name="OBISBrowserPool", daemon=True)
+            self._thread.start()
+
+    def _worker_loop(self) -> None:
+        """Kuyruktaki işleri sırayla yürütür. `None` gelince havuzu kapatır."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+
+            kind, fn, storage_state, session_key, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                if kind == "call":
+                    result = fn()
+                else:
+                    result = self._run_job(fn, storage_state, session_key)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        self._teardown()
+
+    def _run_job(self,
+                 fn: Callable[[BrowserContext], Any],
+                 storage_state: Optional[Dict[str, Any]],
+                 session_key: Optional[str] = None) -> Any:
+        """Sağlıklı bir tarayıcı garanti eder, context açar (veya canlı olanı alır) ve işi çalıştırır."""
+        self._ensure_browser()
+
+        keep = self.keep_sessions and session_key is not None
+        context = self._sessions.get(session_key) if keep else None
+        is_new = context is None
+        if is_new:
+            context = self.browser.new_context(
+                viewport={"width": 1280, "height": 720},
+                storage_state=storage_state
+            )
+            if keep:
+                self._sessions[session_key] = context
+        try:
+            if is_new and self.context_setup:
+                self.context_setup(context)
+            return fn(context)
+        finally:
+            if not keep:
+                try:
+                    context.close()
+                except Exception as e:
+                    logging.warning(f"BrowserContext kapatılamadı: {e}")
+
+            self.cycle_count += 1
+
+            # Döngü sırasında tarayıcı çöktüyse bir sonraki işte yeniden başlatılır
+            if not self._is_healthy():
+                logging.warning("Tarayıcı bağlantısı koptu, bir sonraki döngüde yeniden başlatılacak.")
+                self._teardown()
+
+    # ================= YAŞAM DÖNGÜSÜ =================
+
+    def _ensure_browser(self) -> None:
+        """Gerekirse tarayıcıyı başlatır, yeniden başlatır veya geri dönüştürür."""
+        if self.browser is not None:
+            if not self._is_healthy():
+                logging.warning("Tarayıcı yanıt vermiyor, yeniden başlatılıyor...")
+                self._teardown()
+            elif self.cycle_count >= self.max_cycles:
+                logging.info(f"Tarayıcı {self.cycle_count} döngü sonra geri dönüştürülüyor.")
+                self._teardown()
+            else:
+                rss_mb = self.get_rss_mb()
+                if rss_mb is not None and rss_mb > self.max_rss_mb:
+                    logging.info(f"Tarayıcı bellek sınırını aştı ({rss_mb:.0f} MB), geri dönüştürülüyor.")
+                    self._teardown()
+
+        if self.browser is None:
+            self._launch()
+
+    def _launch(self) -> None:
+        logging.info("Tarayıcı başlatılıyor (havuz)...")
+
+        with _LAUNCH_LOCK:
+            before = self._child_pids()
+            self.playwright = sync_playwright().start()
+            new_pids = self._child_pids() - before
+            self._driver_pid = next(iter(new_pids)) if len(new_pids) == 1 else None
+
+        browsers = {
+            "chromium": self.playwright.chromium,
+            "firefox": self.playwright.firefox,
+            "webkit": self.playwright.webkit
+        }
+        launcher = browsers.get(self.browser_name, self.playwright.chromium)
+
+        try:
+            self.browser = launcher.launch(headless=self.headless, slow_mo=self.slow_mo)
+        except Exception:
+            self._teardown()
+            raise
+
+        self.cycle_count = 0
+        self.launch_count += 1
+
+    def _close_session(self, session_key: str) -> None:
+        context = self._sessions.pop(session_key, None)
+        if context is not None:
+            try:
+                context.close()
+            except Exception as e:
+                logging.warning(f"Canlı tutulan context kapatılamadı: {e}")
+
+    def _teardown(self) -> None:
+        """Tarayıcıyı ve Playwright motorunu hata yutarak kapatır."""
+        # Context'ler tarayıcıyla birlikte kapanır
+        self._sessions.clear()
+        try:
+            if self.browser:
+                self.browser.close()
+        except Exception as e:
+            logging.error(f"Tarayıcı kapatılırken hata: {e}")
+        try:
+            if self.playwright:
+                self.playwright.stop()
+        except Exception as e:
+            logging.error(f"Playwright durdurulurken hata: {e}")
+
+        self.browser = None
+        self.playwright = None
+        self._driver_pid = None
+
+    def _is_healthy(self) -> bool:
+        try:
+            return self.browser is not None and self.browser.is_connected()
+        except Exception:
+            return False
+
+    def kill_browser(self) -> bool:
+        """
+        Takılan tarayıcının süreç ağacını (driver hariç) sonlandırır. Herhangi bir thread'den
+        çağrılabilir; bekleyen Playwright çağrıları hata ile döner ve havuz sonraki işte
+        tarayıcıyı yeniden başlatır.
+        """
+        if psutil is None or self._driver_pid is None:
+            logging.warning("Tarayıcı süreçleri sonlandırılamadı (psutil yok veya driver süreci bilinmiyor).")
+            return False
+        try:
+            procs = psutil.Process(self._driver_pid).children(recursive=True)
+        except psutil.Error as e:
+            logging.warning(f"Tarayıcı süreçleri listelenemedi: {e}")
+            return False
+
+        for proc in procs:
+            try:
+                proc.kill()
+            except psutil.Error:
+                pass
+        psutil.wait_procs(procs, timeout=5)
+        return True
+
+    # ================= KAYNAK ÖLÇÜMÜ =================
+
+    @staticmethod
+    def _child_pids() -> Set[int]:
+        if psutil is None:
+            return set()
+        try:
+            return {p.pid for p in psutil.Process().children()}
+        except Exception:
+            return set()
+
+    def get_rss_mb(self) -> Optional[float]:
+        """Playwright driver'ı ve tarayıcı süreç ağacının toplam RSS değerini (MB) döner."""
+        if psutil is None or self._driver_pid is None:
+            return None
+        try:
+            root = psutil.Process(self._driver_pid)
+            total = root.memory_info().rss
+            for child in root.children(recursive=True):
+                try:
+                    total += child.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+            return total / (1024 * 1024)
+        except Exception:
+            return None
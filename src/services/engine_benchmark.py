@@ -0,0 +1,195 @@
+"""
+BU DOSYA: Kurulu tarayıcı motorlarını (Chromium, Firefox) bu makinede ölçen
+ve "auto" tarayıcı ayarı için en hızlı çalışan motoru seçen servisi barındırır.
+
+Her motor için ölçülenler:
+    - launch_s : Playwright + tarayıcı sürecinin başlatılma süresi
+    - cycle_s  : Giriş + notlar akışının ortalama süresi (kimlik bilgisi yoksa
+                 bellek içi temsili not sayfası üzerinde tablo çıkarımı)
+    - peak_rss_mb : Döngüler sürerken arka planda örneklenen driver ve tarayıcı süreç
+                    ağacının en yüksek RSS değeri (psutil varsa)
+
+Akış:
+    - Uygulama (Ayarlar > Otomatik) ölçümü giriş yapmış kullanıcının bilgileriyle
+      gerçek OBIS akışı üzerinde yapar (rapordaki "flow": "obis").
+    - benchmarks/engine_benchmark.py aynı akışı taklit OBIS sunucusuna karşı çalıştırır.
+    - Temsili sayfa ("flow": "stand-in") yalnızca kimlik bilgisi yokken kullanılır. Ağ
+      süresi iki motor için aynıdır; motorlar arasındaki fark başlatma, context/sayfa açma,
+      DOM oluşturma ve sayfa içi tablo çıkarımında oluşur ve temsili sayfa (40 satırlı
+      not tablosu) bu adımların hepsinden geçer. Giriş formu ve dönem
+      postback'i ölçülmez; bu nedenle sıralama için yeterli, mutlak süre için değildir.
+
+Sonuçlar %LOCALAPPDATA%/OBISNotifier/engine_benchmark.json dosyasında saklanır.
+"""
+
+import datetime
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from playwright.sync_api import BrowserContext
+
+from config import OBISSelectors
+from services.browser import BrowserService
+from services.browser_pool import BrowserPool
+from services.request_filter import RequestFilter
+from services.storage import atomic_write_json
+from utils.date_utils import get_current_semester
+from utils.system import get_user_data_dir
+
+AUTO_ENGINE = "auto"
+SUPPORTED_ENGINES = ("chromium", "firefox")
+DEFAULT_ENGINE = "chromium"
+
+ENGINE_BENCHMARK_FILE = os.path.join(get_user_data_dir(), "engine_benchmark.json")
+# Ölçüm döngüleri sürerken süreç ağacı RSS'inin örneklenme aralığı (saniye)
+RSS_SAMPLE_INTERVAL_S = 0.05
+
+# Kimlik bilgisi verilmediğinde kullanılan temsili not sayfası (ağa çıkılmaz; bkz. dosya başlığı "Akış")
+_STAND_IN_ROW = "<tr><td>{code}</td><td>Ders {i}</td><td>Vize : 55 Final : 70</td><td>BB</td><td>Geçti</td></tr>"
+_STAND_IN_PAGE = (
+    "<html><body><table id=\"" + OBISSelectors.GRADES_TABLE_ID + "\"><tbody>"
+    + "".join(_STAND_IN_ROW.format(code=f"BİL{100 + i}", i=i) for i in range(40))
+    + "</tbody></table></body></html>"
+)
+
+
+class _PeakRssSampler:
+    """Ölçüm döngüleri sürerken havuzun süreç ağacı RSS'ini arka planda örnekler, en yüksek değeri tutar."""
+
+    def __init__(self, pool: BrowserPool, interval_s: float = RSS_SAMPLE_INTERVAL_S):
+        self._pool = pool
+        self._interval_s = interval_s
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="PeakRssSampler", daemon=True)
+        self.peak_mb: Optional[float] = None
+
+    def _sample(self) -> None:
+        rss_mb = self._pool.get_rss_mb()
+        if rss_mb is not None and (self.peak_mb is None or rss_mb > self.peak_mb):
+            self.peak_mb = rss_mb
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._sample()
+            self._stop.wait(self._interval_s)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Optional[float]:
+        """Örneklemeyi durdurur ve ölçülen en yüksek RSS değerini (MB) döner."""
+        self._stop.set()
+        self._thread.join()
+        return self.peak_mb
+
+
+def _run_cycle(context: BrowserContext, engine: str,
+               student_id: Optional[str], password: Optional[str]) -> None:
+    """Havuz thread'inde tek ölçüm döngüsünü yürütür."""
+    service = BrowserService(browser_type=engine, headless=True, request_filter=RequestFilter())
+    service.attach_context(context)
+    try:
+        if student_id and password:
+            if not service.login(student_id, password):
+                raise RuntimeError("Giriş başarısız.")
+            if not service.navigate_to_grades(get_current_semester()):
+                raise RuntimeError("Notlar sayfası açılamadı.")
+            service.extract_grade_rows()
+        else:
+            service.page.set_content(_STAND_IN_PAGE)
+            if not service.extract_grade_rows():
+                raise RuntimeError("Temsili not tablosu okunamadı.")
+    finally:
+        service.detach_context()
+
+
+def benchmark_engine(engine: str, student_id: Optional[str] = None, password: Optional[str] = None,
+                     cycles: int = 2) -> Dict[str, Any]:
+    """
+    Tek bir motoru ölçer. Motor kurulu değilse veya akış başarısızsa
+    {"ok": False, "error": ...} döner.
+    """
+    logging.info(f"Tarayıcı motoru ölçülüyor: {engine}")
+    pool = BrowserPool(browser_type=engine, headless=True)
+    try:
+        start = time.perf_counter()
+        pool.warm_up().result()
+        launch_s = time.perf_counter() - start
+
+        durations: List[float] = []
+        sampler = _PeakRssSampler(pool)
+        sampler.start()
+        try:
+            for _ in range(max(1, cycles)):
+                start = time.perf_counter()
+                pool.run_in_context(lambda context: _run_cycle(context, engine, student_id, password))
+                durations.append(time.perf_counter() - start)
+        finally:
+            peak_rss_mb = sampler.stop()
+
+        return {
+            "ok": True,
+            "launch_s": round(launch_s, 3),
+            "cycle_s": round(statistics.mean(durations), 3),
+            "peak_rss_mb": round(peak_rss_mb, 1) if peak_rss_mb is not None else None,
+            "flow": "obis" if student_id and password else "stand-in",
+        }
+    except Exception as e:
+        logging.warning(f"{engine} ölçülemedi: {e}")
+        return {"ok": False, "error": (str(e).splitlines() or [type(e).__name__])[0]}
+    finally:
+        pool.shutdown()
+
+
+def pick_fastest(results: Dict[str, Dict[str, Any]]) -> Optional[str]:
+    """Çalışan motorlar arasından döngü süresi (eşitlikte başlatma süresi) en düşük olanı seçer."""
+    working = [(r["cycle_s"], r["launch_s"], engine) for engine, r in results.items() if r.get("ok")]
+    return min(working)[2] if working else None
+
+
+def benchmark_engines(student_id: Optional[str] = None, password: Optional[str] = None,
+                      engines: Iterable[str] = SUPPORTED_ENGINES, cycles: int = 2,
+                      path: str = ENGINE_BENCHMARK_FILE) -> Dict[str, Any]:
+    """Tüm motorları sırayla ölçer, en hızlısını seçer ve sonucu dosyaya kaydeder."""
+    results = {engine: benchmark_engine(engine, student_id, password, cycles) for engine in engines}
+    report = {
+        "measured_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "results": results,
+        "best": pick_fastest(results),
+    }
+    try:
+        atomic_write_json(path, report, indent=4)
+    except OSError as e:
+        logging.error(f"Motor ölçüm sonuçları kaydedilemedi: {e}")
+
+    logging.info(f"Motor ölçümü tamamlandı. En hızlı motor: {report['best'] or '-'}")
+    return report
+
+
+def load_engine_benchmark(path: str = ENGINE_BENCHMARK_FILE) -> Optional[Dict[str, Any]]:
+    """Kayıtlı ölçüm raporunu okur. Dosya yoksa veya bozuksa None döner."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Motor ölçüm sonuçları okunamadı: {e}")
+        return None
+
+
+def resolve_browser_type(browser: Optional[str], path: str = ENGINE_BENCHMARK_FILE) -> str:
+    """
+    Ayardaki tarayıcı değerini gerçek motor adına çevirir.
+    "auto" için kayıtlı ölçümün en hızlı motoru, ölçüm yoksa varsayılan motor kullanılır.
+    """
+    if browser != AUTO_ENGINE:
+        return browser or DEFAULT_ENGINE
+    report = load_engine_benchmark(path)
+    best = report.get("best") if report else None
+    return best if best in SUPPORTED_ENGINES else DEFAULT_ENGINE
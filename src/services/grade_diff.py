@@ -0,0 +1,187 @@
+"""
+BU DOSYA: Eski ve yeni not listeleri arasındaki farkları alan düzeyinde bulan
+karşılaştırma (diff) motorunu barındırır.
+
+"Sınavlar" metni ("Vize : 55 Final : 70 Bütünleme : -") sınav bileşenlerine
+ayrılır ve her fark türü belirli bir olay (GradeEvent) olarak raporlanır:
+    - exam_posted / exam_changed / exam_removed : Tek bir sınav notu açıklandı / değişti / kaldırıldı
+    - exams_changed   : Sınavlar metni bileşenlerine ayrılamadı, metin bütün olarak değişti
+    - letter_assigned / letter_changed : Harf notu verildi / değişti
+    - result_changed  : Sonuç (Geçti/Kaldı vb.) değişti
+    - course_added / course_removed : Ders listeye eklendi / listeden çıktı
+
+Ders anahtarına (GradeRecord.key) göre dizinlenmiş GradeIndex bir sonraki karşılaştırmada yeniden
+kullanılır; satırı değişmeyen derslerin sınav metni tekrar ayrıştırılmaz.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from services.grade_record import GradeRecord
+
+# Olay türleri
+COURSE_ADDED = "course_added"
+COURSE_REMOVED = "course_removed"
+EXAM_POSTED = "exam_posted"
+EXAM_CHANGED = "exam_changed"
+EXAM_REMOVED = "exam_removed"
+EXAMS_CHANGED = "exams_changed"
+LETTER_ASSIGNED = "letter_assigned"
+LETTER_CHANGED = "letter_changed"
+RESULT_CHANGED = "result_changed"
+
+# "Vize : 55 Final : 70" -> ("Vize", "55"), ("Final", "70")
+# Not boşsa ("Vize : Final : 70") bir sonraki sınavın adı not sanılmaz
+_EXAM_RE = re.compile(r"(?P<name>[^\W\d_][^:]*?)\s*:(?:\s*(?P<score>[^\s:]+)(?![^\s:]|\s*:))?")
+
+# OBIS'te henüz girilmemiş değerler
+_BLANK_VALUES = frozenset({"", "-"})
+
+
+def _is_blank(value: Optional[str]) -> bool:
+    return value is None or value.strip() in _BLANK_VALUES
+
+
+def parse_exams(text: str) -> Optional[Dict[str, str]]:
+    """
+    Sınavlar metnini {sınav adı: not} sözlüğüne ayırır (boş not "" olur).
+    Metin boş değilse ama hiçbir bileşen bulunamazsa None döner. Bileşenlerin
+    dışında kalan metin varsa ("Vize : 55Final : 70" gibi bitişik hücreler)
+    ayrıştırma belirsizdir ve yine None döner; çağıran metni bütün olarak karşılaştırır.
+    """
+    text = text or ""
+    exams: Dict[str, str] = {}
+    position = 0
+    for match in _EXAM_RE.finditer(text):
+        if text[position:match.start()].strip():
+            return None
+        exams[" ".join(match.group("name").split())] = match.group("score") or ""
+        position = match.end()
+    if text[position:].strip() and exams:
+        return None
+    if not exams and not _is_blank(text):
+        return None
+    return exams
+
+
+@dataclass(frozen=True)
+class GradeEvent:
+    """Tek bir ders üzerindeki tek bir alan değişikliği."""
+    kind: str
+    course: str
+    field: Optional[str] = None   # Sınav adı (yalnızca sınav olaylarında)
+    old: Optional[str] = None
+    new: Optional[str] = None
+
+    def describe(self) -> str:
+        """Bildirim ve timeline için kısa Türkçe açıklama."""
+        if self.kind == EXAM_POSTED:
+            return f"{self.field} notu açıklandı: {self.new}"
+        if self.kind == EXAM_CHANGED:
+            return f"{self.field} notu değişti: {self.old} → {self.new}"
+        if self.kind == EXAM_REMOVED:
+            return f"{self.field} notu kaldırıldı (eski: {self.old})"
+        if self.kind == EXAMS_CHANGED:
+            return f"Sınavlar değişti: {self.old or '-'} → {self.new or '-'}"
+        if self.kind == LETTER_ASSIGNED:
+            return f"Harf notu verildi: {self.new}"
+        if self.kind == LETTER_CHANGED:
+            return f"Harf notu değişti: {self.old} → {self.new}"
+        if self.kind == RESULT_CHANGED:
+            return f"Sonuç değişti: {self.old or '-'} → {self.new or '-'}"
+        if self.kind == COURSE_REMOVED:
+            return "Ders listeden kaldırıldı"
+        return "Yeni ders"
+
+
+# (kayıt, ayrıştırılmış sınavlar)
+IndexEntry = Tuple[GradeRecord, Optional[Dict[str, str]]]
+
+
+class GradeIndex:
+    """Not listesinin ders anahtarına göre dizinlenmiş, sınavları ayrıştırılmış hali."""
+
+    def __init__(self, grades: List[GradeRecord], previous: Optional["GradeIndex"] = None):
+        self.grades = grades
+        self.entries: Dict[str, IndexEntry] = {}
+
+        reusable = previous.entries if previous else {}
+        for record in grades:
+            cached = reusable.get(record.key)
+            if cached is not None and cached[0] == record:
+                self.entries[record.key] = cached
+            else:
+                self.entries[record.key] = (record, parse_exams(record.exams))
+
+
+def _diff_exams(course: str, old: GradeRecord, new: GradeRecord,
+                old_parsed: Optional[Dict[str, str]], new_parsed: Optional[Dict[str, str]]) -> List[GradeEvent]:
+    if old.exams == new.exams:
+        return []
+    if old_parsed is None or new_parsed is None:
+        return [GradeEvent(EXAMS_CHANGED, course, old=old.exams, new=new.exams)]
+
+    events: List[GradeEvent] = []
+    for exam, score in new_parsed.items():
+        old_score = old_parsed.get(exam)
+        if score == old_score or (_is_blank(score) and _is_blank(old_score)):
+            continue
+        if _is_blank(old_score):
+            events.append(GradeEvent(EXAM_POSTED, course, exam, old_score, score))
+        elif _is_blank(score):
+            events.append(GradeEvent(EXAM_REMOVED, course, exam, old_score, score))
+        else:
+            events.append(GradeEvent(EXAM_CHANGED, course, exam, old_score, score))
+    for exam, old_score in old_parsed.items():
+        if exam not in new_parsed and not _is_blank(old_score):
+            events.append(GradeEvent(EXAM_REMOVED, course, exam, old_score, None))
+    return events
+
+
+def diff_course(old_entry: IndexEntry, new_entry: IndexEntry) -> List[GradeEvent]:
+    """Aynı dersin iki sürümü arasındaki alan değişikliklerini döner."""
+    (old, old_parsed), (new, new_parsed) = old_entry, new_entry
+    if old is new or old == new:
+        return []
+
+    course = new.course
+    events = _diff_exams(course, old, new, old_parsed, new_parsed)
+
+    old_letter, new_letter = old.letter, new.letter
+    if old_letter != new_letter and not (_is_blank(old_letter) and _is_blank(new_letter)):
+        kind = LETTER_ASSIGNED if _is_blank(old_letter) else LETTER_CHANGED
+        events.append(GradeEvent(kind, course, old=old_letter, new=new_letter))
+
+    old_result, new_result = old.result, new.result
+    if old_result != new_result and not (_is_blank(old_result) and _is_blank(new_result)):
+        events.append(GradeEvent(RESULT_CHANGED, course, old=old_result, new=new_result))
+
+    return events
+
+
+def diff_indexes(old_index: GradeIndex, new_index: GradeIndex) -> List[Tuple[Optional[GradeRecord], Optional[GradeRecord], List[GradeEvent]]]:
+    """
+    İki dizini karşılaştırır.
+
+    Returns:
+        [(eski kayıt, yeni kayıt, olaylar)] — yeni listedeki sırayla, ardından listeden çıkan dersler
+    """
+    result: List[Tuple[Optional[GradeRecord], Optional[GradeRecord], List[GradeEvent]]] = []
+    old_entries = old_index.entries
+
+    for key, new_entry in new_index.entries.items():
+        old_entry = old_entries.get(key)
+        new = new_entry[0]
+        if old_entry is None:
+            result.append((None, new, [GradeEvent(COURSE_ADDED, new.course)]))
+            continue
+        events = diff_course(old_entry, new_entry)
+        if events:
+            result.append((old_entry[0], new, events))
+
+    for key, (old, _) in old_entries.items():
+        if key not in new_index.entries:
+            result.append((old, None, [GradeEvent(COURSE_REMOVED, old.course)]))
+
+    return result
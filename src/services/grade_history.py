@@ -0,0 +1,286 @@
+"""
+BU DOSYA: Not değişikliklerinin yalnızca eklenen (append-only) geçmiş kaydını ve
+bu kayıt üzerindeki zaman sorgularını barındırır.
+
+Her gerçek değişiklik (ders eklendi, sınav notu açıklandı, harf notu verildi vb.)
+<data_dir>/grade_history.jsonl dosyasına tek satır olarak eklenir; dosya hiçbir
+zaman yeniden yazılmaz. Dosya ilk erişimde bir kez okunur ve bellek içi dizin
+(dönem + ders anahtarı -> zaman sıralı kayıtlar) kurulur; sorgular dosyayı
+taramaz, dizin üzerinde bisect ile çalışır:
+    - when_posted("Matematik I", "Final")  -> Final notunun açıklandığı zaman
+    - changes_between("24/25 Güz", since)  -> Dönemdeki tüm değişiklikler
+    - snapshot_at("24/25 Güz", T)          -> T anındaki not listesi
+"""
+
+import json
+import logging
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from services.grade_diff import COURSE_ADDED, GradeEvent, parse_exams
+from services.grade_record import GradeRecord, course_key
+
+GRADE_HISTORY_FILE = "grade_history.jsonl"
+
+TimePoint = Union[datetime, str]
+
+
+def _iso(when: TimePoint) -> str:
+    """Zaman noktasını saniye hassasiyetli ISO metnine çevirir (ISO olmayan metin aynen döner)."""
+    if isinstance(when, str):
+        try:
+            when = datetime.fromisoformat(when)
+        except ValueError:
+            return when
+    return when.isoformat(timespec="seconds")
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryEntry:
+    """Bir dersin bir andaki değişikliği ve değişiklik sonrası hali (ders kaldırıldıysa record None)."""
+    timestamp: str
+    semester: str
+    account: str
+    key: str
+    course: str
+    record: Optional[GradeRecord]
+    events: Tuple[GradeEvent, ...]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "ts": self.timestamp,
+            "semester": self.semester,
+            "account": self.account,
+            "course": self.course,
+            "record": self.record.to_dict() if self.record else None,
+            "events": [[e.kind, e.field, e.old, e.new] for e in self.events]
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "HistoryEntry":
+        course = data["course"]
+        record = GradeRecord.from_dict(data["record"]) if data.get("record") else None
+        return cls(
+            timestamp=data["ts"],
+            semester=data.get("semester", ""),
+            account=data.get("account", ""),
+            key=record.key if record else course_key(course),
+            course=record.course if record else course,
+            record=record,
+            events=tuple(GradeEvent(kind, course, field, old, new) for kind, field, old, new in data.get("events", []))
+        )
+
+
+class _Timeline:
+    """Zaman sıralı kayıt listesi ve bisect için paralel zaman damgası listesi."""
+    __slots__ = ("entries", "stamps")
+
+    def __init__(self) -> None:
+        self.entries: List[HistoryEntry] = []
+        self.stamps: List[str] = []
+
+    def add(self, entry: HistoryEntry) -> None:
+        """Kaydı zaman sırasına ekler; aynı zamanlı kayıtlar eklenme sırasını korur."""
+        if not self.stamps or self.stamps[-1] <= entry.timestamp:
+            self.entries.append(entry)
+            self.stamps.append(entry.timestamp)
+            return
+        # Başlangıç hali (seed) veya dosyada sırası bozuk satır: araya yerleştirilir
+        index = bisect_right(self.stamps, entry.timestamp)
+        self.entries.insert(index, entry)
+        self.stamps.insert(index, entry.timestamp)
+
+    def last_at(self, when: str) -> Optional[HistoryEntry]:
+        """`when` anında (dahil) geçerli olan son kayıt."""
+        index = bisect_right(self.stamps, when)
+        return self.entries[index - 1] if index else None
+
+    def between(self, since: Optional[str], until: Optional[str]) -> List[HistoryEntry]:
+        start = bisect_left(self.stamps, since) if since else 0
+        end = bisect_right(self.stamps, until) if until else len(self.stamps)
+        return self.entries[start:end]
+
+
+class GradeHistoryStore:
+    """Hesabın not değişikliği geçmişini JSONL dosyasında tutar ve sorgular."""
+
+    def __init__(self, data_dir: str, account: str = ""):
+        self.file_path = os.path.join(data_dir, GRADE_HISTORY_FILE)
+        self.account = account
+        self._lock = threading.Lock()
+        self._loaded = False
+        # dönem -> ders anahtarı -> dersin zaman çizelgesi
+        self._by_course: Dict[str, Dict[str, _Timeline]] = {}
+        # dönem -> dönemin tüm değişiklikleri
+        self._by_semester: Dict[str, _Timeline] = {}
+        self._last_timestamp = ""
+
+    # ================= YAZMA =================
+
+    def record_changes(self, semester: str, changes: List[Dict[str, Any]],
+                       when: Optional[TimePoint] = None) -> int:
+        """
+        compare_grades() değişikliklerini geçmişe ekler. Dersin geçmişteki son
+        hali zaten aynıysa (örn. kaydedilemeyen bir döngünün tekrarı) kayıt eklenmez.
+
+        Returns:
+            Eklenen kayıt sayısı
+        """
+        if not changes:
+            return 0
+
+        with self._lock:
+            self._ensure_loaded()
+            return self._append(semester, changes, when, monotonic=True)
+
+    def seed_snapshot(self, semester: str, grades: List[GradeRecord],
+                      when: Optional[TimePoint] = None) -> int:
+        """
+        Dönemin geçmişi boşsa kayıtlı not listesini (geçmiş tutulmadan önce oluşmuş
+        son kayıt) başlangıç hali olarak ekler; böylece snapshot_at ilk değişiklikten
+        önceki anlar için de tam liste döner. Geçmişi olan dönemde hiçbir şey yapmaz.
+        Kayıt, diğer dönemlerin geçmişinden eski olsa bile kendi zamanıyla eklenir.
+
+        Returns:
+            Eklenen kayıt sayısı
+        """
+        if not grades:
+            return 0
+
+        with self._lock:
+            self._ensure_loaded()
+            if semester in self._by_semester:
+                return 0
+            baseline = [
+                {"ders": record.course, "yeni": record, "olaylar": [GradeEvent(COURSE_ADDED, record.course)]}
+                for record in grades
+            ]
+            return self._append(semester, baseline, when, monotonic=False)
+
+    def _append(self, semester: str, changes: List[Dict[str, Any]], when: Optional[TimePoint],
+                monotonic: bool) -> int:
+        """
+        Değişiklikleri dosyaya ekler ve dizinler (kilit altında çağrılır). Canlı
+        değişikliklerde (monotonic) saat geri alınsa bile zaman son kayıttan geriye gitmez.
+        """
+        timestamp = _iso(when or datetime.now())
+        if monotonic:
+            timestamp = max(timestamp, self._last_timestamp)
+
+        new_entries: List[HistoryEntry] = []
+        for change in changes:
+            record: Optional[GradeRecord] = change.get("yeni")
+            course = change["ders"]
+            key = record.key if record else course_key(course)
+            timeline = self._by_course.get(semester, {}).get(key)
+            previous = timeline.entries[-1].record if timeline else None
+            if timeline and previous == record:
+                continue
+            new_entries.append(HistoryEntry(timestamp, semester, self.account, key, course, record,
+                                            tuple(change.get("olaylar", ()))))
+
+        if not new_entries:
+            return 0
+        try:
+            prefix = "\n" if self._has_partial_line() else ""
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(prefix + "".join(json.dumps(e.to_json(), ensure_ascii=False) + "\n" for e in new_entries))
+        except OSError as e:
+            logging.error(f"Not geçmişi yazılamadı: {e}")
+            return 0
+
+        for entry in new_entries:
+            self._index(entry)
+        return len(new_entries)
+
+    # ================= SORGULAR =================
+
+    def course_timeline(self, course: str, semester: Optional[str] = None) -> List[HistoryEntry]:
+        """Dersin tüm değişiklikleri (zaman sırasıyla); dönem verilmezse tüm dönemler."""
+        with self._lock:
+            self._ensure_loaded()
+            key = course_key(course)
+            semesters = [semester] if semester is not None else list(self._by_course)
+            entries: List[HistoryEntry] = []
+            for sem in semesters:
+                timeline = self._by_course.get(sem, {}).get(key)
+                if timeline:
+                    entries.extend(timeline.entries)
+        return sorted(entries, key=lambda e: e.timestamp)
+
+    def when_posted(self, course: str, exam: str, semester: Optional[str] = None) -> Optional[str]:
+        """
+        Dersin verilen sınav notunun ilk görüldüğü zaman (ISO) veya None.
+        Geçmiş başladığında not zaten açıklanmışsa ilk kaydın zamanı döner.
+        """
+        exam_name = " ".join(exam.split()).casefold()
+        for entry in self.course_timeline(course, semester):
+            exams = parse_exams(entry.record.exams) if entry.record else None
+            for name, score in (exams or {}).items():
+                if name.casefold() == exam_name and score.strip() not in ("", "-"):
+                    return entry.timestamp
+        return None
+
+    def changes_between(self, semester: str, since: Optional[TimePoint] = None,
+                        until: Optional[TimePoint] = None) -> List[HistoryEntry]:
+        """Dönemin [since, until] aralığındaki tüm değişiklikleri (sınırlar verilmezse tümü)."""
+        with self._lock:
+            self._ensure_loaded()
+            timeline = self._by_semester.get(semester)
+            if not timeline:
+                return []
+            return timeline.between(_iso(since) if since else None, _iso(until) if until else None)
+
+    def snapshot_at(self, semester: str, when: TimePoint) -> List[GradeRecord]:
+        """Dönemin `when` anındaki not listesi (o an kayıtlı olmayan dersler dahil edilmez)."""
+        stamp = _iso(when)
+        with self._lock:
+            self._ensure_loaded()
+            entries = [timeline.last_at(stamp) for timeline in self._by_course.get(semester, {}).values()]
+        return [e.record for e in entries if e is not None and e.record is not None]
+
+    # ================= DİZİN =================
+
+    def _index(self, entry: HistoryEntry) -> None:
+        self._by_course.setdefault(entry.semester, {}).setdefault(entry.key, _Timeline()).add(entry)
+        self._by_semester.setdefault(entry.semester, _Timeline()).add(entry)
+        self._last_timestamp = max(self._last_timestamp, entry.timestamp)
+
+    def _has_partial_line(self) -> bool:
+        """Dosya yarım yazılmış bir satırla bitiyorsa True (yeni kayıt o satıra eklenmemeli)."""
+        try:
+            with open(self.file_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b"\n"
+        except OSError:
+            return False
+
+    def _ensure_loaded(self) -> None:
+        """
+        Geçmiş dosyasını ilk erişimde bir kez okuyup dizini kurar. Başlangıç halleri
+        kendi zamanlarıyla eklendiğinden dosya zaman sıralı olmayabilir; dizin sıralı kurulur.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.file_path):
+            return
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        self._index(HistoryEntry.from_json(json.loads(line)))
+                    except (ValueError, KeyError, TypeError) as e:
+                        # Yarım yazılmış son satır vb. — geçmişin geri kalanı kullanılabilir
+                        logging.warning(f"Not geçmişinde bozuk satır atlandı ({line_no}): {e}")
+        except OSError as e:
+            logging.error(f"Not geçmişi okunamadı: {e}")
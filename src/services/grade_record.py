@@ -0,0 +1,52 @@
+"""
+BU DOSYA: Tek bir dersin not satırını temsil eden değiştirilemez (immutable) GradeRecord tipini barındırır.
+
+Uygulama içinde notlar GradeRecord olarak taşınır; Türkçe anahtarlı sözlüğe
+("Ders Adı", "Sınavlar", "Harf Notu", "Sonuç") yalnızca JSON kayıt sınırında
+(services/storage.py) dönüştürülür. Ders adları intern edilir; aynı ad her
+döngüde ve her hesapta tek bir string nesnesini paylaşır.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping
+
+
+def course_key(course: str) -> str:
+    """Ders adından boşluk ve büyük/küçük harf farklarına duyarsız, kararlı bir anahtar üretir."""
+    return sys.intern(" ".join(course.split()).casefold())
+
+
+@dataclass(frozen=True, slots=True)
+class GradeRecord:
+    """Bir dersin not tablosundaki satırı."""
+    course: str
+    exams: str
+    letter: str
+    result: str
+    key: str = field(default="", compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "course", sys.intern(self.course))
+        if not self.key:
+            object.__setattr__(self, "key", course_key(self.course))
+
+    @classmethod
+    def from_cells(cls, cells: List[str]) -> "GradeRecord":
+        """Tablo hücrelerinden kayıt oluşturur (3. hücre kredi, kullanılmaz)."""
+        return cls(cells[0], cells[1], cells[2], cells[4])
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "GradeRecord":
+        """JSON kaydındaki Türkçe anahtarlı sözlükten kayıt oluşturur."""
+        return cls(data.get("Ders Adı", ""), data.get("Sınavlar", ""),
+                   data.get("Harf Notu", ""), data.get("Sonuç", ""))
+
+    def to_dict(self) -> Dict[str, str]:
+        """JSON kaydı için Türkçe anahtarlı sözlük (eski kayıt formatıyla aynı)."""
+        return {
+            "Ders Adı": self.course,
+            "Sınavlar": self.exams,
+            "Harf Notu": self.letter,
+            "Sonuç": self.result
+        }
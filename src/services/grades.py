@@ -1,110 +1,123 @@
 """
 BU DOSYA: HTML içeriğini analiz ederek (parsing) notları ayıklar ve
-eski notlarla karşılaştırarak değişiklikleri tespit eder.
+eski notlarla karşılaştırarak değişiklikleri tespit eder (alan düzeyi farklar: services/grade_diff.py).
 """
 
+import hashlib
 import logging
 from typing import List, Dict, Tuple, Optional, Any
-from bs4 import BeautifulSoup
 from config import OBISSelectors
+from services.grade_diff import COURSE_ADDED, GradeEvent, GradeIndex, diff_indexes
+from services.grade_record import GradeRecord
+from services.html_parsers import TableNotFound, get_row_parser
+
+# Satırlardan not listesi üretme kuralı değişirse artırılır; eski parmak izleri geçersiz olur
+FINGERPRINT_VERSION = "v1"
+
 
 class GradeService:
     """HTML Parsing ve Not Karşılaştırma işlemlerini yürütür."""
 
-    def parse_grades(self, html_content: str) -> Optional[List[Dict[str, str]]]:
+    def __init__(self, parser_backend: str = "auto"):
         """
-        HTML içeriğinden not tablosunu bulup verileri çeker.
-        BeautifulSoup kütüphanesi kullanılır.
+        Args:
+            parser_backend: "auto" | "selectolax" | "lxml" | "strainer" | "soup" (bkz. services/html_parsers.py)
+        """
+        self._parse_rows = get_row_parser(parser_backend)
+        # Dönem -> son karşılaştırılan not listesinin dizini (bir sonraki döngüde yeniden kullanılır)
+        self._indexes: Dict[str, GradeIndex] = {}
+
+    def extract_rows(self, html_content: str) -> Optional[List[List[str]]]:
+        """
+        HTML içeriğinden not tablosunun satırlarını hücre metinleri olarak çıkarır.
+        Tablo bulunamazsa None döner.
         """
-        logging.info("HTML ayrıştırılıyor...")
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # .Tablo ID'sini config'den al
-            table = soup.find("table", {"id": OBISSelectors.GRADES_TABLE_ID})
-
-            if not table:
-                logging.error("HTML içinde not tablosu bulunamadı!")
-                return None
-            
-            tbody = table.find("tbody") # .type: ignore
-            if not tbody:
-                 return None
-
-            rows = tbody.find_all("tr")
-            if not rows:
-                return None
-            
-            grades = []
-            for row in rows:
-                cells = row.find_all("td")
-                # Beklenen hücre sayısı en az 5 olmalı
-                if len(cells) > 4:
-                    ders = cells[0].get_text(strip=True)
-                    sinavlar = cells[1].get_text(strip=True)
-                    harf_notu = cells[2].get_text(strip=True)
-                    sonuc = cells[4].get_text(strip=True)
-                    
-                    grades.append({
-                        "Ders Adı": ders,
-                        "Sınavlar": sinavlar,
-                        "Harf Notu": harf_notu,
-                        "Sonuç": sonuc
-                    })
-        
-            return grades
-            
+            # .Tablo ID'sini config'den al; yalnızca tablo alt ağacı ayrıştırılır
+            return self._parse_rows(html_content, OBISSelectors.GRADES_TABLE_ID)
+
+        except TableNotFound:
+            logging.error("HTML içinde not tablosu bulunamadı!")
+            return None
         except Exception as e:
-            logging.error(f"Notlar ayrıştırılırken hata: {str(e)}")
+            logging.error(f"Not tablosu okunurken hata: {str(e)}")
+            return None
+
+    @staticmethod
+    def fingerprint_rows(rows: Optional[List[List[str]]]) -> Optional[str]:
+        """
+        Tablo satırlarının normalize edilmiş (boşlukları sadeleştirilmiş) içerik özetini döner.
+        Aynı tablo her zaman aynı özeti verir; tablo yoksa None döner.
+        """
+        if not rows:
+            return None
+        digest = hashlib.sha256(FINGERPRINT_VERSION.encode())
+        for cells in rows:
+            digest.update("\x1f".join(" ".join(cell.split()) for cell in cells).encode("utf-8"))
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+
+    def parse_grade_rows(self, rows: Optional[List[List[str]]]) -> Optional[List[GradeRecord]]:
+        """
+        Hücre metinlerinden (sayfa içinde çıkarılmış veya HTML'den okunmuş)
+        not listesini oluşturur.
+        """
+        if not rows:
             return None
 
+        grades = []
+        for cells in rows:
+            # Beklenen hücre sayısı en az 5 olmalı
+            if len(cells) > 4:
+                grades.append(GradeRecord.from_cells(cells))
+
+        return grades
+
+    def parse_grades(self, html_content: str) -> Optional[List[GradeRecord]]:
+        """
+        HTML içeriğinden not tablosunu bulup verileri çeker.
+        Seçili ayrıştırıcı arka ucu kullanılır.
+        """
+        logging.info("HTML ayrıştırılıyor...")
+        return self.parse_grade_rows(self.extract_rows(html_content))
+
     def compare_grades(self, 
                        old_data: Optional[Dict[str, Any]], 
-                       new_grades: List[Dict[str, str]]) -> Tuple[List[Dict[str, Any]], str]:
+                       new_grades: List[GradeRecord],
+                       semester: str = "") -> Tuple[List[Dict[str, Any]], str]:
         """
-        Eski ve yeni not listelerini karşılaştırarak farkları bulur.
+        Eski ve yeni not listelerini alan düzeyinde karşılaştırarak farkları bulur.
+        Her değişiklik kaydı {"ders", "eski", "yeni", "olaylar"} alanlarını içerir;
+        "eski"/"yeni" GradeRecord, "olaylar" ise neyin değiştiğini veren GradeEvent listesidir
+        (bkz. services/grade_diff.py). Listeden çıkan derslerde "yeni" None olur.
+
+        Args:
+            semester: Dizin önbelleğinin anahtarı (her dönem kendi dizinini kullanır)
         
         Returns:
             (Değişiklik Listesi, Durum Mesajı)
         """
+        cached = self._indexes.get(semester)
+
         if not old_data or "grades" not in old_data:
             # İlk kez çalışıyorsa veya eski veri yoksa hepsi "yeni" sayılır
-            changes = []
-            for grade in new_grades:
-                changes.append({
-                "ders": grade["Ders Adı"],
-                "eski": None,
-                "yeni": grade
-            })
+            new_index = GradeIndex(new_grades, cached)
+            self._indexes[semester] = new_index
+            changes = [
+                {"ders": record.course, "eski": None, "yeni": record, "olaylar": [GradeEvent(COURSE_ADDED, record.course)]}
+                for record, _ in new_index.entries.values()
+            ]
             return changes, "İlk kontrol (Tüm veriler yeni)"
-        
+
+        # Önceki döngüde dizinlenen liste kayıttan aynen geri okunduysa dizin yeniden kurulmaz
         old_grades_list = old_data["grades"]
-        
-        # Karşılaştırma kolaylığı için listeyi dict'e çeviriyoruz (Anahtar: Ders Adı)
-        old_dict = {grade["Ders Adı"]: grade for grade in old_grades_list}
-        new_dict = {grade["Ders Adı"]: grade for grade in new_grades}
-        
-        changes = []
-        
-        for ders_adi, new_grade in new_dict.items():
-            if ders_adi in old_dict:
-                old_grade = old_dict[ders_adi]
-                # İçerik değişikliği kontrolü
-                if (old_grade["Sınavlar"] != new_grade["Sınavlar"] or 
-                    old_grade["Harf Notu"] != new_grade["Harf Notu"] or 
-                    old_grade["Sonuç"] != new_grade["Sonuç"]):
-                    
-                    changes.append({
-                        "ders": ders_adi,
-                        "eski": old_grade,
-                        "yeni": new_grade
-                    })
-            else:
-                # Yeni bir ders eklenmişse
-                changes.append({
-                    "ders": ders_adi,
-                    "eski": None,
-                    "yeni": new_grade
-                })
-        
+        old_index = cached if cached is not None and cached.grades == old_grades_list else GradeIndex(old_grades_list)
+        new_index = GradeIndex(new_grades, old_index)
+        self._indexes[semester] = new_index
+
+        changes = [
+            {"ders": (new or old).course, "eski": old, "yeni": new, "olaylar": events}
+            for old, new, events in diff_indexes(old_index, new_index)
+        ]
+
         return changes, "Değişiklik bulundu" if changes else "Değişiklik yok"
@@ -0,0 +1,139 @@
+"""
+BU DOSYA: Not tablosunu HTML'den okuyan değiştirilebilir ayrıştırıcı (parser) arka uçlarını barındırır.
+
+Tüm arka uçlar `BeautifulSoup(html, 'html.parser')` ile tam sayfa ağacı kurup
+tabloyu aramanın verdiği çıktının aynısını üretir:
+    tablo -> ilk <tbody> -> tüm <tr> -> tüm <td> -> get_text(strip=True)
+
+    - "strainer"  : BeautifulSoup + SoupStrainer; yalnızca not tablosunun alt ağacı kurulur (ek bağımlılık yok)
+    - "lxml"      : lxml.html (libxml2) — opsiyonel
+    - "selectolax": selectolax (Lexbor/Modest) — opsiyonel, en hızlısı
+    - "soup"      : Eski davranış (tam sayfa ağacı); karşılaştırma ve benchmark içindir
+
+"auto" seçimi kurulu olan en hızlı arka ucu kullanır.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml ve selectolax opsiyoneldir; yoksa ilgili arka uç kullanılamaz
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxHTMLParser
+except ImportError:
+    try:
+        # selectolax < 0.3.13: yalnızca Modest arka ucu vardır
+        from selectolax.parser import HTMLParser as SelectolaxHTMLParser
+    except ImportError:
+        SelectolaxHTMLParser = None
+
+Rows = List[List[str]]
+
+
+class TableNotFound(LookupError):
+    """Not tablosu HTML içinde bulunamadı."""
+
+
+# ================= ARKA UÇLAR =================
+
+def _rows_from_soup(table) -> Optional[Rows]:
+    if not table:
+        raise TableNotFound()
+    tbody = table.find("tbody")
+    if not tbody:
+        return None
+    return [[cell.get_text(strip=True) for cell in row.find_all("td")]
+            for row in tbody.find_all("tr")]
+
+
+def parse_rows_soup(html_content: str, table_id: str) -> Optional[Rows]:
+    """Tam sayfa ağacı kurarak (eski yöntem) tablo satırlarını okur."""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    return _rows_from_soup(soup.find("table", {"id": table_id}))
+
+
+def parse_rows_strainer(html_content: str, table_id: str) -> Optional[Rows]:
+    """Yalnızca not tablosunun alt ağacını kurar (SoupStrainer)."""
+    soup = BeautifulSoup(html_content, 'html.parser', parse_only=SoupStrainer("table", id=table_id))
+    return _rows_from_soup(soup.find("table", {"id": table_id}))
+
+
+# BeautifulSoup'un get_text() çıktısına katmadığı doğrudan metin içeren etiketler
+_NON_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+
+def _lxml_text(node) -> str:
+    # get_text(strip=True) gibi: her metin parçası ayrı kırpılır, yorumlar dahil edilmez
+    parts = []
+    for element in node.iter():
+        if isinstance(element.tag, str) and element.tag not in _NON_TEXT_TAGS and element.text:
+            parts.append(element.text.strip())
+        if element is not node and element.tail:
+            parts.append(element.tail.strip())
+    return "".join(parts)
+
+
+def parse_rows_lxml(html_content: str, table_id: str) -> Optional[Rows]:
+    """lxml (libxml2) ile tabloyu id üzerinden bulur."""
+    root = lxml_html.document_fromstring(html_content)
+    tables = root.xpath("//table[@id=$table_id]", table_id=table_id)
+    if not tables:
+        raise TableNotFound()
+    tbodies = tables[0].xpath(".//tbody")
+    if not tbodies:
+        return None
+    return [[_lxml_text(cell) for cell in row.iterdescendants("td")]
+            for row in tbodies[0].iterdescendants("tr")]
+
+
+# HTML5 ayrıştırıcı (Lexbor) eksik <tbody>'yi kendisi ekler; html.parser eklemez.
+# Kaynaktaki gerçek <tbody> etiketleri ayrıştırmadan önce işaretlenir, böylece ağaçta
+# eklenenlerden ayırt edilir (tablo id'sinin kaynakta nerede geçtiğine bakılmaz).
+_SOURCE_TBODY_ATTR = "data-obis-source-tbody"
+_SOURCE_TBODY_RE = re.compile(r"<tbody(?=[\s/>])", re.IGNORECASE)
+
+
+def parse_rows_selectolax(html_content: str, table_id: str) -> Optional[Rows]:
+    """selectolax ile tabloyu CSS seçici üzerinden bulur."""
+    tree = SelectolaxHTMLParser(_SOURCE_TBODY_RE.sub(f"<tbody {_SOURCE_TBODY_ATTR}", html_content))
+    table = tree.css_first(f'table[id="{table_id}"]')
+    if table is None:
+        raise TableNotFound()
+    tbody = table.css_first(f"tbody[{_SOURCE_TBODY_ATTR}]")
+    if tbody is None:
+        return None
+    return [[cell.text(deep=True, separator="", strip=True) for cell in row.css("td")]
+            for row in tbody.css("tr")]
+
+
+# ================= SEÇİM =================
+
+# Öncelik sırası: "auto" ilk kullanılabilir olanı seçer
+_BACKENDS: Dict[str, Callable[[str, str], Optional[Rows]]] = {}
+if SelectolaxHTMLParser is not None:
+    _BACKENDS["selectolax"] = parse_rows_selectolax
+if lxml_html is not None:
+    _BACKENDS["lxml"] = parse_rows_lxml
+_BACKENDS["strainer"] = parse_rows_strainer
+_BACKENDS["soup"] = parse_rows_soup
+
+
+def available_backends() -> List[str]:
+    """Bu ortamda kullanılabilen arka uç adları (hızlıdan yavaşa)."""
+    return list(_BACKENDS)
+
+
+def get_row_parser(name: str = "auto") -> Callable[[str, str], Optional[Rows]]:
+    """
+    Adı verilen arka ucu döner. "auto" veya kurulu olmayan bir arka uç
+    istenirse kullanılabilen en hızlı arka uç seçilir.
+    """
+    if name in _BACKENDS:
+        return _BACKENDS[name]
+    return next(iter(_BACKENDS.values()))
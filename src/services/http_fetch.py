@@ -0,0 +1,305 @@
+"""
+BU DOSYA: Tarayıcı açmadan, ASP.NET login ve dönem postback'lerini doğrudan
+HTTP üzerinden tekrarlayarak not tablosu HTML'ini getiren motoru barındırır.
+Captcha veya tanınmayan bir sayfa yapısı görülürse `HttpEngineUnavailable`
+fırlatılır ve çağıran taraf Playwright (BrowserService) yoluna döner.
+"""
+
+import gzip
+import http.client
+import http.cookiejar
+import json
+import logging
+import urllib.request
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+from config import OBISSelectors
+
+# Bir istekte takip edilecek en fazla yönlendirme sayısı
+_MAX_REDIRECTS = 5
+_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+               "(KHTML, like Gecko) Chrome/124.0 Safari/537.36")
+
+
+class HttpEngineUnavailable(Exception):
+    """HTTP motoru bu sayfayı işleyemiyor (captcha, beklenmeyen yapı vb.)."""
+
+
+class _KeepAliveClient:
+    """
+    Host başına tek bir kalıcı (keep-alive) bağlantı kullanan küçük HTTP istemcisi.
+    Çerezler `http.cookiejar` ile yönetilir, yönlendirmeler takip edilir.
+    """
+
+    def __init__(self, timeout: float = 20.0):
+        self.timeout = timeout
+        self.cookies = http.cookiejar.CookieJar()
+        self._connections: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+
+    def _get_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        key = (scheme, netloc)
+        conn = self._connections.get(key)
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = conn_cls(netloc, timeout=self.timeout)
+            self._connections[key] = conn
+        return conn
+
+    def _send_once(self, method: str, url: str, body: Optional[bytes]) -> Tuple[http.client.HTTPResponse, bytes]:
+        parsed = urlparse(url)
+        path = parsed.path or "/"
+        if parsed.query:
+            path += "?" + parsed.query
+
+        # Cookie başlığını CookieJar'a ürettir
+        cookie_req = urllib.request.Request(url, method=method)
+        self.cookies.add_cookie_header(cookie_req)
+
+        headers = {
+            "User-Agent": _USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Encoding": "gzip",
+            "Accept-Language": "tr-TR,tr;q=0.9",
+            "Connection": "keep-alive",
+        }
+        cookie_header = cookie_req.unredirected_hdrs.get("Cookie")
+        if cookie_header:
+            headers["Cookie"] = cookie_header
+        if body is not None:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        # Sunucu kalıcı bağlantıyı kapattıysa bir kez yeniden bağlan
+        for attempt in range(2):
+            conn = self._get_connection(parsed.scheme, parsed.netloc)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError):
+                conn.close()
+                self._connections.pop((parsed.scheme, parsed.netloc), None)
+                if attempt == 1:
+                    raise
+
+        self.cookies.extract_cookies(response, cookie_req)
+
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            data = gzip.decompress(data)
+
+        return response, data
+
+    def request(self, method: str, url: str, form: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+        """
+        İsteği gönderir, yönlendirmeleri (en fazla `_MAX_REDIRECTS`) takip eder.
+        Yönlendirme zinciri bitmezse `HttpEngineUnavailable` fırlatılır.
+
+        Returns:
+            (son URL, çözülmüş HTML)
+        """
+        body = urlencode(form).encode("utf-8") if form is not None else None
+
+        for _ in range(_MAX_REDIRECTS + 1):
+            response, data = self._send_once(method, url, body)
+            status = response.status
+            if status in (301, 302, 303, 307, 308):
+                location = response.getheader("Location")
+                if not location:
+                    raise HttpEngineUnavailable(f"HTTP {status} yönlendirmesinde hedef yok: {url}")
+                url = urljoin(url, location)
+                if status in (301, 302, 303):
+                    method, body = "GET", None
+                continue
+            if status >= 400:
+                raise HttpEngineUnavailable(f"HTTP {status}: {url}")
+            break
+        else:
+            raise HttpEngineUnavailable(f"Çok fazla yönlendirme: {url}")
+
+        charset = response.headers.get_content_charset() or "utf-8"
+        return url, data.decode(charset, errors="replace")
+
+    def close(self) -> None:
+        for conn in self._connections.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._connections.clear()
+
+
+class HttpFetchService:
+    """
+    OBIS not tablosunu tarayıcı olmadan çeken motor.
+    Çerezler ve bağlantılar örnek ömrü boyunca korunur; oturum hâlâ geçerliyse
+    sonraki döngülerde login POST'u da atlanır.
+    """
+
+    def __init__(self, timeout: float = 20.0):
+        self.client = _KeepAliveClient(timeout=timeout)
+        self._home_url: Optional[str] = None
+        self._home_html: Optional[str] = None
+
+    # ================= YARDIMCILAR =================
+
+    @staticmethod
+    def _form_fields(soup: BeautifulSoup) -> Dict[str, str]:
+        """Formdaki tüm input alanlarını (ViewState dahil) toplar. Butonlar hariç."""
+        fields: Dict[str, str] = {}
+        for inp in soup.find_all("input"):
+            name = inp.get("name")
+            if not name:
+                continue
+            if inp.get("type", "text").lower() in ("submit", "button", "image", "checkbox", "radio"):
+                continue
+            fields[name] = inp.get("value", "")
+        return fields
+
+    @staticmethod
+    def _is_logged_in(html: str) -> bool:
+        return all(marker in html for marker in OBISSelectors.LOGIN_SUCCESS_MARKERS)
+
+    @staticmethod
+    def _has_captcha(soup: BeautifulSoup) -> bool:
+        return soup.select_one(".g-recaptcha, [data-sitekey], iframe[src*='recaptcha']") is not None
+
+    @staticmethod
+    def _is_credential_rejection(soup: BeautifulSoup, user_field: str, pass_field: str) -> bool:
+        """Yanıt, hata uyarısıyla birlikte yeniden gösterilen login formu ise True."""
+        if not soup.find("input", {"name": user_field}) or not soup.find("input", {"name": pass_field}):
+            return False
+        text = soup.get_text(" ", strip=True).lower()
+        return any(marker in text for marker in OBISSelectors.LOGIN_FAILURE_MARKERS)
+
+    def _find_grades_link(self, html: str, base_url: str) -> str:
+        soup = BeautifulSoup(html, "html.parser")
+        for node in soup.select("a.rtIn, .rtIn a"):
+            if "Öğrenci Not Görüntüle" in node.get_text(strip=True) and node.get("href", "").strip() not in ("", "#"):
+                return urljoin(base_url, node["href"])
+        raise HttpEngineUnavailable("Not görüntüleme menü bağlantısı bulunamadı.")
+
+    # ================= ADIMLAR =================
+
+    def login(self, student_id: str, password: str) -> bool:
+        """
+        Login formunu doğrudan POST eder.
+
+        Returns:
+            Giriş başarılı ise True, bilgiler hatalıysa False.
+
+        Raises:
+            HttpEngineUnavailable: Captcha veya tanınmayan yanıt (çağıran tarayıcıya geçer)
+        """
+        url, html = self.client.request("GET", OBISSelectors.OBIS_URL)
+        soup = BeautifulSoup(html, "html.parser")
+
+        user_field = OBISSelectors.LOGIN_USERNAME_INPUT.split('"')[1]
+        pass_field = OBISSelectors.LOGIN_PASSWORD_INPUT.split('"')[1]
+        if not soup.find("input", {"name": user_field}) or not soup.find("input", {"name": pass_field}):
+            raise HttpEngineUnavailable("Giriş formu beklenen yapıda değil.")
+        if self._has_captcha(soup):
+            raise HttpEngineUnavailable("Giriş sayfasında captcha var.")
+
+        form = self._form_fields(soup)
+        form[user_field] = f"{student_id}@stu.adu.edu.tr"
+        form[pass_field] = password
+        button = soup.find("input", {"name": OBISSelectors.LOGIN_BUTTON_NAME})
+        form[OBISSelectors.LOGIN_BUTTON_NAME] = button.get("value", "Giriş") if button else "Giriş"
+
+        url, html = self.client.request("POST", url, form)
+        if self._is_logged_in(html):
+            self._home_url, self._home_html = url, html
+            return True
+
+        soup = BeautifulSoup(html, "html.parser")
+        if self._has_captcha(soup):
+            raise HttpEngineUnavailable("Giriş sonrası captcha istendi.")
+        if self._is_credential_rejection(soup, user_field, pass_field):
+            return False
+        # Ne menü ne de hata uyarısı: bilgiler hatalı sayılmaz, tarayıcı yolu denenir
+        raise HttpEngineUnavailable("Giriş sonrası sayfa tanınmadı.")
+
+    def _select_semester(self, url: str, html: str, semester: str) -> str:
+        """RadComboBox dönem seçimini postback ile tekrarlar ve tablo HTML'ini döner."""
+        soup = BeautifulSoup(html, "html.parser")
+
+        combo_input = soup.find("input", {"name": OBISSelectors.SEMESTER_COMBOBOX_NAME})
+        dropdown = soup.find(id=OBISSelectors.SEMESTER_DROPDOWN_LIST.lstrip("#"))
+        if combo_input is None or dropdown is None:
+            raise HttpEngineUnavailable("Dönem seçim kutusu beklenen yapıda değil.")
+
+        items = [li.get_text(strip=True) for li in dropdown.find_all("li")]
+        matches = [i for i, text in enumerate(items) if semester in text]
+        if not matches:
+            error_msg = f"Seçilen dönem ({semester}) listede bulunamadı."
+            logging.error(error_msg)
+            raise ValueError(error_msg)
+
+        index = matches[0]
+        has_table = soup.find("table", {"id": OBISSelectors.GRADES_TABLE_ID}) is not None
+        if has_table and semester in combo_input.get("value", ""):
+            return html  # Dönem zaten seçili
+
+        form = self._form_fields(soup)
+        form["__EVENTTARGET"] = OBISSelectors.SEMESTER_COMBOBOX_NAME
+        form["__EVENTARGUMENT"] = json.dumps({"Command": "Select", "Index": index})
+        form[OBISSelectors.SEMESTER_COMBOBOX_NAME] = items[index]
+        form[OBISSelectors.SEMESTER_COMBOBOX_CLIENT_STATE] = json.dumps({
+            "logEntries": [], "value": items[index], "text": items[index],
+            "enabled": True, "checkedIndices": [], "checkedItemsTextOverflows": False
+        })
+
+        _, html = self.client.request("POST", url, form)
+        if OBISSelectors.GRADES_TABLE_ID not in html:
+            raise HttpEngineUnavailable("Dönem postback'i sonrası not tablosu bulunamadı.")
+        return html
+
+    def fetch_semesters_html(self, student_id: str, password: str, semesters: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Tek girişte dönemleri sırayla seçer. Her postback bir önceki yanıtın
+        ViewState'i ile gönderilir.
+
+        Returns:
+            {dönem: HTML | ValueError (dönem listede yok)}, giriş bilgileri hatalıysa None.
+
+        Raises:
+            HttpEngineUnavailable: Playwright'a dönülmesi gerekiyorsa.
+        """
+        page = self._open_grades_page(student_id, password)
+        if page is None:
+            return None
+        url, html = page
+
+        results: Dict[str, Any] = {}
+        for semester in semesters:
+            try:
+                html = self._select_semester(url, html, semester)
+                results[semester] = html
+            except ValueError as ve:
+                results[semester] = ve
+        return results
+
+    def _open_grades_page(self, student_id: str, password: str) -> Optional[Tuple[str, str]]:
+        """Geçerli oturumu doğrular (gerekirse giriş yapar) ve not sayfasını açar."""
+        session_valid = False
+        if self._home_url:
+            url, html = self.client.request("GET", self._home_url)
+            session_valid = self._is_logged_in(html)
+            if session_valid:
+                self._home_url, self._home_html = url, html
+                logging.info("HTTP oturumu hâlâ geçerli, giriş adımı atlandı.")
+
+        if not session_valid:
+            logging.info("OBİS'e HTTP ile giriş yapılıyor...")
+            if not self.login(student_id, password):
+                return None
+
+        grades_url = self._find_grades_link(self._home_html, self._home_url)
+        return self.client.request("GET", grades_url)
+
+    def close(self) -> None:
+        self.client.close()
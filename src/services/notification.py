@@ -17,17 +17,20 @@ class NotificationService:
                  sender_email: str, 
                  sender_password: str, 
                  notification_methods: List[str], 
-                 timeline_callback: Optional[Callable[[str, str], None]] = None):
+                 timeline_callback: Optional[Callable[[str, str], None]] = None,
+                 recipients: Optional[List[str]] = None):
         """
         Args:
             sender_email: Gönderen Gmail adresi
             sender_password: Gmail Uygulama Şifresi
             notification_methods: Seçili yöntemler listesi
             timeline_callback: Dashboard timeline'a mesaj göndermek için callback
+            recipients: Alıcı listesi (verilmezse gönderen adrese gönderilir)
         """
         self.sender_email = sender_email
         self.sender_password = sender_password
-        self.recipient_email = sender_email 
+        self.recipients: List[str] = [r for r in (recipients or []) if r] or [sender_email]
+        self.recipient_email = ", ".join(self.recipients)
         self.notification_methods = notification_methods
         self.timeline_callback = timeline_callback
 
@@ -54,7 +57,7 @@ class NotificationService:
             
             with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
                 server.login(self.sender_email, self.sender_password)
-                server.sendmail(self.sender_email, self.recipient_email, msg.as_string())
+                server.sendmail(self.sender_email, self.recipients, msg.as_string())
         except Exception as e:
             error_msg = f"Mail gönderme hatası: {e}"
             logging.error(error_msg)
@@ -75,9 +78,11 @@ class NotificationService:
         error_reported = False
         for change in changes:
             ders_adi = change['ders']
-            yeni = change['yeni']
+            # Listeden çıkan derslerde yeni bilgi yoktur; son bilinen hali gösterilir
+            kayit = change['yeni'] or change.get('eski')
+            degisiklikler = [event.describe() for event in change.get('olaylar', [])]
             
-            html_body = OBISEmailTemplates.get_grade_change_template(ders_adi, yeni)
+            html_body = OBISEmailTemplates.get_grade_change_template(ders_adi, kayit, degisiklikler)
             
             # E-posta Bildirimi
             if "email" in self.notification_methods and self.sender_email:
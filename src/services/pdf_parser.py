@@ -3,6 +3,7 @@ import os
 import logging
 import re
 from datetime import datetime
+from typing import BinaryIO, Union
 
 # Önceden derlenmiş regex pattern'ları (performans optimizasyonu)
 _RE_STUDENT_INFO = re.compile(r"^(\d{9})\s+(.+?)\s+(\d)\s+(\d[.,]\d{2})\s+(.+)$")
@@ -14,7 +15,13 @@ _RE_REMAINING = re.compile(r"^(.+?)\s+(\d{1,2})\s+(\d{2}/\d{2}\s+(?:Güz|Bahar|H
 class PDFParserService:
     """Öğrenci Mezuniyet Kontrol PDF'ini satır satır metin üzerinden okuyarak verileri ayrıştırır."""
     
-    def extract_graduation_data(self, pdf_path: str) -> dict:
+    def extract_graduation_data(self, pdf_source: Union[str, BinaryIO]) -> dict:
+        """
+        Mezuniyet kontrol PDF'ini ayrıştırır.
+
+        Args:
+            pdf_source: PDF dosya yolu veya bellekteki içerik (BytesIO vb.)
+        """
         result = {
             "son_guncelleme": datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
             "ogrenci_bilgileri": {
@@ -28,13 +35,13 @@ class PDFParserService:
             "ogretim_programi_dersleri": []
         }
         
-        if not os.path.exists(pdf_path):
+        if isinstance(pdf_source, str) and not os.path.exists(pdf_source):
             logging.error("PDF dosyası bulunamadı!")
             return result
 
         try:
             text = ""
-            with pdfplumber.open(pdf_path) as pdf:
+            with pdfplumber.open(pdf_source) as pdf:
                 for page in pdf.pages:
                     # layout=True görsel boşlukları korur, sütunların bitişmesini önler
                     page_text = page.extract_text(layout=True)
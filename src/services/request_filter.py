@@ -0,0 +1,130 @@
+"""
+BU DOSYA: Kontrol döngüleri sırasında gereksiz ağ isteklerini (resim, font,
+stil dosyası, üçüncü taraf script) `page.route` ile engelleyen filtreyi barındırır.
+Not tablosu için yalnızca DOM gereklidir; engellenen her istek bant genişliğini,
+`networkidle` bekleme süresini ve renderer belleğini azaltır.
+"""
+
+import logging
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from playwright.sync_api import Page, Route, Response
+
+from config import OBISSelectors
+
+# Varsayılan olarak engellenen Playwright resource type'ları
+DEFAULT_BLOCKED_TYPES = ("image", "font", "stylesheet", "media")
+
+# Birinci taraf alan adları (script/document istekleri serbest).
+# OBIS adresinin kendi host'u her zaman eklenir (yerel test sunucusu dahil).
+DEFAULT_ALLOWED_DOMAINS = ("obisnet.adu.edu.tr",)
+
+# Login formunun çalışması için gereken (türünden bağımsız serbest) adresler.
+# "host/yol" önekiyle eşleşir. reCAPTCHA yüklenmezse giriş butonu çalışmaz.
+DEFAULT_ALLOWLIST = (
+    "www.google.com/recaptcha",
+    "www.gstatic.com/recaptcha",
+    "www.recaptcha.net/recaptcha",
+)
+
+
+class RequestFilter:
+    """Sayfa isteklerini türe ve alan adına göre süzer, istatistik tutar."""
+
+    def __init__(self,
+                 enabled: bool = True,
+                 blocked_types: Optional[Iterable[str]] = None,
+                 allowed_domains: Optional[Iterable[str]] = None,
+                 allowlist: Optional[Iterable[str]] = None):
+        self.enabled = enabled
+        self.blocked_types = frozenset(blocked_types if blocked_types is not None else DEFAULT_BLOCKED_TYPES)
+        obis_host = urlparse(OBISSelectors.OBIS_URL).hostname or ""
+        self.allowed_domains = tuple(allowed_domains if allowed_domains is not None else DEFAULT_ALLOWED_DOMAINS)
+        if obis_host and obis_host not in self.allowed_domains:
+            self.allowed_domains += (obis_host,)
+        self.allowlist = tuple(allowlist if allowlist is not None else DEFAULT_ALLOWLIST)
+
+        # Döngü bazlı sayaçlar (attach ile sıfırlanır)
+        self.blocked_requests: int = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.allowed_requests: int = 0
+        self.allowed_bytes: int = 0
+
+        # Uygulama ömrü boyunca toplam
+        self.total_blocked_requests: int = 0
+        self.total_allowed_bytes: int = 0
+
+    def attach(self, page: Page) -> None:
+        """Filtreyi sayfaya bağlar ve döngü sayaçlarını sıfırlar."""
+        self.reset_counters()
+        if not self.enabled:
+            return
+        page.route("**/*", self._handle_route)
+        page.on("response", self._on_response)
+
+    def detach(self, page: Page) -> None:
+        """Filtreyi sayfadan kaldırır (canlı tutulan sayfalar başka işlerde yeniden kullanılır)."""
+        if not self.enabled:
+            return
+        try:
+            page.unroute("**/*", self._handle_route)
+            page.remove_listener("response", self._on_response)
+        except Exception as e:
+            logging.debug(f"İstek filtresi kaldırılamadı: {e}")
+
+    def reset_counters(self) -> None:
+        self.blocked_requests = 0
+        self.blocked_by_type = {}
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """İsteğin engellenip engellenmeyeceğine karar verir."""
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            return False  # data:, blob: vb. ağ trafiği oluşturmaz
+
+        host = (parsed.hostname or "").lower()
+        host_path = f"{host}{parsed.path}"
+        if any(host_path.startswith(entry) for entry in self.allowlist):
+            return False
+
+        if resource_type in self.blocked_types:
+            return True
+
+        is_first_party = any(host == d or host.endswith("." + d) for d in self.allowed_domains)
+        return not is_first_party
+
+    def _handle_route(self, route: Route) -> None:
+        request = route.request
+        try:
+            if self.should_block(request.url, request.resource_type):
+                self.blocked_requests += 1
+                self.total_blocked_requests += 1
+                self.blocked_by_type[request.resource_type] = self.blocked_by_type.get(request.resource_type, 0) + 1
+                route.abort()
+            else:
+                self.allowed_requests += 1
+                # fallback: context düzeyindeki diğer route'lar (örn. HAR tekrar oynatma) da çalışabilsin
+                route.fallback()
+        except Exception as e:
+            # Sayfa kapanırken gelen istekler için route işlemi hata verebilir
+            logging.debug(f"İstek filtresi hatası: {e}")
+
+    def _on_response(self, response: Response) -> None:
+        """Geçen yanıtların boyutunu (Content-Length) toplar."""
+        try:
+            length = int(response.headers.get("content-length", "0"))
+        except (ValueError, TypeError):
+            length = 0
+        self.allowed_bytes += length
+        self.total_allowed_bytes += length
+
+    def get_report(self) -> str:
+        """Örn: 'engellenen=42 (image=30, font=8, script=4), geçen=12 istek / 184.2 KB'"""
+        if not self.enabled:
+            return "istek filtresi kapalı"
+        by_type = ", ".join(f"{t}={c}" for t, c in sorted(self.blocked_by_type.items()))
+        blocked = f"engellenen={self.blocked_requests}" + (f" ({by_type})" if by_type else "")
+        return f"{blocked}, geçen={self.allowed_requests} istek / {self.allowed_bytes / 1024:.1f} KB"
@@ -5,12 +5,13 @@ ve yönetmekten sorumludur. Windows Credential Manager
 """
 
 import os
-import json
 import keyring
 import logging
 from typing import Optional, Tuple
 
 from utils.system import get_user_data_dir
+from services.session_state import SessionStateStore
+from services.storage import ProfileStorageService, open_document
 
 # Sabitler
 APP_NAME = "OBISNotifier"
@@ -44,14 +45,14 @@ class SessionManager:
             except Exception as e:
                 logging.error(f"Kasa (Keyring) erişim hatası: {e}")
             
-            # 2. Öğrenci numarasını dosyaya yaz (Son kullanıcıyı hatırlamak için)
+            # 2. Öğrenci numarasını kaydet (Son kullanıcıyı hatırlamak için)
             if not os.path.exists(APPDATA_DIR):
                 os.makedirs(APPDATA_DIR)
                 
             data = {"last_user": student_id}
             
-            with open(SESSION_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f)
+            if not open_document(SESSION_FILE, indent=None).save(data):
+                return False
                 
             logging.info(f"Oturum kaydedildi -> {student_id}")
             return True
@@ -68,14 +69,12 @@ class SessionManager:
         Returns:
             (student_id, password) tuple'ı veya None
         """
-        if not os.path.exists(SESSION_FILE):
-            return None
-            
         try:
             # 1. Son kullanıcıyı öğren
-            with open(SESSION_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                user = data.get("last_user")
+            data = open_document(SESSION_FILE, indent=None).load()
+            if not data:
+                return None
+            user = data.get("last_user")
                 
             if not user:
                 return None
@@ -102,27 +101,27 @@ class SessionManager:
     def clear_session() -> None:
         """Kayıtlı oturumu ve profil verilerini tamamen siler."""
         try:
-            user = None
             # Şu anki kayıtlı kullanıcıyı bul
-            if os.path.exists(SESSION_FILE):
-                with open(SESSION_FILE, 'r', encoding='utf-8') as f:
-                    try:
-                        data = json.load(f)
-                        user = data.get("last_user")
-                    except json.JSONDecodeError:
-                        pass
+            session_store = open_document(SESSION_FILE, indent=None)
+            data = session_store.load() or {}
+            user = data.get("last_user")
                 
-                # Oturum dosyasını sil
-                os.remove(SESSION_FILE)
+            # Oturum kaydını sil
+            session_store.delete()
             
-            # Profil dosyasını sil
-            if os.path.exists(PROFILE_FILE):
+            # Profil verilerini sil
+            profile_storage = ProfileStorageService(PROFILE_FILE)
+            if profile_storage.has_profile_data():
                 try:
-                    os.remove(PROFILE_FILE)
+                    profile_storage.delete_profile_data()
                     logging.info("Profil verileri (profile.json) temizlendi.")
-                except OSError as e:
+                except Exception as e:
                     logging.error(f"Profil dosyası silinirken hata oluştu: {e}")
 
+            # Kayıtlı tarayıcı oturumunu (çerezler) sil
+            if user:
+                SessionStateStore(APPDATA_DIR).clear(user)
+
             # Kasadan şifreyi sil
             if user:
                 try:
@@ -0,0 +1,113 @@
+"""
+BU DOSYA: OBIS'e giriş yapılmış tarayıcı oturumunun (ASP.NET çerezleri)
+Playwright storage state olarak şifreli saklanmasından sorumludur.
+Şifreleme Windows DPAPI (CryptProtectData) ile yapılır; veri yalnızca
+aynı Windows kullanıcısı tarafından çözülebilir.
+"""
+
+import ctypes
+import ctypes.wintypes
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from utils.system import get_user_data_dir
+
+
+class _DataBlob(ctypes.Structure):
+    """DPAPI DATA_BLOB yapısı."""
+    _fields_ = [
+        ("cbData", ctypes.wintypes.DWORD),
+        ("pbData", ctypes.POINTER(ctypes.c_char))
+    ]
+
+
+def _dpapi_available() -> bool:
+    return os.name == 'nt' and hasattr(ctypes, "windll")
+
+
+def _dpapi_call(data: bytes, protect: bool) -> bytes:
+    """CryptProtectData / CryptUnprotectData çağrısını yapar."""
+    buffer = ctypes.create_string_buffer(data, len(data))
+    blob_in = _DataBlob(len(data), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char)))
+    blob_out = _DataBlob()
+
+    crypt32 = ctypes.windll.crypt32
+    func = crypt32.CryptProtectData if protect else crypt32.CryptUnprotectData
+    # CRYPTPROTECT_UI_FORBIDDEN = 0x01
+    if not func(ctypes.byref(blob_in), None, None, None, None, 0x01, ctypes.byref(blob_out)):
+        raise OSError("DPAPI işlemi başarısız oldu.")
+
+    try:
+        return ctypes.string_at(blob_out.pbData, blob_out.cbData)
+    finally:
+        ctypes.windll.kernel32.LocalFree(blob_out.pbData)
+
+
+class SessionStateStore:
+    """
+    Giriş yapılmış context'in storage state'ini ve ana sayfa adresini
+    kullanıcı bazında şifreli dosyada tutar.
+    """
+
+    def __init__(self, base_dir: Optional[str] = None):
+        self.base_dir = base_dir or get_user_data_dir()
+
+    def _path_for(self, student_id: str) -> str:
+        safe_id = re.sub(r"[^0-9A-Za-z_-]", "_", student_id)
+        return os.path.join(self.base_dir, f"browser_state_{safe_id}.bin")
+
+    def load(self, student_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Kayıtlı oturumu çözer.
+
+        Returns:
+            {"storage_state": dict, "home_url": str, "saved_at": str} veya None
+        """
+        path = self._path_for(student_id)
+        if not _dpapi_available() or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                raw = _dpapi_call(f.read(), protect=False)
+            data = json.loads(raw.decode('utf-8'))
+            if not data.get("storage_state") or not data.get("home_url"):
+                return None
+            return data
+        except Exception as e:
+            logging.warning(f"Kayıtlı tarayıcı oturumu okunamadı, siliniyor: {e}")
+            self.clear(student_id)
+            return None
+
+    def save(self, student_id: str, storage_state: Dict[str, Any], home_url: str) -> bool:
+        """Storage state'i DPAPI ile şifreleyip dosyaya yazar."""
+        if not _dpapi_available():
+            return False
+
+        try:
+            payload = json.dumps({
+                "storage_state": storage_state,
+                "home_url": home_url,
+                "saved_at": datetime.now().isoformat()
+            }).encode('utf-8')
+
+            with open(self._path_for(student_id), 'wb') as f:
+                f.write(_dpapi_call(payload, protect=True))
+            logging.info("Tarayıcı oturumu şifreli olarak kaydedildi.")
+            return True
+        except Exception as e:
+            logging.error(f"Tarayıcı oturumu kaydedilemedi: {e}")
+            return False
+
+    def clear(self, student_id: str) -> None:
+        """Kullanıcının kayıtlı tarayıcı oturumunu siler."""
+        path = self._path_for(student_id)
+        if os.path.exists(path):
+            try:
+                os.remove(path)
+            except OSError as e:
+                logging.error(f"Tarayıcı oturum dosyası silinemedi: {e}")
@@ -0,0 +1,332 @@
+"""
+BU DOSYA: Not, profil, ayar ve oturum verileri için tek bir SQLite veritabanı
+(WAL modu) arka ucunu barındırır. OBIS_STORAGE_BACKEND=sqlite ile etkinleşir
+(bkz. services/storage.py); varsayılan arka uç JSON dosyalarıdır.
+
+Veritabanı: %LOCALAPPDATA%/OBISNotifier/obis.db
+    - grade_snapshots : Not dosyası başına son kaydın zamanı, dönemi ve parmak izi
+    - grade_rows      : Derslerin satırları (doc + sıra ile anahtarlı, ders anahtarı ile dizinli)
+    - documents / document_values : settings.json, profile.json vb. belgeler (üst düzey anahtar başına bir satır)
+    - imported        : JSON dosyasından bir kez içe aktarılmış belgeler
+
+Her belge, karşılık geldiği JSON dosyasının veri dizinine göre yolu ile anahtarlanır
+(örn. "settings.json", "hesap_1/grades_data_24_25_Güz.json"). Belge veritabanında
+yoksa ve JSON dosyası varsa ilk erişimde bir kez içe aktarılır (içe aktarma işareti ve
+veri aynı transaction'da yazılır). Yazmalar transaction içinde yapılır ve yalnızca
+değişen satırlara dokunur.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from services.grade_record import GradeRecord
+from utils.system import get_user_data_dir
+
+SQLITE_DB_FILE = "obis.db"
+
+# PRAGMA user_version ile tutulan şema sürümü
+# 1: grade_rows birincil anahtarı (doc, course_key) -> (doc, position); aynı anahtarlı dersler birleşmez
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS grade_snapshots (
+    doc TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    semester TEXT,
+    fingerprint TEXT
+);
+CREATE TABLE IF NOT EXISTS grade_rows (
+    doc TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    course_key TEXT NOT NULL,
+    course TEXT NOT NULL,
+    exams TEXT NOT NULL,
+    letter TEXT NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (doc, position)
+);
+CREATE INDEX IF NOT EXISTS idx_grade_rows_doc_course_key ON grade_rows (doc, course_key);
+CREATE TABLE IF NOT EXISTS documents (
+    doc TEXT PRIMARY KEY,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS document_values (
+    doc TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (doc, key)
+);
+CREATE TABLE IF NOT EXISTS imported (
+    doc TEXT PRIMARY KEY,
+    imported_at TEXT NOT NULL
+);
+"""
+
+# Sürüm 0 veritabanındaki grade_rows tablosu yeni şemaya kopyalanır
+_MIGRATE_GRADE_ROWS_V0 = """
+ALTER TABLE grade_rows RENAME TO grade_rows_v0;
+{schema}
+INSERT OR REPLACE INTO grade_rows (doc, position, course_key, course, exams, letter, result)
+    SELECT doc, position, course_key, course, exams, letter, result FROM grade_rows_v0;
+DROP TABLE grade_rows_v0;
+"""
+
+
+class SQLiteStore:
+    """Tek bağlantılı, thread-safe SQLite veritabanı (WAL modu)."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.base_dir = os.path.dirname(os.path.abspath(db_path))
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=5.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        """Tabloları oluşturur; eski sürümlü veritabanını tek transaction'da yükseltir."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        script = _SCHEMA
+        if version < 1 and self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'grade_rows'").fetchone():
+            script = _MIGRATE_GRADE_ROWS_V0.format(schema=_SCHEMA)
+            logging.info("SQLite veri deposu şeması güncelleniyor (grade_rows).")
+        try:
+            self._conn.executescript(f"BEGIN IMMEDIATE;{script}PRAGMA user_version = {SCHEMA_VERSION};COMMIT;")
+        except sqlite3.Error:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            raise
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yazma transaction'ı; hata olursa tüm değişiklikler geri alınır."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def doc_key(self, file_path: str) -> str:
+        """JSON dosya yolunu belge anahtarına çevirir (veri dizini içindeyse göreli yol)."""
+        path = os.path.abspath(file_path)
+        try:
+            relative = os.path.relpath(path, self.base_dir)
+        except ValueError:  # Windows: farklı sürücü
+            return path.replace(os.sep, "/")
+        return (path if relative.startswith("..") else relative).replace(os.sep, "/")
+
+    def is_imported(self, doc: str) -> bool:
+        return bool(self.query("SELECT 1 FROM imported WHERE doc = ?", (doc,)))
+
+    @staticmethod
+    def claim_import(conn: sqlite3.Connection, doc: str) -> bool:
+        """
+        Belge daha önce içe aktarılmadıysa işaretler ve True döner (her belge yalnızca bir kez).
+        İçe aktarılan veriyle aynı transaction içinde çağrılmalıdır; yazma başarısız olursa işaret de geri alınır.
+        """
+        cursor = conn.execute("INSERT OR IGNORE INTO imported (doc, imported_at) VALUES (?, ?)",
+                              (doc, datetime.now().isoformat()))
+        return cursor.rowcount == 1
+
+
+_stores: Dict[str, SQLiteStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_sqlite_store(db_path: Optional[str] = None) -> SQLiteStore:
+    """Veritabanı başına tek SQLiteStore örneğini döner."""
+    path = os.path.abspath(db_path or os.path.join(get_user_data_dir(), SQLITE_DB_FILE))
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = SQLiteStore(path)
+            logging.info(f"SQLite veri deposu açıldı: {path}")
+        return _stores[path]
+
+
+def _read_json_file(file_path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(file_path):
+        return None
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        logging.error(f"İçe aktarılacak JSON dosyası okunamadı ({file_path}): {e}")
+        return None
+
+
+class SQLiteGradeStorageService:
+    """GradeStorageService ile aynı arayüz; notları SQLite'ta dönem dosyası başına saklar."""
+
+    def __init__(self, file_path: str, store: Optional[SQLiteStore] = None):
+        self.file_path = file_path
+        self.store = store or get_sqlite_store()
+        self.doc = self.store.doc_key(file_path)
+        self._migrate_json()
+
+    def _migrate_json(self) -> None:
+        """Eski JSON kaydını (varsa) bir kez, işaretle aynı transaction'da içe aktarır."""
+        if not os.path.exists(self.file_path) or self.store.is_imported(self.doc):
+            return
+        data = _read_json_file(self.file_path)
+        with self.store.transaction() as conn:
+            if not self.store.claim_import(conn, self.doc):
+                return
+            if isinstance(data, dict) and isinstance(data.get("grades"), list):
+                grades = [GradeRecord.from_dict(grade) for grade in data["grades"]]
+                self._write_rows(conn, grades, data.get("semester"), data.get("fingerprint"), data.get("timestamp"))
+                logging.info(f"Not kaydı SQLite'a aktarıldı: {self.doc}")
+
+    def get_fingerprint(self) -> Optional[str]:
+        rows = self.store.query("SELECT fingerprint FROM grade_snapshots WHERE doc = ?", (self.doc,))
+        return rows[0][0] if rows else None
+
+    def load_previous_grades(self) -> Optional[Dict[str, Any]]:
+        try:
+            snapshot = self.store.query(
+                "SELECT timestamp, semester, fingerprint FROM grade_snapshots WHERE doc = ?", (self.doc,))
+            if not snapshot:
+                return None
+            rows = self.store.query(
+                "SELECT course, exams, letter, result, course_key FROM grade_rows WHERE doc = ? ORDER BY position",
+                (self.doc,))
+        except sqlite3.Error as e:
+            logging.error(f"Önceki notlar yüklenemedi: {str(e)}")
+            return None
+
+        timestamp, semester, fingerprint = snapshot[0]
+        data: Dict[str, Any] = {"timestamp": timestamp, "grades": [GradeRecord(*row) for row in rows]}
+        if semester:
+            data["semester"] = semester
+        if fingerprint:
+            data["fingerprint"] = fingerprint
+        return data
+
+    def save_grades(self, grades: List[GradeRecord], semester: Optional[str] = None,
+                    fingerprint: Optional[str] = None) -> bool:
+        try:
+            if self._write(grades, semester, fingerprint):
+                logging.info("Notlar başarıyla veritabanına kaydedildi.")
+            else:
+                logging.debug("Notlar değişmedi, kayıt atlandı.")
+            return True
+        except sqlite3.Error as e:
+            logging.error(f"Notlar kaydedilemedi: {str(e)}")
+            return False
+
+    def _write(self, grades: List[GradeRecord], semester: Optional[str], fingerprint: Optional[str]) -> bool:
+        """Notları tek transaction'da yazar; hiçbir şey değişmediyse False döner."""
+        with self.store.transaction() as conn:
+            return self._write_rows(conn, grades, semester, fingerprint)
+
+    def _write_rows(self, conn: sqlite3.Connection, grades: List[GradeRecord], semester: Optional[str],
+                    fingerprint: Optional[str], timestamp: Optional[str] = None) -> bool:
+        """
+        Yalnızca değişen/eklenen satırları (sıraya göre) yazar, listeden çıkanları siler.
+        Aynı ders anahtarına sahip satırlar JSON kaydındaki gibi ayrı ayrı saklanır.
+        Hiçbir şey değişmediyse kayda dokunmaz ve False döner.
+        """
+        snapshot = conn.execute("SELECT semester, fingerprint FROM grade_snapshots WHERE doc = ?",
+                                (self.doc,)).fetchone()
+        existing = {
+            row[0]: row[1:]
+            for row in conn.execute(
+                "SELECT position, course_key, course, exams, letter, result FROM grade_rows WHERE doc = ?",
+                (self.doc,))
+        }
+        changed = []
+        for position, grade in enumerate(grades):
+            values = (grade.key, grade.course, grade.exams, grade.letter, grade.result)
+            if existing.pop(position, None) != values:
+                changed.append((self.doc, position) + values)
+
+        if not changed and not existing and snapshot == (semester, fingerprint):
+            return False
+
+        conn.execute(
+            "INSERT OR REPLACE INTO grade_snapshots (doc, timestamp, semester, fingerprint) VALUES (?, ?, ?, ?)",
+            (self.doc, timestamp or datetime.now().isoformat(), semester, fingerprint))
+        if changed:
+            conn.executemany(
+                "INSERT OR REPLACE INTO grade_rows (doc, position, course_key, course, exams, letter, result) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", changed)
+        if existing:
+            conn.executemany("DELETE FROM grade_rows WHERE doc = ? AND position = ?",
+                             [(self.doc, position) for position in existing])
+        return True
+
+
+class SQLiteDocumentStorage:
+    """JSONDocumentStorage ile aynı arayüz; belgeyi üst düzey anahtar başına bir satır olarak saklar."""
+
+    def __init__(self, file_path: str, store: Optional[SQLiteStore] = None):
+        self.file_path = file_path
+        self.store = store or get_sqlite_store()
+        self.doc = self.store.doc_key(file_path)
+        self._migrate_json()
+
+    def _migrate_json(self) -> None:
+        if not os.path.exists(self.file_path) or self.store.is_imported(self.doc):
+            return
+        data = _read_json_file(self.file_path)
+        try:
+            with self.store.transaction() as conn:
+                if self.store.claim_import(conn, self.doc) and isinstance(data, dict):
+                    self._save_values(conn, data)
+                    logging.info(f"Belge SQLite'a aktarıldı: {self.doc}")
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logging.error(f"Belge SQLite'a aktarılamadı ({self.doc}): {e}")
+
+    def exists(self) -> bool:
+        return bool(self.store.query("SELECT 1 FROM documents WHERE doc = ?", (self.doc,)))
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            if not self.exists():
+                return None
+            rows = self.store.query("SELECT key, value FROM document_values WHERE doc = ?", (self.doc,))
+            return {key: json.loads(value) for key, value in rows}
+        except (sqlite3.Error, ValueError) as e:
+            logging.error(f"Belge okunamadı ({self.doc}): {e}")
+            return None
+
+    def save(self, data: Dict[str, Any]) -> bool:
+        """Yalnızca değeri değişen anahtarları yazar, belgeden çıkan anahtarları siler."""
+        try:
+            with self.store.transaction() as conn:
+                self._save_values(conn, data)
+            return True
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logging.error(f"Belge kaydedilemedi ({self.doc}): {e}")
+            return False
+
+    def _save_values(self, conn: sqlite3.Connection, data: Dict[str, Any]) -> None:
+        encoded = {key: json.dumps(value, ensure_ascii=False) for key, value in data.items()}
+        conn.execute("INSERT OR REPLACE INTO documents (doc, updated_at) VALUES (?, ?)",
+                     (self.doc, datetime.now().isoformat()))
+        existing = dict(conn.execute("SELECT key, value FROM document_values WHERE doc = ?", (self.doc,)))
+        changed = [(self.doc, key, value) for key, value in encoded.items() if existing.get(key) != value]
+        removed = [(self.doc, key) for key in existing if key not in encoded]
+        if changed:
+            conn.executemany("INSERT OR REPLACE INTO document_values (doc, key, value) VALUES (?, ?, ?)", changed)
+        if removed:
+            conn.executemany("DELETE FROM document_values WHERE doc = ? AND key = ?", removed)
+
+    def delete(self) -> None:
+        with self.store.transaction() as conn:
+            conn.execute("DELETE FROM document_values WHERE doc = ?", (self.doc,))
+            conn.execute("DELETE FROM documents WHERE doc = ?", (self.doc,))
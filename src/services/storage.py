@@ -1,78 +1,319 @@
 """
 BU DOSYA: Not verilerinin ve kullanıcı profil bilgilerinin JSON formatında dosyaya kaydedilmesi
 ve okunmasından sorumludur. Data Persistence (Veri Kalıcılığı) katmanıdır.
+OBIS_STORAGE_BACKEND=sqlite ile aynı arayüzler tek bir SQLite veritabanına yazar.
 """
 
 import json
 import os
+import re
+import shutil
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+from services.grade_record import GradeRecord
+from services.sqlite_store import SQLiteDocumentStorage, SQLiteGradeStorageService
+
+# Dönem bazlı kayıt öncesi tek dosyalı eski kayıt adı
+LEGACY_GRADES_FILE = "grades_data.json"
+
+
+def semester_grades_path(data_dir: str, semester: str) -> str:
+    """Örn: '24/25 Güz' -> <data_dir>/grades_data_24_25_Güz.json"""
+    slug = re.sub(r"\W+", "_", semester).strip("_")
+    return os.path.join(data_dir, f"grades_data_{slug}.json")
+
+
+def migrate_legacy_grades_file(data_dir: str, semester: str) -> None:
+    """
+    Eski tek dosyalı kaydı (grades_data.json) verilen dönemin dosyasına taşır.
+    Böylece güncelleme sonrası ilk döngü 'İlk kontrol' olarak işlenmez.
+    """
+    legacy_path = os.path.join(data_dir, LEGACY_GRADES_FILE)
+    target_path = semester_grades_path(data_dir, semester)
+    if os.path.exists(legacy_path) and not os.path.exists(target_path):
+        try:
+            os.replace(legacy_path, target_path)
+            logging.info(f"Eski not kaydı '{semester}' dönemine taşındı.")
+        except OSError as e:
+            logging.error(f"Eski not kaydı taşınamadı: {e}")
+
+
+def atomic_write_json(file_path: str, data: Any, indent: Optional[int] = 2, ensure_ascii: bool = False) -> None:
+    """
+    JSON'u önce geçici dosyaya yazar, diske zorlar (fsync) ve hedefin üzerine taşır.
+    Yazma yarıda kalırsa hedef dosya eski haliyle kalır; hata çağırana iletilir.
+    """
+    tmp_path = file_path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class GradeStorageService:
-    """Notları dosyaya (JSON) kaydeder ve okur."""
+    """
+    Notları dosyaya (JSON) kaydeder ve okur.
+    GradeRecord <-> Türkçe anahtarlı sözlük dönüşümü yalnızca burada yapılır.
+
+    Kayıt yalnızca içerik değiştiğinde yazılır (geçici dosya + fsync + yeniden adlandırma).
+    Üzerine yazılan sağlam kayıt <dosya>.bak olarak saklanır; ana dosya bozuksa
+    veya eksikse notlar otomatik olarak bu yedekten yüklenir.
+
+    Son kayıt bellekte tutulur ve dosyanın (mtime, boyut) değeriyle anahtarlanır;
+    dosya dışarıdan değiştirilmedikçe tekrar okunup ayrıştırılmaz.
+    """
     
     def __init__(self, file_path: str):
         self.file_path = file_path
+        self.backup_path = file_path + ".bak"
+        # ((mtime_ns, boyut), kayıt) — dosya değişmedikçe kayıt diskten yeniden okunmaz
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        # Diskteki kaydın içeriği (notlar, dönem, parmak izi) — değişmeyen kayıt yeniden yazılmaz
+        self._saved_state: Optional[Tuple[Tuple[GradeRecord, ...], Optional[str], Optional[str]]] = None
+        # Ana dosya okunabilir durumdaysa True; bozuk dosya yedeğin yerine geçmemeli
+        self._primary_valid: bool = False
+
+    def get_fingerprint(self) -> Optional[str]:
+        """Son kaydedilen tablonun parmak izini döner (kayıt yoksa veya eski formattaysa None)."""
+        data = self._load_snapshot()
+        return data.get("fingerprint") if data else None
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        return {"hits": self.cache_hits, "misses": self.cache_misses}
 
     def load_previous_grades(self) -> Optional[Dict[str, Any]]:
         """
-        Daha önce kaydedilmiş notları dosyadan okur.
-        Dosya yoksa veya bozuksa None döner ve hatayı loglar.
+        Daha önce kaydedilmiş notları okur ("grades" GradeRecord listesi olarak döner).
+        Ana dosya bozuksa yedekten okur; ikisi de yoksa veya bozuksa None döner ve hatayı loglar.
         """
+        data = self._load_snapshot()
+        if data is None:
+            return None
+        # Önbellekteki kayıt çağıranın değişikliklerinden etkilenmesin
+        copy = dict(data)
+        if isinstance(copy.get("grades"), list):
+            copy["grades"] = list(copy["grades"])
+        return copy
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Kaydı önbellekten veya (dosya değiştiyse) diskten okur; dönen sözlük değiştirilmemelidir."""
+        signature = self._file_signature()
+        if signature is not None and self._cache is not None and self._cache[0] == signature:
+            self.cache_hits += 1
+            return self._cache[1]
+
+        self.cache_misses += 1
+        self._cache = None
+        data = self._read()
+        if data and isinstance(data.get("grades"), list):
+            try:
+                data["grades"] = [GradeRecord.from_dict(grade) for grade in data["grades"]]
+            except (AttributeError, TypeError) as e:
+                logging.error(f"Önceki notlar yüklenemedi: {str(e)}")
+                return None
+            # Yalnızca ana dosyadan okunan kayıt diskteki kayıt sayılır; yedekten okunduysa
+            # bir sonraki kayıt (notlar aynı olsa bile) bozuk ana dosyayı onarır
+            if self._primary_valid:
+                self._saved_state = (tuple(data["grades"]), data.get("semester"), data.get("fingerprint"))
+                if signature is not None:
+                    self._cache = (signature, data)
+        return data
+
+    @staticmethod
+    def _read_snapshot_file(path: str) -> Dict[str, Any]:
+        """Kayıt dosyasını okur; geçerli JSON olsa bile sözlük değilse bozuk sayılır (ValueError)."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"Not kaydı beklenen yapıda değil: {os.path.basename(path)}")
+        return data
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        """Kayıt dosyasını ham JSON olarak okur; okunamazsa son sağlam yedeğe döner."""
+        self._primary_valid = False
         if os.path.exists(self.file_path):
             try:
-                with open(self.file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                data = self._read_snapshot_file(self.file_path)
+                self._primary_valid = True
+                return data
             except Exception as e:
                 logging.error(f"Önceki notlar yüklenemedi: {str(e)}")
-                return None
+
+        if os.path.exists(self.backup_path):
+            try:
+                data = self._read_snapshot_file(self.backup_path)
+                logging.warning(f"Not kaydı okunamadı, son sağlam yedek kullanılıyor: {os.path.basename(self.backup_path)}")
+                return data
+            except Exception as e:
+                logging.error(f"Not kaydı yedeği de okunamadı: {str(e)}")
         return None
     
-    def save_grades(self, grades: List[Dict[str, str]]) -> bool:
+    def _primary_readable(self) -> bool:
+        """Ana dosya geçerli bir kayıt olarak okunabiliyorsa True (hata loglanmaz; yükleme sırasında zaten loglandı)."""
+        try:
+            self._read_snapshot_file(self.file_path)
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def _backup_primary(self) -> None:
+        """Ana dosyayı geçici dosya üzerinden <dosya>.bak olarak kopyalar (yarım kalan kopya yedeği bozmaz)."""
+        tmp_path = self.backup_path + ".tmp"
+        try:
+            shutil.copy2(self.file_path, tmp_path)
+            os.replace(tmp_path, self.backup_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def save_grades(self, grades: List[GradeRecord], semester: Optional[str] = None,
+                    fingerprint: Optional[str] = None) -> bool:
         """
         Mevcut notları timestamp (zaman damgası) ile dosyaya kaydeder.
+        İçerik diskteki kayıtla aynıysa dosyaya dokunulmaz.
         
         Args:
             grades: Kaydedilecek not listesi
+            semester: Notların ait olduğu dönem (varsa kayda eklenir)
+            fingerprint: Notların okunduğu tablonun parmak izi (bkz. GradeService.fingerprint_rows)
         """
+        state = (tuple(grades), semester, fingerprint)
+        if state == self._saved_state:
+            logging.debug("Notlar değişmedi, kayıt atlandı.")
+            return True
+
         try:
-            data = {
+            data: Dict[str, Any] = {
                 "timestamp": datetime.now().isoformat(),
-                "grades": grades
+                "grades": [grade.to_dict() for grade in grades]
             }
+            if semester:
+                data["semester"] = semester
+            if fingerprint:
+                data["fingerprint"] = fingerprint
+
+            if self._saved_state is None:
+                self._primary_valid = self._primary_readable()  # Ana dosyanın sağlam olup olmadığını öğren
+            # Sağlam ana dosya yedeğe kopyalanır (ana dosya hiçbir an eksik kalmaz);
+            # bozuk dosya mevcut yedeği ezmez
+            if self._primary_valid:
+                self._backup_primary()
             # ensure_ascii=False -> Türkçe karakterlerin bozulmamasını sağlar
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            atomic_write_json(self.file_path, data, indent=2, ensure_ascii=False)
+
+            self._primary_valid = True
+            self._saved_state = state
+            data["grades"] = list(grades)
+            signature = self._file_signature()
+            self._cache = (signature, data) if signature is not None else None
             logging.info("Notlar başarıyla dosyaya kaydedildi.")
             return True
         except Exception as e:
             logging.error(f"Notlar kaydedilemedi: {str(e)}")
             return False
 
+class JSONDocumentStorage:
+    """Tek bir JSON belgesini (settings.json, session.json, profile.json) dosya olarak okur ve yazar."""
+
+    def __init__(self, file_path: str, indent: Optional[int] = 4, ensure_ascii: bool = True):
+        self.file_path = file_path
+        self.indent = indent
+        self.ensure_ascii = ensure_ascii
+
+    def exists(self) -> bool:
+        return os.path.exists(self.file_path)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Belgeyi okur. Dosya yoksa None döner; bozuksa hatayı loglar ve None döner."""
+        if not os.path.exists(self.file_path):
+            return None
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logging.error(f"Dosya okunamadı ({os.path.basename(self.file_path)}): {str(e)}")
+            return None
+
+    def save(self, data: Dict[str, Any]) -> bool:
+        try:
+            os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+            atomic_write_json(self.file_path, data, indent=self.indent, ensure_ascii=self.ensure_ascii)
+            return True
+        except Exception as e:
+            logging.error(f"Dosya kaydedilemedi ({os.path.basename(self.file_path)}): {str(e)}")
+            return False
+
+    def delete(self) -> None:
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+
+# ================= ARKA UÇ SEÇİMİ =================
+
+# "json" (varsayılan): her belge kendi dosyasında | "sqlite": tek veritabanı (bkz. services/sqlite_store.py)
+STORAGE_BACKEND_ENV = "OBIS_STORAGE_BACKEND"
+
+
+def get_storage_backend() -> str:
+    """Ortam değişkeninden kayıt arka ucunu okur (bilinmeyen değerlerde "json")."""
+    backend = os.getenv(STORAGE_BACKEND_ENV, "json").strip().lower()
+    return backend if backend in ("json", "sqlite") else "json"
+
+
+def create_grade_storage(file_path: str) -> Union[GradeStorageService, SQLiteGradeStorageService]:
+    """Seçili arka uca göre not kayıt servisini oluşturur (GradeStorageService arayüzü)."""
+    if get_storage_backend() == "sqlite":
+        return SQLiteGradeStorageService(file_path)
+    return GradeStorageService(file_path)
+
+
+def open_document(file_path: str, indent: Optional[int] = 4,
+                  ensure_ascii: bool = True) -> Union[JSONDocumentStorage, SQLiteDocumentStorage]:
+    """Seçili arka uca göre belge deposunu döner (JSONDocumentStorage arayüzü)."""
+    if get_storage_backend() == "sqlite":
+        return SQLiteDocumentStorage(file_path)
+    return JSONDocumentStorage(file_path, indent=indent, ensure_ascii=ensure_ascii)
+
+
 class ProfileStorageService:
-    """Kullanıcı profil ve mezuniyet bilgilerini JSON olarak kaydeder ve okur."""
+    """Kullanıcı profil ve mezuniyet bilgilerini kaydeder ve okur (JSON dosyası veya SQLite)."""
     
     def __init__(self, file_path: str):
         self.file_path = file_path
+        self._document = open_document(file_path, indent=4, ensure_ascii=False)
+
+    def has_profile_data(self) -> bool:
+        return self._document.exists()
 
     def load_profile_data(self) -> Optional[Dict[str, Any]]:
-        """Dosyadan profil verilerini okur. Yoksa None döner."""
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logging.error(f"Profil verileri yüklenemedi: {str(e)}")
-                return None
-        return None
+        """Profil verilerini okur. Yoksa None döner."""
+        return self._document.load()
     
     def save_profile_data(self, profile_data: Dict[str, Any]) -> bool:
-        """Profil verilerini dosyaya yazar."""
-        try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(profile_data, f, indent=4, ensure_ascii=False)
-            return True
-        except Exception as e:
-            logging.error(f"Profil verileri kaydedilemedi: {str(e)}")
-            return False
\ No newline at end of file
+        """Profil verilerini kaydeder."""
+        return self._document.save(profile_data)
+
+    def delete_profile_data(self) -> None:
+        self._document.delete()
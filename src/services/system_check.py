@@ -2,16 +2,422 @@
 BU DOSYA: Uygulamanın Playwright tarayıcı altyapısını kontrol eden 
 ve indirme sürecini UI'yı dondurmadan yöneten QThread Sınıfını barındırır.
 Ayrıca Playwright CLI üzerinden doğrudan indirme ve kontrol mantıklarını içerir.
+
+Başarılı bir doğrulamadan sonra PLAYWRIGHT_BROWSERS_PATH altına bir kurulum kaydı
+(manifest) yazılır. Sonraki açılışlarda tarayıcıları başlatmak yerine bu kayıttaki
+Playwright sürümü ve çalıştırılabilir dosya damgaları (boyut + değişiklik zamanı)
+dosya sisteminden doğrulanır; kayıt yoksa veya eskidiyse başlatma testi yapılır.
+
+Eksik tarayıcılar paralel kurulum süreçleriyle hazırlık klasörlerine indirilir
+(tarayıcıların paylaştığı parçalar, örn. ffmpeg, önceden bir kez iner), ilerleme
+(MiB / yüzde) durum mesajı olarak iletilir ve tamamlanan klasörler asıl
+Playwright klasörüne taşınır. Yarım kalan kurulum sonraki açılışta devam eder.
 """
 
+import json
 import logging
 import os
-import sys
+import re
+import shutil
 import subprocess
+import sys
+import threading
+from importlib import metadata
+from typing import Callable, Dict, List, Optional
 from PyQt6.QtCore import pyqtSignal, QThread
 from playwright.sync_api import sync_playwright
+from services.storage import atomic_write_json
+
+# EXE ortamında paket metadata'sı bulunmayabilir; sürüm Playwright'ın kendi modülünden okunur
+try:
+    from playwright._repo_version import version as _PLAYWRIGHT_REPO_VERSION
+except ImportError:
+    _PLAYWRIGHT_REPO_VERSION = "unknown"
+
+# EXE ortamında `python -m playwright` çalışmadığından paketle gelen driver'ın yolu gerekir
+try:
+    from playwright._impl._driver import compute_driver_executable
+except ImportError:
+    compute_driver_executable = None
+
+_active_processes: List[subprocess.Popen] = []  # Kurulum sırasında iptal edilirse durdurabilmek için
+
+REQUIRED_BROWSERS = ("chromium", "firefox")
+INSTALL_MANIFEST_NAME = "obis_install_manifest.json"
+INSTALL_MANIFEST_VERSION = 1
+# Playwright'ın tamamlanmış tarayıcı klasörüne yazdığı işaret dosyası
+INSTALL_COMPLETE_MARKER = "INSTALLATION_COMPLETE"
+# Kurulumun indirildiği ortak hazırlık klasörü (PLAYWRIGHT_BROWSERS_PATH altında)
+STAGING_DIR_NAME = ".staging"
+# Etkileşimsiz (TTY olmayan) kurulum çıktısı:
+#   "Downloading Chromium 131.0.6778.33 (playwright build v1148) from https://..."
+#   "|■■■■    |  40% of 150.4 MiB"
+#   "Downloading FFmpeg (playwright ffmpeg v1013) from https://..."
+_DOWNLOAD_RE = re.compile(r"^Downloading (.+?)(?: v?[\d.]+)? \(?playwright ")
+_PROGRESS_RE = re.compile(r"(\d+)% of ([\d.]+) MiB")
+# "install --dry-run" çıktısı:
+#   "FFmpeg (playwright ffmpeg v1013)"
+#   "  Install location:    /.../ffmpeg-1013"
+_DRY_RUN_COMPONENT_RE = re.compile(r"\(playwright (\S+) v\d+\)\s*$")
+_DRY_RUN_LOCATION_RE = re.compile(r"^\s+Install location:\s+(.+?)\s*$")
+# Birden fazla tarayıcının paylaştığı bileşenlerin hazırlık klasörü (.staging altında)
+SHARED_STAGING_NAME = "shared"
+
+
+# ================= KURULUM KAYDI (MANIFEST) =================
+
+def _manifest_path() -> Optional[str]:
+    browsers_dir = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    return os.path.join(browsers_dir, INSTALL_MANIFEST_NAME) if browsers_dir else None
+
+
+def _playwright_version() -> str:
+    try:
+        return metadata.version("playwright")
+    except metadata.PackageNotFoundError:
+        return _PLAYWRIGHT_REPO_VERSION
+
+
+def _file_stamp(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def write_install_manifest(executables: Dict[str, str]) -> None:
+    """Doğrulanmış tarayıcıların revizyonunu, yolunu ve dosya damgasını kaydeder."""
+    path = _manifest_path()
+    if not path:
+        return
+    browsers_dir = os.path.dirname(path)
+    browsers = {}
+    for name, exe in executables.items():
+        rel = os.path.relpath(exe, browsers_dir)
+        browsers[name] = {
+            # Örn: "chromium_headless_shell-1248" (Playwright klasör adı revizyonu taşır)
+            "revision": rel.split(os.sep)[0],
+            "executable": exe,
+            **_file_stamp(exe)
+        }
+    manifest = {
+        "manifest_version": INSTALL_MANIFEST_VERSION,
+        "playwright_version": _playwright_version(),
+        "browsers": browsers
+    }
+    try:
+        atomic_write_json(path, manifest, indent=4)
+    except OSError as e:
+        logging.warning(f"Kurulum kaydı yazılamadı: {e}")
+
+
+def is_install_manifest_valid() -> bool:
+    """
+    Kurulum kaydını yalnızca dosya sistemi üzerinden doğrular (tarayıcı başlatılmaz).
+    Playwright sürümü değiştiyse, dosya silindiyse veya damgası tutmuyorsa False döner.
+    """
+    path = _manifest_path()
+    if not path or not os.path.exists(path):
+        return False
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("manifest_version") != INSTALL_MANIFEST_VERSION:
+            return False
+        if manifest.get("playwright_version") != _playwright_version():
+            logging.info("Playwright sürümü değişmiş, tarayıcılar yeniden doğrulanacak.")
+            return False
+        browsers = manifest.get("browsers", {})
+        for name in REQUIRED_BROWSERS:
+            entry = browsers.get(name)
+            if not entry or _file_stamp(entry["executable"]) != {"size": entry["size"], "mtime_ns": entry["mtime_ns"]}:
+                return False
+        return True
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def _probe_browsers(notify: Callable[[str], None]) -> Dict[str, str]:
+    """Her tarayıcıyı başlatıp kapatır; başlatılabilenlerin çalıştırılabilir dosya yolunu döner."""
+    found: Dict[str, str] = {}
+    try:
+        with sync_playwright() as p:
+            for name in REQUIRED_BROWSERS:
+                launcher = getattr(p, name)
+                try:
+                    launcher.launch(headless=True).close()
+                    found[name] = launcher.executable_path
+                except Exception:
+                    notify(f"{name.capitalize()} tarayıcısı bulunamadı.")
+    except Exception as e:
+        notify(f"Playwright başlatılamadı: {e}")
+    return found
+
+# ================= KURULUM =================
+
+class _InstallProgress:
+    """Tek bir bileşenin (tarayıcı, ffmpeg vb.) indirme ilerlemesi (MiB cinsinden)."""
+
+    def __init__(self):
+        self.total_mb: float = 0.0
+        self.pct: int = 0
+        self.finished: bool = False
+
+    @property
+    def downloaded_mb(self) -> float:
+        return self.total_mb * self.pct / 100
+
+
+def _install_command(args: List[str]) -> List[str]:
+    """
+    Playwright CLI kurulum komutu. Geliştirme ortamında herkese açık `python -m playwright`
+    giriş noktası kullanılır. EXE ortamında `-m` çalışmadığından paketle gelen driver
+    doğrudan çağrılır (Playwright sürümü requirements.txt'te sabitlenmiştir).
+    """
+    if not getattr(sys, 'frozen', False):
+        return [sys.executable, "-m", "playwright", "install", *args]
+
+    if compute_driver_executable is None:
+        raise Exception("Playwright driver bulunamadı, tarayıcılar kurulamıyor.")
+    driver = compute_driver_executable()
+    if isinstance(driver, (str, os.PathLike)):
+        driver = (driver,)
+    return [str(part) for part in driver] + ["install", *args]
+
+
+def _cli_kwargs(staging_dir: str) -> dict:
+    """Kurulum komutlarının hedefi `staging_dir` olacak şekilde ortak subprocess ayarları."""
+    env = os.environ.copy()
+    env["PLAYWRIGHT_BROWSERS_PATH"] = staging_dir
+    kwargs = {
+        "env": env,
+        "text": True,
+        "encoding": "utf-8",
+        "errors": "replace"
+    }
+    if os.name == 'nt':
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    return kwargs
+
+
+def _spawn_install(names: List[str], staging_dir: str) -> subprocess.Popen:
+    """Playwright CLI'ı verilen bileşenleri hazırlık klasörüne kurmak için başlatır."""
+    return subprocess.Popen(_install_command(names), stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, **_cli_kwargs(staging_dir))
+
+
+def _plan_components(name: str, staging_dir: str) -> Dict[str, str]:
+    """
+    `install --dry-run <tarayıcı>` çıktısından tarayıcının indireceği bileşenleri
+    {bileşen: klasör adı} olarak döner (örn. {"ffmpeg": "ffmpeg-1013"}). Hiçbir şey
+    indirilmez; okunamazsa boş sözlük döner.
+    """
+    try:
+        result = subprocess.run(_install_command(["--dry-run", name]), capture_output=True,
+                                timeout=60, **_cli_kwargs(staging_dir))
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.debug(f"playwright install --dry-run {name} çalıştırılamadı: {e}")
+        return {}
+    components: Dict[str, str] = {}
+    current: Optional[str] = None
+    for line in result.stdout.splitlines():
+        header = _DRY_RUN_COMPONENT_RE.search(line)
+        if header:
+            current = header.group(1)
+            continue
+        location = _DRY_RUN_LOCATION_RE.match(line)
+        if location and current:
+            components[current] = os.path.basename(location.group(1))
+            current = None
+    return components
+
+
+def _shared_components(names: List[str], staging_root: str) -> Dict[str, str]:
+    """Birden fazla eksik tarayıcının ihtiyaç duyduğu bileşenler (örn. ffmpeg)."""
+    if len(names) < 2:
+        return {}
+    seen: Dict[str, str] = {}
+    shared: Dict[str, str] = {}
+    for name in names:
+        for component, dirname in _plan_components(name, staging_root).items():
+            if component in seen:
+                shared[component] = dirname
+            seen[component] = dirname
+    return shared
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Aynı diskte dosyayı kopyalamak yerine sabit bağlantı (hard link) oluşturur."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _progress_message(progress: Dict[str, _InstallProgress]) -> str:
+    """Örn: 'İndiriliyor: Chromium tamamlandı | Firefox %40 (38.1 MiB)'"""
+    parts = []
+    for name, state in progress.items():
+        if state.finished:
+            parts.append(f"{name} tamamlandı")
+        else:
+            parts.append(f"{name} %{state.pct} ({state.downloaded_mb:.1f} MiB)")
+    return "İndiriliyor: " + " | ".join(parts)
+
+
+def _watch_install_output(proc: subprocess.Popen, progress: Dict[str, _InstallProgress],
+                          lock: threading.Lock, notify: Callable[[str], None]) -> None:
+    """
+    Kurulum çıktısındaki 'Downloading <bileşen> ...' ve '|■■■■   |  40% of 150.4 MiB'
+    satırlarından bileşen bazında ilerlemeyi okur. `progress` paralel kurulum
+    süreçleri arasında ortaktır; tek bir durum mesajında birleştirilir.
+    """
+    current: Optional[_InstallProgress] = None
+    for line in proc.stdout:
+        download = _DOWNLOAD_RE.match(line.strip())
+        if download:
+            with lock:
+                current = progress.setdefault(download.group(1), _InstallProgress())
+            continue
+        match = _PROGRESS_RE.search(line)
+        if not match or current is None:
+            if line.strip():
+                logging.debug(f"playwright install: {line.strip()}")
+            continue
+        with lock:
+            current.pct = int(match.group(1))
+            current.total_mb = float(match.group(2))
+            current.finished = current.pct >= 100
+            message = _progress_message(progress)
+        notify(message)
+
+
+def _is_complete(path: str) -> bool:
+    return os.path.exists(os.path.join(path, INSTALL_COMPLETE_MARKER))
+
+
+def _promote_staging(staging_dir: str, browsers_dir: str) -> None:
+    """Hazırlık klasöründe tamamlanan tarayıcı klasörlerini asıl Playwright klasörüne taşır."""
+    for entry in os.listdir(staging_dir):
+        src = os.path.join(staging_dir, entry)
+        if entry.startswith((".", "__")) or not os.path.isdir(src):
+            continue
+        if not _is_complete(src):
+            continue
+        dst = os.path.join(browsers_dir, entry)
+        if _is_complete(dst):
+            continue
+        shutil.rmtree(dst, ignore_errors=True)
+        shutil.move(src, dst)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _run_installs(jobs: Dict[str, List[str]], staging_root: str, browsers_dir: str,
+                  notify: Callable[[str], None]) -> None:
+    """
+    Her işi (`{hazırlık klasörü: bileşenler}`) kendi hazırlık klasörüne ayrı bir kurulum
+    süreciyle paralel indirir. Başarılı olanlar asıl klasöre taşınır; başarısız olanın
+    tamamlanmış parçaları hazırlık klasöründe kalır ve sonraki denemede atlanır.
+    """
+    progress: Dict[str, _InstallProgress] = {}
+    lock = threading.Lock()
+    running: Dict[str, subprocess.Popen] = {}
+    watchers: List[threading.Thread] = []
+    try:
+        for job, components in jobs.items():
+            staging_dir = os.path.join(staging_root, job)
+            os.makedirs(staging_dir, exist_ok=True)
+            proc = _spawn_install(components, staging_dir)
+            running[job] = proc
+            _active_processes.append(proc)
+            watcher = threading.Thread(target=_watch_install_output,
+                                       args=(proc, progress, lock, notify),
+                                       name=f"PlaywrightInstall-{job}", daemon=True)
+            watcher.start()
+            watchers.append(watcher)
+        results = {job: proc.wait() for job, proc in running.items()}
+        for watcher in watchers:
+            watcher.join(timeout=5)
+    except BaseException:
+        # İptal edildiyse süren indirmeler bırakılmaz
+        for proc in running.values():
+            proc.kill()
+        raise
+    finally:
+        for proc in running.values():
+            _active_processes.remove(proc)
+
+    failed = {job: ret for job, ret in results.items() if ret != 0}
+    for job in jobs:
+        if job not in failed:
+            _promote_staging(os.path.join(staging_root, job), browsers_dir)
+    if failed:
+        codes = ", ".join(f"{job}: {ret}" for job, ret in failed.items())
+        raise Exception(f"Playwright install başarısız oldu (Hata Kodu: {codes})")
+
+
+def _install_browsers(names: List[str], notify: Callable[[str], None]) -> None:
+    """
+    Eksik tarayıcıları paralel kurulum süreçleriyle indirir ve ilerlemeyi `notify` ile
+    bildirir. Tarayıcıların paylaştığı bileşenler (örn. ffmpeg) önce tek bir süreçle bir kez
+    indirilir ve her tarayıcının hazırlık klasörüne bağlanır; Playwright tamamlanmış
+    bileşeni yeniden indirmez. Yarıda kalan kurulumun tamamlanmış parçaları hazırlık
+    klasöründe kalır ve sonraki denemede atlanır.
+    """
+    browsers_dir = os.environ["PLAYWRIGHT_BROWSERS_PATH"]
+    staging_root = os.path.join(browsers_dir, STAGING_DIR_NAME)
+    os.makedirs(staging_root, exist_ok=True)
+
+    shared = _shared_components(names, staging_root)
+    pending = [component for component, dirname in shared.items()
+               if not _is_complete(os.path.join(browsers_dir, dirname))]
+    if pending:
+        _run_installs({SHARED_STAGING_NAME: pending}, staging_root, browsers_dir, notify)
+
+    for name in names:
+        staging_dir = os.path.join(staging_root, name)
+        for dirname in shared.values():
+            src = os.path.join(browsers_dir, dirname)
+            dst = os.path.join(staging_dir, dirname)
+            if _is_complete(src) and not os.path.exists(dst):
+                shutil.copytree(src, dst, copy_function=_link_or_copy)
+
+    _run_installs({name: [name] for name in names}, staging_root, browsers_dir, notify)
+    shutil.rmtree(staging_root, ignore_errors=True)
+
+
+def terminate_install_processes() -> None:
+    """Süren kurulum süreçlerini (Node.js alt süreçleriyle birlikte) sonlandırır."""
+    for proc in list(_active_processes):
+        try:
+            if os.name == 'nt':
+                # Node.js gibi child processleri de (Process Tree) yokedebilmek için /T kullanıyoruz.
+                subprocess.run(
+                    ['taskkill', '/F', '/T', '/PID', str(proc.pid)],
+                    capture_output=True,
+                    creationflags=subprocess.CREATE_NO_WINDOW
+                )
+            else:
+                proc.kill()
+        except Exception:
+            pass
+
+
+def cleanup_incomplete_browsers() -> None:
+    """
+    Playwright klasöründe kurulumu tamamlanmamış (INSTALLATION_COMPLETE işareti olmayan)
+    tarayıcı klasörlerini siler. Tamamlanmış tarayıcılar ve hazırlık klasöründeki
+    tamamlanmış parçalar korunur; sonraki açılış kaldığı yerden devam eder.
+    """
+    browsers_dir = os.environ.get("PLAYWRIGHT_BROWSERS_PATH", "")
+    if not browsers_dir or not os.path.isdir(browsers_dir):
+        return
+    for entry in os.listdir(browsers_dir):
+        path = os.path.join(browsers_dir, entry)
+        if entry.startswith((".", "__")) or not os.path.isdir(path):
+            continue
+        if not os.path.exists(os.path.join(path, INSTALL_COMPLETE_MARKER)):
+            shutil.rmtree(path, ignore_errors=True)
+            logging.info(f"Yarım kalan tarayıcı klasörü temizlendi: {entry}")
 
-_active_process = None  # Kurulum sırasında iptal edilirse durdurabilmek için global değişken
 
 def ensure_browsers_installed(status_callback=None) -> bool:
     """
@@ -29,77 +435,30 @@ def ensure_browsers_installed(status_callback=None) -> bool:
         logging.info(msg)
     
     _notify("Tarayıcı bileşenleri kontrol ediliyor...")
+
+    # 0. Hızlı yol: Geçerli kurulum kaydı varsa tarayıcılar başlatılmaz
+    if is_install_manifest_valid():
+        _notify("Tüm tarayıcılar zaten yüklü.")
+        return True
     
     # 1. Kontrol: Hem Chromium hem Firefox başlatılabilir mi?
-    all_installed = True
-    try:
-        with sync_playwright() as p:
-            p.chromium.launch(headless=True).close()
-    except Exception:
-        _notify("Chromium tarayıcısı bulunamadı.")
-        all_installed = False
-    
-    try:
-        with sync_playwright() as p:
-            p.firefox.launch(headless=True).close()
-    except Exception:
-        _notify("Firefox tarayıcısı bulunamadı.")
-        all_installed = False
-    
-    if all_installed:
+    found = _probe_browsers(_notify)
+    if len(found) == len(REQUIRED_BROWSERS):
+        write_install_manifest(found)
         _notify("Tüm tarayıcılar zaten yüklü.")
         return True
     
     # 2. İndirme İşlemi (PLAYWRIGHT_BROWSERS_PATH env var'ı main.py'de ayarlandı)
     _notify("Gerekli Bileşenler Kuruluyor...")
     try:
-        # Mevcut ortam değişkenlerini alt processe aktar
-        env = os.environ.copy()
-        
-        if getattr(sys, 'frozen', False):
-            # EXE ortamında Playwright CLI install
-            from playwright.__main__ import main as pw_main
-            old_stdout = sys.stdout
-            old_stderr = sys.stderr
-            devnull = open(os.devnull, "w")
-            sys.stdout = devnull
-            sys.stderr = devnull
-            try:
-                for browser_name in ["chromium", "firefox"]:
-                    old_argv = sys.argv
-                    sys.argv = ["playwright", "install", browser_name]
-                    try:
-                        pw_main()
-                    except SystemExit:
-                        pass
-                    finally:
-                        sys.argv = old_argv
-            finally:
-                sys.stdout = old_stdout
-                sys.stderr = old_stderr
-                devnull.close()
-        else:
-            # Geliştirme ortamında subprocess ile kurulum
-            global _active_process
-            kwargs = {
-                "env": env,
-                "stdout": subprocess.DEVNULL,
-                "stderr": subprocess.DEVNULL
-            }
-            if os.name == 'nt':
-                kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
-                
-            _active_process = subprocess.Popen(
-                [sys.executable, "-m", "playwright", "install", "chromium", "firefox"],
-                **kwargs
-            )
-            _active_process.wait()
-            ret = _active_process.returncode
-            _active_process = None
-            
-            if ret != 0:
-                raise Exception(f"Playwright install başarısız oldu (Hata Kodu: {ret})")
-            
+        missing = [name for name in REQUIRED_BROWSERS if name not in found]
+        _install_browsers(missing, _notify)
+
+        # Kurulan tarayıcılar başlatılabiliyorsa kayıt yazılır; sonraki açılış hızlı yoldan geçer
+        found = _probe_browsers(_notify)
+        if len(found) == len(REQUIRED_BROWSERS):
+            write_install_manifest(found)
+
         _notify("Tarayıcı kurulumu tamamlandı.")
         return True
     except Exception as e:
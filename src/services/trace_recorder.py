@@ -0,0 +1,98 @@
+"""
+BU DOSYA: Yavaş veya başarısız kontrol döngüleri için koşullu Playwright izi
+(trace: ekran görüntüleri, ağ istekleri, DOM anlık görüntüleri) kaydeden servisi barındırır.
+
+İz kaydı açıkken her döngü izlenir; ancak iz yalnızca döngü süre eşiğini aşarsa
+veya başarısız olursa diske yazılır. Sağlıklı döngülerin izi atılır. Diskteki
+izler halka tampon (ring buffer) gibi davranır: toplam boyut sınırı aşılınca en
+eski izler silinir. Kaydedilen iz `playwright show-trace <dosya>` ile açılabilir.
+"""
+
+import datetime
+import logging
+import os
+import re
+import time
+from typing import Dict, Optional
+
+from playwright.sync_api import BrowserContext
+
+
+class TraceRecorder:
+    """Döngü başına Playwright izini başlatır; yalnızca yavaş/başarısız döngülerinkini saklar."""
+
+    def __init__(self, trace_dir: str, enabled: bool = False,
+                 slow_threshold_s: float = 20.0, max_total_mb: int = 200):
+        self.trace_dir = trace_dir
+        self.enabled = enabled
+        self.slow_threshold_s = slow_threshold_s
+        self.max_total_bytes = max_total_mb * 1024 * 1024
+
+        # id(context) -> iz başlangıç zamanı (yalnızca havuz thread'inden erişilir)
+        self._started: Dict[int, float] = {}
+
+    def begin(self, context: BrowserContext) -> bool:
+        """Context üzerinde izi başlatır. İz kaydı kapalıysa veya başlatılamazsa False döner."""
+        if not self.enabled:
+            return False
+        try:
+            context.tracing.start(screenshots=True, snapshots=True)
+        except Exception as e:
+            logging.warning(f"Playwright izi başlatılamadı: {e}")
+            return False
+        self._started[id(context)] = time.monotonic()
+        return True
+
+    def finish(self, context: BrowserContext, failed: bool, label: str = "dongu") -> Optional[str]:
+        """
+        İzi durdurur. Döngü başarısızsa veya eşiği aştıysa izi diske yazar.
+
+        Returns:
+            Kaydedilen iz dosyasının yolu veya None (iz atıldıysa)
+        """
+        started = self._started.pop(id(context), None)
+        if started is None:
+            return None
+
+        elapsed = time.monotonic() - started
+        reason = "hata" if failed else ("yavas" if elapsed >= self.slow_threshold_s else None)
+        try:
+            if reason is None:
+                context.tracing.stop()  # Sağlıklı döngü: iz diske yazılmadan atılır
+                return None
+
+            os.makedirs(self.trace_dir, exist_ok=True)
+            stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            safe_label = re.sub(r"[^0-9A-Za-z_-]", "_", label)
+            path = os.path.join(self.trace_dir, f"{stamp}_{safe_label}_{reason}_{elapsed:.0f}s.zip")
+            context.tracing.stop(path=path)
+        except Exception as e:
+            logging.warning(f"Playwright izi durdurulamadı: {e}")
+            return None
+
+        logging.warning(f"Döngü izi kaydedildi ({reason}, {elapsed:.1f} sn): {path}")
+        self._evict()
+        return path
+
+    def _evict(self) -> None:
+        """Toplam boyut sınırı aşıldıysa en eski izleri siler (en yeni iz her zaman kalır)."""
+        try:
+            traces = [
+                entry for entry in os.scandir(self.trace_dir)
+                if entry.is_file() and entry.name.endswith(".zip")
+            ]
+        except OSError:
+            return
+
+        traces.sort(key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in traces)
+        while total > self.max_total_bytes and len(traces) > 1:
+            oldest = traces.pop(0)
+            try:
+                size = oldest.stat().st_size
+                os.remove(oldest.path)
+                total -= size
+                logging.info(f"Eski döngü izi silindi: {oldest.name}")
+            except OSError as e:
+                logging.warning(f"Döngü izi silinemedi ({oldest.name}): {e}")
+                break
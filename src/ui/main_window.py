@@ -7,7 +7,6 @@ from PyQt6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSta
 from PyQt6.QtGui import QIcon, QAction
 from PyQt6.QtCore import Qt
 import os
-import json
 from datetime import datetime
 from .styles.theme import OBISStyles
 from .components.sidebar import OBISSidebar
@@ -23,6 +22,8 @@ from .views.profile import ProfileView
 
 from config import CURRENT_VERSION
 from services.session import SessionManager
+from services.browser_broker import get_existing_browser_broker
+from services.storage import open_document
 from utils.system import get_user_data_dir
 import logging
 
@@ -188,21 +189,11 @@ class MainWindow(QMainWindow):
         # Tıpkı internet kesintisi/error gibi, eğer kullanıcı tarayıcı iniyorken zorla çarpıya basıp çıkarsa
         # orphaned process (arkaplanda inmeye devam etme) oluşmasını önle ve bozuk dosyayı temizle
         if getattr(self.login_view, "startup_manager", None) is not None:
-            # Eğer development ortamında iniyorsa subprocess.Popen'ı vur
-            from services.system_check import _active_process
-            if _active_process is not None:
-                try:
-                    import subprocess
-                    # Node.js gibi child processleri de (Process Tree) yokedebilmek için /T kullanıyoruz.
-                    subprocess.run(
-                        ['taskkill', '/F', '/T', '/PID', str(_active_process.pid)],
-                        capture_output=True,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                except Exception:
-                    pass
+            # İnmekte olan kurulum süreçlerini (ve Node.js alt süreçlerini) vur
+            from services.system_check import terminate_install_processes
+            terminate_install_processes()
             
-            # Yarıda kalmış klasörü temizle ki bir dahaki sefere baştan saf temiz insin
+            # Yarıda kalmış tarayıcı klasörlerini temizle; tamamlanan parçalar sonraki açılışta korunur
             # İşlemlerin tam sonlanıp dosyaların serbest bırakılması için asenkron gecikme
             from PyQt6.QtCore import QTimer
             from ui.utils.startup import StartupManager
@@ -210,15 +201,8 @@ class MainWindow(QMainWindow):
             event.accept()
             return
             
-        settings_file = os.path.join(get_user_data_dir(), "settings.json")
-        minimize_to_tray = False
-        if os.path.exists(settings_file):
-            try:
-                with open(settings_file, "r", encoding="utf-8") as f:
-                    settings = json.load(f)
-                    minimize_to_tray = settings.get("minimize_to_tray", False)
-            except Exception:
-                pass
+        settings = open_document(os.path.join(get_user_data_dir(), "settings.json")).load() or {}
+        minimize_to_tray = settings.get("minimize_to_tray", False)
                 
         if minimize_to_tray:
             event.ignore()
@@ -322,7 +306,10 @@ class MainWindow(QMainWindow):
         # 2. Loglar: Tablo temizle
         self.logs_view.reset_state()
 
-        # 3. Oturum verilerini sil (Keyring + session.json + profile.json)
+        # 3. Oturum verilerini sil (Keyring + session.json + profile.json) ve canlı tarayıcı oturumunu kapat
+        broker = get_existing_browser_broker()
+        if broker is not None and self.current_user:
+            broker.release_session(self.current_user)
         SessionManager.clear_session()
 
         # 4. Topbar sıfırla
@@ -4,14 +4,27 @@ Stiller, OBISColors ve tema kurallarıyla uyumlu olacak şekilde hazırlanmışt
 """
 
 from datetime import datetime
+from typing import List, Optional
+from services.grade_record import GradeRecord
 from ui.styles.theme import OBISColors
 
 class OBISEmailTemplates:
     
     @staticmethod
-    def get_grade_change_template(ders_adi: str, yeni_bilgiler: dict) -> str:
-        """Ders güncellendiğinde gönderilecek HTML şablon."""
+    def get_grade_change_template(ders_adi: str, kayit: Optional[GradeRecord], degisiklikler: Optional[List[str]] = None) -> str:
+        """Ders güncellendiğinde gönderilecek HTML şablon. `degisiklikler` verilirse neyin değiştiği ayrıca listelenir."""
         zaman = datetime.now().strftime('%d.%m.%Y %H:%M')
+        sinavlar = kayit.exams if kayit else '-'
+        harf = kayit.letter if kayit else '-'
+        sonuc = kayit.result if kayit else '-'
+        degisiklik_html = ""
+        if degisiklikler:
+            satirlar = "".join(f"<li style=\"margin: 4px 0;\">{d}</li>" for d in degisiklikler)
+            degisiklik_html = f"""
+                        <div style="font-size: 14px; color: {OBISColors.TEXT_PRIMARY}; margin-bottom: 20px;">
+                            <ul style="margin: 0; padding-left: 20px;">{satirlar}</ul>
+                        </div>
+            """
         
         return f"""
         <html>
@@ -27,20 +40,20 @@ class OBISEmailTemplates:
                         <div style="font-size: 16px; color: {OBISColors.TEXT_PRIMARY}; margin-bottom: 20px; text-align: center; font-weight: 600;">
                             {ders_adi}
                         </div>
-                        
+                        {degisiklik_html}
                         <div style="border: 1px solid {OBISColors.BORDER}; border-radius: 8px; overflow: hidden;">
                             <table style="width: 100%; border-collapse: collapse; text-align: left;">
                                 <tr style="background-color: {OBISColors.INPUT_BG}; border-bottom: 1px solid {OBISColors.BORDER};">
                                     <td style="padding: 14px 16px; font-weight: 600; width: 35%; color: {OBISColors.TEXT_SECONDARY};">Sınavlar</td>
-                                    <td style="padding: 14px 16px; color: {OBISColors.TEXT_PRIMARY};">{yeni_bilgiler.get('Sınavlar', '-')}</td>
+                                    <td style="padding: 14px 16px; color: {OBISColors.TEXT_PRIMARY};">{sinavlar}</td>
                                 </tr>
                                 <tr style="border-bottom: 1px solid {OBISColors.BORDER};">
                                     <td style="padding: 14px 16px; font-weight: 600; color: {OBISColors.TEXT_SECONDARY};">Harf Notu</td>
-                                    <td style="padding: 14px 16px; color: {OBISColors.PRIMARY}; font-weight: bold; font-size: 16px;">{yeni_bilgiler.get('Harf Notu', '-')}</td>
+                                    <td style="padding: 14px 16px; color: {OBISColors.PRIMARY}; font-weight: bold; font-size: 16px;">{harf}</td>
                                 </tr>
                                 <tr style="background-color: {OBISColors.INPUT_BG};">
                                     <td style="padding: 14px 16px; font-weight: 600; color: {OBISColors.TEXT_SECONDARY};">Sonuç</td>
-                                    <td style="padding: 14px 16px; color: {OBISColors.TEXT_PRIMARY};">{yeni_bilgiler.get('Sonuç', '-')}</td>
+                                    <td style="padding: 14px 16px; color: {OBISColors.TEXT_PRIMARY};">{sonuc}</td>
                                 </tr>
                             </table>
                         </div>
@@ -6,12 +6,11 @@ ardından SystemCheckWorker ile Playwright tarayıcı kontrolü yapar.
 
 from PyQt6.QtCore import QObject, pyqtSignal
 import os
-import shutil
 import logging
 from PyQt6.QtWidgets import QApplication
 
 from services.updater import UpdateWorker
-from services.system_check import SystemCheckWorker
+from services.system_check import SystemCheckWorker, cleanup_incomplete_browsers
 
 class StartupManager(QObject):
     status_changed = pyqtSignal(str)
@@ -52,16 +51,14 @@ class StartupManager(QObject):
     @staticmethod
     def cleanup_and_exit():
         """
-        Bozuk/eksik Playwright dosyalarını temizler ve uygulamayı kapatır.
-        Bir sonraki açılışta temiz bir kurulum yapılmasını garanti eder.
+        Yarım kalmış Playwright tarayıcı klasörlerini temizler ve uygulamayı kapatır.
+        Tamamlanmış tarayıcılar ve indirme parçaları korunur; bir sonraki açılışta
+        kurulum kaldığı yerden devam eder.
         """
-        playwright_dir = os.environ.get("PLAYWRIGHT_BROWSERS_PATH", "")
-        if playwright_dir and os.path.exists(playwright_dir):
-            try:
-                shutil.rmtree(playwright_dir, ignore_errors=True)
-                logging.info(f"Playwright klasörü temizlendi: {playwright_dir}")
-            except Exception as e:
-                logging.error(f"Playwright klasörü silinemedi: {e}")
+        try:
+            cleanup_incomplete_browsers()
+        except Exception as e:
+            logging.error(f"Playwright klasörü temizlenemedi: {e}")
         
         logging.info("Uygulama tarayıcı kurulum hatası nedeniyle kapatılıyor.")
         QApplication.quit()
@@ -15,7 +15,8 @@ except ImportError:
     OBISNotifier = None
 
 from services.notification import NotificationService
-from services.browser import BrowserService
+from services.browser_broker import get_configured_browser_broker
+from services.engine_benchmark import benchmark_engines
 from services.pdf_parser import PDFParserService
 from services.storage import ProfileStorageService
 import os
@@ -77,7 +78,8 @@ class TestMailWorker(QThread):
 
 class LoginWorker(QThread):
     """
-    Arka planda BrowserService ile giriş dener ve profil bilgilerini çeker.
+    Arka planda paylaşılan tarayıcı (broker) ile giriş dener ve profil bilgilerini çeker.
+    Açılan oturum canlı tutulur; ilk not kontrolü tekrar giriş yapmaz.
     """
     result_signal = pyqtSignal(bool, str) # success, message
     status_signal = pyqtSignal(str) # UI durum bilgisini günceller
@@ -89,53 +91,73 @@ class LoginWorker(QThread):
 
     def run(self):
         try:
-            # .Tarayıcıyı headless (görünmez) başlat
-            browser = BrowserService(headless=True)
-            browser.start_browser()
-            
-            # Login dene
-            is_success = browser.login(self.user, self.pwd)
+            # .Paylaşılan headless (görünmez) tarayıcıda login dene
+            broker = get_configured_browser_broker()
+            is_success = broker.login(self.user, self.pwd).result()
             
             if is_success:
                 # Başarılı girişten sonra profile verisini kontrol et
                 profile_dir = os.path.join(os.getenv('LOCALAPPDATA'), 'OBISNotifier')
                 os.makedirs(profile_dir, exist_ok=True)
                 profile_file = os.path.join(profile_dir, 'profile.json')
+                storage_service = ProfileStorageService(profile_file)
                 
-                if not os.path.exists(profile_file):
+                if not storage_service.has_profile_data():
                     self.status_signal.emit("Profil Bilgileri Alınıyor...")
                     try:
                         logging.info("Bilgileri çekme işlemi başlatılıyor...")
-                        pdf_path = browser.download_graduation_pdf()
-                        if pdf_path and os.path.exists(pdf_path):
-                            logging.info(f"PDF başarıyla indi: {pdf_path}")
+                        _, pdf = broker.download_graduation_pdf(self.user, self.pwd).result()
+                        if pdf:
+                            pdf_stream, pdf_hash = pdf
+                            logging.info("PDF başarıyla indi (bellekte).")
                             
                             parser_service = PDFParserService()
-                            storage_service = ProfileStorageService(profile_file)
                             
-                            parsed_data = parser_service.extract_graduation_data(pdf_path)
+                            parsed_data = parser_service.extract_graduation_data(pdf_stream)
+                            parsed_data["pdf_hash"] = pdf_hash
 
                             if storage_service.save_profile_data(parsed_data):
                                 logging.info("Profil JSON dosyasına başarıyla kaydedildi!")
                             else:
                                 logging.error("Profil JSON kaydedilemedi!")
-                            
-                            try:
-                                os.remove(pdf_path)
-                                logging.info("PDF dosyası silindi.")
-                            except OSError:
-                                logging.error("PDF dosyası silinemedi!")
                         else:
-                            logging.error("PDF yolu alınamadı veya dosya mevcut değil!")
+                            logging.error("PDF indirilemedi!")
 
                     except Exception as pdf_err:
                         logging.error(f"Bilgileri çekme sırasında hata: {pdf_err}")
                         
-                browser.close_browser()
                 self.result_signal.emit(True, "Giriş Başarılı! Yönlendiriliyorsunuz...")
             else:
-                browser.close_browser()
+                broker.release_session(self.user)
                 self.result_signal.emit(False, "Giriş Başarısız! Lütfen bilgilerinizi kontrol ediniz.")
                 
         except Exception as e:
-            self.result_signal.emit(False, f"Sistem hatası: {str(e)}")
\ No newline at end of file
+            self.result_signal.emit(False, f"Sistem hatası: {str(e)}")
+
+
+class EngineBenchmarkWorker(QThread):
+    """
+    Kurulu tarayıcı motorlarını (giriş + notlar akışıyla) ölçüp en hızlısını
+    kaydeden QThread. "Otomatik" tarayıcı ayarı bu sonucu kullanır.
+    """
+    result_signal = pyqtSignal(bool, str, object)  # success, message, rapor
+
+    def __init__(self, user: str | None = None, pwd: str | None = None):
+        super().__init__()
+        self.user = user
+        self.pwd = pwd
+
+    def run(self):
+        try:
+            report = benchmark_engines(self.user, self.pwd)
+            best = report.get("best")
+            if not best:
+                self.result_signal.emit(False, "Çalışan tarayıcı motoru bulunamadı.", report)
+                return
+            result = report["results"][best]
+            self.result_signal.emit(
+                True, f"En hızlı motor: {best.capitalize()} ({result['cycle_s']:.2f} sn/döngü)", report
+            )
+        except Exception as e:
+            logging.error(f"EngineBenchmarkWorker Hatası: {e}")
+            self.result_signal.emit(False, f"Motor ölçümü başarısız: {e}", None)
@@ -8,7 +8,6 @@ BU DOSYA: Ana kontrol paneli (DashboardController).
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
 from PyQt6.QtCore import pyqtSignal, QTimer, pyqtSlot
 import datetime
-import json
 import os
 import logging
 import winsound
@@ -16,6 +15,8 @@ from .dashboard_cards import DashboardControlCard, DashboardStatsCard, Dashboard
 
 # Servisler
 from services.session import SessionManager
+from services.browser_broker import get_browser_broker
+from services.storage import open_document
 from utils.system import get_user_data_dir
 from ui.utils.worker import CheckWorker
 import qtawesome as qta
@@ -56,6 +57,7 @@ class DashboardView(QWidget):
         # --- Timer & Spam Koruma ---
         self.CHECK_INTERVAL: int = 20 * 60
         self.time_left: int = self.CHECK_INTERVAL
+        self.prewarm_seconds: int = 30
         self.last_manual_check_time: datetime.datetime | None = None
         self.toggle_timestamps: list = []
         self.toggle_block_until: datetime.datetime | None = None
@@ -144,9 +146,13 @@ class DashboardView(QWidget):
         check_interval_minutes = int(settings.get("check_interval", 20))
         self.CHECK_INTERVAL = check_interval_minutes * 60
         self.time_left = self.CHECK_INTERVAL
+        # Planlı kontrolden kaç saniye önce tarayıcının ısıtılacağı (0: kapalı)
+        self.prewarm_seconds = max(0, int(settings.get("prewarm_seconds", 30)))
 
         try:
-            self.notifier = OBISNotifier(settings)
+            # Girişte açılan oturumu kullanmak için paylaşılan tarayıcı havuzu verilir
+            broker = get_browser_broker(settings.get("browser", "chromium"), settings.get("navigation_profile", "fast"))
+            self.notifier = OBISNotifier(settings, browser_pool=broker.pool)
         except Exception as e:
             self.snackbar_signal.emit(f"Sistem başlatılamadı: {str(e)}", "error")
             logging.error(f"OBISNotifier oluşturma hatası: {e}")
@@ -219,6 +225,9 @@ class DashboardView(QWidget):
             if not self.is_checking:
                 self._run_check()
             self.time_left = self.CHECK_INTERVAL
+        elif self.time_left == self.prewarm_seconds and not self.is_checking and self.notifier:
+            # Geri sayım bitmeden tarayıcıyı başlat ve login/oturum sayfasını hazırla
+            self.notifier.prewarm()
         self._update_timer_label()
 
     def _run_check(self):
@@ -256,15 +265,17 @@ class DashboardView(QWidget):
             if changes:
                 for change in changes:
                     ders_adi = change.get("ders", "Bilinmeyen Ders")
-                    yeni = change.get("yeni", {})
-                    sinavlar = yeni.get("Sınavlar", "-")
-                    harf = yeni.get("Harf Notu", "-")
-                    sonuc = yeni.get("Sonuç", "-")
+                    yeni = change.get("yeni")
                     
-                    if change.get("eski"):
-                        self.timeline_card.add_item(f"📝 {ders_adi} güncellendi — Sınavlar: {sinavlar} | Harf: {harf} | Sonuç: {sonuc}", "warn")
+                    if yeni is None:
+                        self.timeline_card.add_item(f"🗑️ {ders_adi} listeden kaldırıldı", "warn")
+                    elif change.get("eski"):
+                        # Yalnızca değişen alanlar gösterilir (örn. "Final notu açıklandı: 70")
+                        olaylar = "; ".join(event.describe() for event in change.get("olaylar", []))
+                        detay = olaylar or f"Sınavlar: {yeni.exams} | Harf: {yeni.letter} | Sonuç: {yeni.result}"
+                        self.timeline_card.add_item(f"📝 {ders_adi} güncellendi — {detay}", "warn")
                     else:
-                        self.timeline_card.add_item(f"🆕 {ders_adi} — Sınavlar: {sinavlar} | Harf: {harf} | Sonuç: {sonuc}", "warn")
+                        self.timeline_card.add_item(f"🆕 {ders_adi} — Sınavlar: {yeni.exams} | Harf: {yeni.letter} | Sonuç: {yeni.result}", "warn")
                 self.timeline_card.add_item(f"Bildirimler gönderildi. ({len(changes)} ders değişikliği)", "success")
                 if message and "mail" in message.lower():
                     self.timeline_card.add_item("❌ E-Mail gönderme hatası: Bilgilerinizi kontrol ediniz.", "error")
@@ -318,28 +329,23 @@ class DashboardView(QWidget):
         self._run_check()
 
     def _load_settings_from_file(self) -> dict:
-        settings = {}
-        try:
-            if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                    settings = json.load(f)
-        except Exception as e:
-            logging.error(f"Ayar dosyası okunamadı: {e}")
+        settings_store = open_document(SETTINGS_FILE)
+        settings = settings_store.load() or {}
 
         for sensitive_key in ["obis_password", "student_id"]:
             if sensitive_key in settings:
                 settings.pop(sensitive_key)
                 logging.warning(f"Settings dosyasından güvenlik açığı temizlendi: {sensitive_key}")
-                try:
-                    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-                        json.dump(settings, f, indent=4)
-                except Exception:
-                    pass
+                settings_store.save(settings)
         return settings
 
     def force_stop(self):
         if self.is_system_running:
             self._reset_timer()
+            if self.notifier:
+                # Süren kontrol iptal edilir; tarayıcı paylaşılan broker'a aittir ve açık kalır
+                # (canlı oturum çıkışta main_window tarafından bırakılır)
+                self.notifier.cancel()
             self.notifier = None
             self.is_system_running = False
             self.is_checking = False
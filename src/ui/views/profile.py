@@ -15,6 +15,7 @@ from ..styles.theme import OBISColors, OBISFonts, OBISDimens, OBISStyles
 from ..utils.animations import OBISAnimations
 from services.storage import ProfileStorageService
 from services.pdf_parser import PDFParserService
+from services.browser_broker import get_configured_browser_broker
 from utils.system import get_user_data_dir
 
 PROFILE_FILE = os.path.join(get_user_data_dir(), 'profile.json')
@@ -34,39 +35,35 @@ class ProfileUpdateWorker(QThread):
         try:
             logging.info("Profil güncelleme işlemi başlatıldı.")
             
-            from services.browser import BrowserService
-            browser = BrowserService(headless=True)
-            browser.start_browser()
-            
-            is_success = browser.login(self.user, self.pwd)
+            # Paylaşılan tarayıcıda canlı oturum varsa tekrar giriş yapılmaz
+            is_success, pdf = get_configured_browser_broker().download_graduation_pdf(self.user, self.pwd).result()
             if not is_success:
-                browser.close_browser()
                 self.result_signal.emit(False, "Giriş başarısız. Oturum bilgilerinizi kontrol edip tekrar deneyin.", {})
                 return
-                
-            pdf_path = browser.download_graduation_pdf()
             
-            if pdf_path and os.path.exists(pdf_path):
-                logging.info(f"PDF başarıyla indi: {pdf_path}")
+            if pdf:
+                pdf_stream, pdf_hash = pdf
+                logging.info("PDF başarıyla indi (bellekte).")
 
-                # 1. PDF'i Ayrıştır (Tüm veriler çekilir)
-                parsed_data = self.parser_service.extract_graduation_data(pdf_path)
+                # 1. PDF değişmediyse ayrıştırma atlanır, yalnızca güncelleme zamanı yenilenir
+                previous = self.storage_service.load_profile_data()
+                if previous and previous.get("pdf_hash") == pdf_hash:
+                    previous["son_guncelleme"] = datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+                    self.storage_service.save_profile_data(previous)
+                    logging.info("Mezuniyet PDF'i değişmemiş, ayrıştırma atlandı.")
+                    self.result_signal.emit(True, "Profil bilgileri zaten güncel.", previous)
+                    return
+
+                # 2. PDF'i Ayrıştır (Tüm veriler çekilir)
+                parsed_data = self.parser_service.extract_graduation_data(pdf_stream)
+                parsed_data["pdf_hash"] = pdf_hash
                 
-                # 2. JSON'a Kaydet (Gelecekte lazım olur diye hepsi kaydedilir)
+                # 3. JSON'a Kaydet (Gelecekte lazım olur diye hepsi kaydedilir)
                 self.storage_service.save_profile_data(parsed_data)
                 
-                # 3. PDF'i temizle
-                try:
-                    os.remove(pdf_path)
-                    logging.info("Geçici PDF silindi.")
-                except OSError as e:
-                    logging.warning(f"Geçici PDF silinemedi: {e}")
-                
-                browser.close_browser()
                 logging.info("Profil bilgileri başarıyla güncellendi!")
                 self.result_signal.emit(True, "Profil bilgileri başarıyla güncellendi!", parsed_data)
             else:
-                browser.close_browser()
                 self.result_signal.emit(False, "PDF dosyası indirilemedi.", {})
                 
         except Exception as e:
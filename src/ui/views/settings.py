@@ -6,7 +6,6 @@ BU DOSYA: Uygulama yapılandırma ayarlarının yönetildiği kontrolör (Contro
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QFrame
 from PyQt6.QtCore import Qt, pyqtSignal
-import json
 import os
 import logging
 import re
@@ -20,7 +19,10 @@ from ..styles.theme import OBISColors, OBISFonts, OBISDimens
 from ..utils.animations import OBISAnimations
 
 # Servis ve Utils
-from ui.utils.worker import TestMailWorker
+from ui.utils.worker import TestMailWorker, EngineBenchmarkWorker
+from services.engine_benchmark import AUTO_ENGINE, load_engine_benchmark
+from services.session import SessionManager
+from services.storage import open_document
 from utils.system import get_user_data_dir
 from utils.date_utils import get_current_semester
 
@@ -144,43 +146,59 @@ class SettingsView(QWidget):
         self.card_notification.btn_test_mail.setText("Bildirimi Test Et")
         self.snackbar_signal.emit(message, "success" if success else "error")
 
+    # ================= MOTOR ÖLÇÜMÜ =================
+
+    def _start_engine_benchmark(self):
+        """Otomatik tarayıcı seçimi için kurulu motorları arka planda ölçer."""
+        if getattr(self, "engine_worker", None) and self.engine_worker.isRunning():
+            return
+        credentials = SessionManager.load_session()
+        user, pwd = credentials if credentials else (None, None)
+
+        self.card_advanced.set_auto_engine_label("Ölçülüyor...")
+        self.snackbar_signal.emit("Tarayıcı motorları ölçülüyor...", "info")
+        self.engine_worker = EngineBenchmarkWorker(user, pwd)
+        self.engine_worker.result_signal.connect(self._on_engine_benchmark_finished)
+        self.engine_worker.start()
+
+    def _on_engine_benchmark_finished(self, success, message, report):
+        self._update_auto_engine_label(report)
+        self.snackbar_signal.emit(message, "success" if success else "error")
+
+    def _update_auto_engine_label(self, report=None):
+        best = (report or {}).get("best")
+        self.card_advanced.set_auto_engine_label(f"Seçilen: {best.capitalize()}" if best else "En Hızlısını Ölç")
+
     # ================= VERİ YÜKLEME / KAYDETME =================
 
     def load_settings(self):
-        """Ayarları dosyadan yükler. Dosya yoksa varsayılan değerlerle oluşturur."""
+        """Ayarları yükler. Kayıt yoksa varsayılan değerlerle oluşturur."""
+        settings_store = open_document(SETTINGS_FILE)
         
-        # Dosya yoksa varsayılan ayarlarla oluştur
-        if not os.path.exists(SETTINGS_FILE):
+        # Kayıt yoksa varsayılan ayarlarla oluştur
+        if not settings_store.exists():
             default_settings = {
                 "check_interval": 20,
                 "auto_semester": True,
                 "semester": get_current_semester(),
+                "watch_all_semesters": False,
                 "notification_methods": [],
                 "sender_email": "",
                 "browser": "chromium",
+                "navigation_profile": "fast",
+                "prewarm_seconds": 30,
                 "minimize_to_tray": False
             }
-            try:
-                os.makedirs(os.path.dirname(SETTINGS_FILE), exist_ok=True)
-                with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-                    json.dump(default_settings, f, indent=4)
+            if settings_store.save(default_settings):
                 logging.info("Varsayılan settings.json oluşturuldu.")
-            except Exception as e:
-                logging.error(f"Varsayılan ayar dosyası oluşturulamadı: {e}")
         
-        settings = {}
-        if os.path.exists(SETTINGS_FILE):
-            try:
-                with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                    settings = json.load(f)
-            except Exception as e:
-                logging.error(f"Ayarlar yüklenemedi: {e}")
+        settings = settings_store.load() or {}
 
         # Automation
         interval = settings.get("check_interval", 20)
         is_auto_semester = settings.get("auto_semester", True)
         semester = settings.get("semester", get_current_semester())
-        self.card_automation.set_data(interval, is_auto_semester, semester)
+        self.card_automation.set_data(interval, is_auto_semester, semester, settings.get("watch_all_semesters", False))
 
         # Notification
         methods = settings.get("notification_methods", [])
@@ -201,8 +219,7 @@ class SettingsView(QWidget):
                 try:
                     keyring.set_password(GMAIL_KEYRING_SERVICE, sender_email, gmail_pwd)
                     settings.pop("gmail_app_password", None)
-                    with open(SETTINGS_FILE, "w", encoding="utf-8") as fw:
-                        json.dump(settings, fw, indent=4)
+                    settings_store.save(settings)
                     logging.info("Gmail şifresi keyring'e taşındı, settings.json temizlendi.")
                 except Exception as e:
                     logging.error(f"Gmail şifre migrasyonu başarısız: {e}")
@@ -216,8 +233,10 @@ class SettingsView(QWidget):
         # Advanced (stop_on_failures artık çekirdekte kalıcı, UI'da gösterilmiyor)
         self.card_advanced.set_data(
             settings.get("browser", "chromium"),
-            settings.get("minimize_to_tray", False)
+            settings.get("minimize_to_tray", False),
+            settings.get("navigation_profile", "fast")
         )
+        self._update_auto_engine_label(load_engine_benchmark())
 
     def save_settings(self):
         if self._is_system_running:
@@ -237,23 +256,24 @@ class SettingsView(QWidget):
                 return
 
         try:
-            current_settings = {}
-            if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                    current_settings = json.load(f)
+            settings_store = open_document(SETTINGS_FILE)
+            current_settings = settings_store.load() or {}
             
             auto_data = self.card_automation.get_data()
             adv_data = self.card_advanced.get_data()
             
             methods = ["email"] if notif_data["email_enabled"] else []
+            previous_browser = current_settings.get("browser")
             
             current_settings.update({
                 "check_interval": auto_data["check_interval"],
                 "auto_semester": auto_data["auto_semester"],
                 "semester": auto_data["semester"],
+                "watch_all_semesters": auto_data["watch_all_semesters"],
                 "notification_methods": methods,
                 "sender_email": notif_data["email_address"],
                 "browser": adv_data["browser"],
+                "navigation_profile": adv_data["navigation_profile"],
                 "minimize_to_tray": adv_data["minimize_to_tray"]
             })
             
@@ -265,11 +285,15 @@ class SettingsView(QWidget):
                 except Exception as e:
                     logging.error(f"Gmail şifresi kasaya kaydedilemedi: {e}")
             
-            with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(current_settings, f, indent=4)
+            if not settings_store.save(current_settings):
+                raise OSError("Ayarlar kaydedilemedi.")
                 
             logging.info(f"Ayarlar kaydedildi. (Kontrol: {auto_data['check_interval']} dk, Dönem: {auto_data['semester']}, Tarayıcı: {adv_data['browser']})")
             self.snackbar_signal.emit("Ayarlar başarıyla kaydedildi.", "success")
+
+            # Otomatik motor seçimi yeni seçildiyse (veya ölçüm yoksa) motorları yeniden ölç
+            if adv_data["browser"] == AUTO_ENGINE and (previous_browser != AUTO_ENGINE or not load_engine_benchmark()):
+                self._start_engine_benchmark()
             
         except Exception as e:
             logging.error(f"Ayarlar kaydedilemedi: {e}")
@@ -112,8 +112,24 @@ class SettingsAutomationCard(OBISCard):
         self.combo_semester = OBISCombobox(items=[], height=42)
         self.combo_semester.set_left_icon("fa5s.calendar-alt", OBISColors.TEXT_SECONDARY)
         
+        # Tüm dönemleri izle (tek girişte sırayla çekilir)
+        sb_all = QHBoxLayout()
+        sb_all.setContentsMargins(0, 0, 0, 0)
+        sb_all_texts = QVBoxLayout()
+        sb_all_texts.setSpacing(2)
+        sb_all_texts.addWidget(create_label("Tüm Dönemleri İzle", OBISFonts.get_font(10, "bold"), OBISColors.TEXT_PRIMARY))
+        sb_all_texts.addWidget(create_label("Önceki ve sonraki dönem de aynı oturumda kontrol edilir.", OBISFonts.get_font(9, "normal"), OBISColors.TEXT_SECONDARY, False))
+        sb_all_texts.addStretch()
+
+        self.sw_all_semesters = OBISSwitch(width=44, height=24)
+
+        sb_all.addLayout(sb_all_texts)
+        sb_all.addStretch()
+        sb_all.addWidget(self.sw_all_semesters, alignment=Qt.AlignmentFlag.AlignVCenter)
+
         sb_layout.addLayout(sb_top)
         sb_layout.addWidget(self.combo_semester)
+        sb_layout.addLayout(sb_all)
         
         c_layout.addWidget(time_box)
         c_layout.addWidget(semester_box)
@@ -137,25 +153,28 @@ class SettingsAutomationCard(OBISCard):
             elif current in items:
                 self.combo_semester.setCurrentText(current)
 
-    def set_data(self, interval: int, is_auto: bool, target_semester: str):
+    def set_data(self, interval: int, is_auto: bool, target_semester: str, watch_all: bool = False):
         valid = ["15", "20", "30", "60"]
         val = str(interval) if str(interval) in valid else "20"
         self.combo_interval.setCurrentText(f"{val} Dakika")
         self._temp_selected_semester = target_semester
         self.sw_auto_semester.setChecked(is_auto)
         self._toggle_semester_mode(is_auto)
+        self.sw_all_semesters.setChecked(watch_all)
 
     def get_data(self):
         val = self.combo_interval.currentText().split()[0]
         return {
             "check_interval": int(val),
             "auto_semester": self.sw_auto_semester.isChecked(),
-            "semester": get_current_semester() if self.sw_auto_semester.isChecked() else self.combo_semester.currentText()
+            "semester": get_current_semester() if self.sw_auto_semester.isChecked() else self.combo_semester.currentText(),
+            "watch_all_semesters": self.sw_all_semesters.isChecked()
         }
 
     def set_running_state(self, is_running: bool):
         self.combo_interval.setEnabled(not is_running)
         self.sw_auto_semester.setEnabled(not is_running)
+        self.sw_all_semesters.setEnabled(not is_running)
         self.combo_semester.setEnabled(False if is_running else not self.sw_auto_semester.isChecked())
 
 
@@ -319,13 +338,16 @@ class SettingsAdvancedCard(OBISCard):
         
         self.btn_chrom = self._create_browser_btn("Chromium", "Hızlı & Kararlı", True)
         self.btn_ff = self._create_browser_btn("Firefox", "Hafif Bellek", False)
+        self.btn_auto = self._create_browser_btn("Otomatik", "En Hızlısını Ölç", False)
         self.btn_chrom.clicked.connect(lambda: self._set_browser("chromium"))
         self.btn_ff.clicked.connect(lambda: self._set_browser("firefox"))
+        self.btn_auto.clicked.connect(lambda: self._set_browser("auto"))
         
         br_row.addWidget(self.btn_chrom)
         br_row.addWidget(self.btn_ff)
+        br_row.addWidget(self.btn_auto)
         col_left.addLayout(br_row)
-        col_left.addWidget(create_label("Not: Otomasyonun web sayfalarını render etmek için kullanacağı motoru belirler.", OBISFonts.get_font(8, "italic"), OBISColors.TEXT_SECONDARY, True))
+        col_left.addWidget(create_label("Not: Otomasyonun web sayfalarını render etmek için kullanacağı motoru belirler. Otomatik seçimde kurulu motorlar kaydederken ölçülür.", OBISFonts.get_font(8, "italic"), OBISColors.TEXT_SECONDARY, True))
         
         sep_l = QFrame()
         sep_l.setFrameShape(QFrame.Shape.HLine)
@@ -346,8 +368,10 @@ class SettingsAdvancedCard(OBISCard):
         col_right.setSpacing(16)
         
         self.sw_minimize = self._create_switch_row("Simge Durumunda Çalıştır", "Pencere kapatıldığında sistem tepsisinde çalışmaya devam eder.")
+        self.sw_humanlike = self._create_switch_row("İnsan Benzeri Gezinme", "Tarayıcı adımları arasına yapay gecikme ekler. Kapalıyken kontroller daha hızlı tamamlanır.")
         
         col_right.addLayout(self.sw_minimize)
+        col_right.addLayout(self.sw_humanlike)
         col_right.addStretch()
         
         adv_grid.addLayout(col_left, 0, 0)
@@ -378,9 +402,13 @@ class SettingsAdvancedCard(OBISCard):
 
     def _set_browser(self, name):
         self.selected_browser = name
-        is_chrom = (name == "chromium")
-        self._update_browser_btn_style(self.btn_chrom, is_chrom)
-        self._update_browser_btn_style(self.btn_ff, not is_chrom)
+        self._update_browser_btn_style(self.btn_chrom, name == "chromium")
+        self._update_browser_btn_style(self.btn_ff, name == "firefox")
+        self._update_browser_btn_style(self.btn_auto, name == "auto")
+
+    def set_auto_engine_label(self, text: str):
+        """Otomatik butonunun alt yazısını günceller (örn. ölçülen en hızlı motor)."""
+        self.btn_auto.findChildren(QLabel)[1].setText(text)
 
     def _update_browser_btn_style(self, btn, is_active, override_childs=None):
         rad_cmd = f"border-radius: {OBISDimens.RADIUS_MEDIUM}px;"
@@ -422,17 +450,21 @@ class SettingsAdvancedCard(OBISCard):
         row.switch_widget = sw
         return row
 
-    def set_data(self, browser: str, min_to_tray: bool):
-        self._set_browser(browser if browser in ["chromium", "firefox"] else "chromium")
+    def set_data(self, browser: str, min_to_tray: bool, navigation_profile: str = "fast"):
+        self._set_browser(browser if browser in ["chromium", "firefox", "auto"] else "chromium")
         self.sw_minimize.switch_widget.setChecked(min_to_tray)
+        self.sw_humanlike.switch_widget.setChecked(navigation_profile == "humanlike")
 
     def get_data(self):
         return {
             "browser": getattr(self, "selected_browser", "chromium"),
-            "minimize_to_tray": self.sw_minimize.switch_widget.isChecked()
+            "minimize_to_tray": self.sw_minimize.switch_widget.isChecked(),
+            "navigation_profile": "humanlike" if self.sw_humanlike.switch_widget.isChecked() else "fast"
         }
 
     def set_running_state(self, is_running: bool):
         self.btn_chrom.setEnabled(not is_running)
         self.btn_ff.setEnabled(not is_running)
+        self.btn_auto.setEnabled(not is_running)
         self.sw_minimize.switch_widget.setEnabled(not is_running)
+        self.sw_humanlike.switch_widget.setEnabled(not is_running)
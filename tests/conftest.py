@@ -0,0 +1,16 @@
+"""
+BU DOSYA: Testler için ortak ayarlar. Uygulama modülleri src/ altından
+(uygulamanın kendi çalıştırma biçimiyle aynı şekilde) içe aktarılır; kullanıcı
+veri dizini (LOCALAPPDATA) her test oturumunda geçici bir dizine yönlendirilir.
+"""
+
+import os
+import sys
+import tempfile
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Modüller içe aktarılırken veri dizini çözülür; gerçek AppData'ya dokunulmasın
+os.environ["LOCALAPPDATA"] = tempfile.mkdtemp(prefix="obis_test_")
@@ -0,0 +1,101 @@
+"""
+BU DOSYA: Sınavlar metninin ayrıştırılmasını (parse_exams) ve GradeIndex
+üzerinden alan düzeyinde not karşılaştırmasını test eder.
+"""
+
+from services.grade_diff import (COURSE_ADDED, COURSE_REMOVED, EXAM_CHANGED, EXAM_POSTED, EXAM_REMOVED,
+                                 EXAMS_CHANGED, LETTER_ASSIGNED, RESULT_CHANGED, GradeIndex, diff_indexes,
+                                 parse_exams)
+from services.grade_record import GradeRecord
+from services.grades import GradeService
+
+
+def _kinds(events):
+    return [(e.kind, e.field) for e in events]
+
+
+# ================= parse_exams =================
+
+def test_parse_exams_splits_components():
+    assert parse_exams("Vize : 55 Final : 70 Bütünleme : -") == {"Vize": "55", "Final": "70", "Bütünleme": "-"}
+
+
+def test_parse_exams_blank_score_does_not_swallow_next_name():
+    assert parse_exams("Vize : Final : 70") == {"Vize": "", "Final": "70"}
+
+
+def test_parse_exams_names_with_digits_and_spaces():
+    assert parse_exams("Ödev  1 : 80 Vize : 40") == {"Ödev 1": "80", "Vize": "40"}
+
+
+def test_parse_exams_blank_text():
+    assert parse_exams("") == {}
+    assert parse_exams("-") == {}
+
+
+def test_parse_exams_unparseable_text():
+    assert parse_exams("Girilmedi") is None
+
+
+def test_parse_exams_concatenated_cells_are_ambiguous():
+    assert parse_exams("Vize : 55Final : 70") is None
+    assert parse_exams("Vize:55Final:70") is None
+
+
+def test_concatenated_cells_fall_back_to_exams_changed():
+    old = GradeRecord("Matematik I", "Vize : 55Final : -", "", "")
+    new = GradeRecord("Matematik I", "Vize : 55Final : 70", "", "")
+    (_, _, events), = diff_indexes(GradeIndex([old]), GradeIndex([new]))
+    assert _kinds(events) == [(EXAMS_CHANGED, None)]
+
+
+# ================= GradeIndex / diff_indexes =================
+
+def test_diff_reports_field_level_events():
+    old = [GradeRecord("Matematik I", "Vize : 55 Final : - Büt : 40", "", ""),
+           GradeRecord("Fizik I", "Vize : 70", "", "")]
+    new = [GradeRecord("Matematik I", "Vize : 60 Final : 70 Büt : -", "CC", "Geçti"),
+           GradeRecord("Kimya", "Vize : -", "", "")]
+
+    result = diff_indexes(GradeIndex(old), GradeIndex(new))
+    by_course = {(new_rec or old_rec).course: events for old_rec, new_rec, events in result}
+
+    assert _kinds(by_course["Matematik I"]) == [(EXAM_CHANGED, "Vize"), (EXAM_POSTED, "Final"),
+                                               (EXAM_REMOVED, "Büt"), (LETTER_ASSIGNED, None),
+                                               (RESULT_CHANGED, None)]
+    assert _kinds(by_course["Kimya"]) == [(COURSE_ADDED, None)]
+    assert _kinds(by_course["Fizik I"]) == [(COURSE_REMOVED, None)]
+
+
+def test_diff_matches_courses_by_normalized_key():
+    old = [GradeRecord("Matematik  I", "Vize : 55", "", "")]
+    new = [GradeRecord("MATEMATIK I ", "Vize : 55", "", "")]
+    assert old[0].key == new[0].key
+    assert diff_indexes(GradeIndex(old), GradeIndex(new)) == []
+
+
+def test_index_reuses_parsed_entries_of_unchanged_rows():
+    first = GradeIndex([GradeRecord("Fizik I", "Vize : 70", "", ""), GradeRecord("Kimya", "Vize : -", "", "")])
+    second = GradeIndex([GradeRecord("Fizik I", "Vize : 70", "", ""), GradeRecord("Kimya", "Vize : 45", "", "")],
+                        first)
+    assert second.entries["fizik i"] is first.entries["fizik i"]
+    assert second.entries["kimya"] is not first.entries["kimya"]
+    assert second.entries["kimya"][1] == {"Vize": "45"}
+
+
+def test_compare_grades_first_run_and_changes():
+    service = GradeService()
+    grades = [GradeRecord("Fizik I", "Vize : -", "", "")]
+
+    changes, message = service.compare_grades(None, grades, "24/25 Güz")
+    assert [c["ders"] for c in changes] == ["Fizik I"]
+    assert changes[0]["olaylar"][0].kind == COURSE_ADDED
+
+    posted = [GradeRecord("Fizik I", "Vize : 80", "", "")]
+    changes, message = service.compare_grades({"grades": grades}, posted, "24/25 Güz")
+    assert message == "Değişiklik bulundu"
+    assert changes[0]["eski"] == grades[0] and changes[0]["yeni"] == posted[0]
+    assert _kinds(changes[0]["olaylar"]) == [(EXAM_POSTED, "Vize")]
+
+    changes, message = service.compare_grades({"grades": posted}, list(posted), "24/25 Güz")
+    assert changes == [] and message == "Değişiklik yok"
@@ -0,0 +1,107 @@
+"""
+BU DOSYA: Append-only not geçmişinin (GradeHistoryStore) yazma, başlangıç
+kaydı ve zaman sorgularını (bisect) test eder.
+"""
+
+from services.grade_diff import EXAM_POSTED, GradeEvent
+from services.grade_history import GradeHistoryStore
+from services.grade_record import GradeRecord
+
+SEMESTER = "24/25 Güz"
+
+MAT_EMPTY = GradeRecord("Matematik I", "Vize : - Final : -", "", "")
+MAT_VIZE = GradeRecord("Matematik I", "Vize : 55 Final : -", "", "")
+MAT_FINAL = GradeRecord("Matematik I", "Vize : 55 Final : 70", "CC", "Geçti")
+FIZ = GradeRecord("Fizik I", "Vize : 40", "", "")
+
+
+def _change(old, new, *events):
+    return {"ders": (new or old).course, "eski": old, "yeni": new, "olaylar": list(events)}
+
+
+def _history(tmp_path) -> GradeHistoryStore:
+    store = GradeHistoryStore(str(tmp_path), account="221805001")
+    store.record_changes(SEMESTER, [_change(None, MAT_EMPTY), _change(None, FIZ)], "2024-10-01T09:00:00")
+    store.record_changes(SEMESTER, [_change(MAT_EMPTY, MAT_VIZE, GradeEvent(EXAM_POSTED, "Matematik I", "Vize", "-", "55"))],
+                         "2024-11-15T12:00:00")
+    store.record_changes(SEMESTER, [_change(MAT_VIZE, MAT_FINAL)], "2025-01-20T18:30:00")
+    store.record_changes(SEMESTER, [_change(FIZ, None)], "2025-02-01T08:00:00")
+    return store
+
+
+def test_snapshot_at_returns_state_at_each_point(tmp_path):
+    store = _history(tmp_path)
+    assert store.snapshot_at(SEMESTER, "2024-09-30T00:00:00") == []
+    assert sorted(store.snapshot_at(SEMESTER, "2024-10-01T09:00:00"), key=lambda r: r.course) == [FIZ, MAT_EMPTY]
+    assert set(store.snapshot_at(SEMESTER, "2024-12-01T00:00:00")) == {MAT_VIZE, FIZ}
+    assert store.snapshot_at(SEMESTER, "2025-03-01T00:00:00") == [MAT_FINAL]
+
+
+def test_changes_between_is_inclusive(tmp_path):
+    store = _history(tmp_path)
+    entries = store.changes_between(SEMESTER, "2024-11-15T12:00:00", "2025-01-20T18:30:00")
+    assert [e.record for e in entries] == [MAT_VIZE, MAT_FINAL]
+    assert len(store.changes_between(SEMESTER)) == 5
+    assert store.changes_between("23/24 Bahar") == []
+
+
+def test_when_posted_and_course_timeline(tmp_path):
+    store = _history(tmp_path)
+    assert store.when_posted("matematik  i", "vize") == "2024-11-15T12:00:00"
+    assert store.when_posted("Matematik I", "Final", SEMESTER) == "2025-01-20T18:30:00"
+    assert store.when_posted("Fizik I", "Final") is None
+    assert [e.record for e in store.course_timeline("Fizik I")] == [FIZ, None]
+
+
+def test_history_is_rebuilt_from_file(tmp_path):
+    _history(tmp_path)
+    reloaded = GradeHistoryStore(str(tmp_path))
+    assert reloaded.snapshot_at(SEMESTER, "2024-12-01T00:00:00")
+    assert reloaded.course_timeline("Matematik I")[1].events[0].field == "Vize"
+
+
+def test_repeated_change_is_not_recorded_twice(tmp_path):
+    store = _history(tmp_path)
+    assert store.record_changes(SEMESTER, [_change(MAT_VIZE, MAT_FINAL)], "2025-02-02T00:00:00") == 0
+
+
+def test_partial_last_line_is_skipped_and_not_extended(tmp_path):
+    store = _history(tmp_path)
+    with open(store.file_path, "a", encoding="utf-8") as f:
+        f.write('{"ts": "2025-02-03T00:00:00", "sem')
+
+    reloaded = GradeHistoryStore(str(tmp_path))
+    assert reloaded.record_changes(SEMESTER, [_change(None, FIZ)], "2025-02-04T00:00:00") == 1
+    assert set(GradeHistoryStore(str(tmp_path)).snapshot_at(SEMESTER, "2025-02-05T00:00:00")) == {MAT_FINAL, FIZ}
+
+
+def test_seed_snapshot_gives_baseline_before_first_change(tmp_path):
+    store = GradeHistoryStore(str(tmp_path))
+    # Geçmişten önce oluşmuş kayıt (microsaniyeli zaman damgası saniyeye indirilir)
+    assert store.seed_snapshot(SEMESTER, [MAT_EMPTY, FIZ], "2024-10-01T09:00:00.123456") == 2
+    store.record_changes(SEMESTER, [_change(MAT_EMPTY, MAT_VIZE)], "2024-11-15T12:00:00")
+
+    assert set(store.snapshot_at(SEMESTER, "2024-11-01T00:00:00")) == {MAT_EMPTY, FIZ}
+    assert set(store.snapshot_at(SEMESTER, "2024-11-16T00:00:00")) == {MAT_VIZE, FIZ}
+    # Geçmişi olan dönem yeniden başlatılmaz
+    assert store.seed_snapshot(SEMESTER, [MAT_EMPTY], "2024-12-01T00:00:00") == 0
+
+
+def test_seed_keeps_its_own_timestamp_and_index_stays_sorted(tmp_path):
+    # Diğer dönemin geçmişi (2025-02-01'e kadar) yeni dönemin eski kaydından sonra
+    store = _history(tmp_path)
+    other = "24/25 Bahar"
+    assert store.seed_snapshot(other, [FIZ], "2024-09-01T10:00:00") == 1
+    assert store.changes_between(other)[0].timestamp == "2024-09-01T10:00:00"
+    assert store.snapshot_at(other, "2024-12-01T00:00:00") == [FIZ]
+
+    # Canlı değişiklik saat geri alınmış olsa bile son kayıttan geriye gitmez
+    store.record_changes(other, [_change(FIZ, None)], "2024-01-01T00:00:00")
+    assert [e.timestamp for e in store.changes_between(other)] == ["2024-09-01T10:00:00", "2025-02-01T08:00:00"]
+
+    # Dosyada sırası bozuk olan satırlar yeniden yüklemede sıralı dizine girer
+    reloaded = GradeHistoryStore(str(tmp_path))
+    assert [e.timestamp for e in reloaded.course_timeline("Fizik I")] == [
+        "2024-09-01T10:00:00", "2024-10-01T09:00:00", "2025-02-01T08:00:00", "2025-02-01T08:00:00"]
+    assert reloaded.snapshot_at(other, "2024-12-01T00:00:00") == [FIZ]
+    assert reloaded.snapshot_at(other, "2025-03-01T00:00:00") == []
@@ -0,0 +1,61 @@
+"""
+BU DOSYA: Not tablosu ayrıştırıcı arka uçlarının (html_parsers) aynı HTML için
+referans davranışla (tam sayfa BeautifulSoup, html.parser) aynı çıktıyı verdiğini test eder.
+"""
+
+import pytest
+
+from services.html_parsers import TableNotFound, available_backends, get_row_parser, parse_rows_soup
+
+TABLE_ID = "ctl00_ctl00_cphMain_cphContent_rgridOgrenciDersNot_ctl00"
+
+ROWS = ("<tr><td>BİL101</td><td> Programlama <b>I</b> </td><td>Vize : 55 <span>Final : 70</span></td></tr>"
+        "<tr><td>MAT101</td><td>Matematik I</td><td><!-- yorum -->Vize : -</td></tr>")
+
+CASES = {
+    "tbody": f'<html><body><table id="{TABLE_ID}"><tbody>{ROWS}</tbody></table></body></html>',
+    "no_tbody": f'<html><body><table id="{TABLE_ID}">{ROWS}</table></body></html>',
+    "thead_and_tbody": (f'<table id="{TABLE_ID}"><thead><tr><th>Ders</th></tr></thead>'
+                        f'<TBODY class="rgBody">{ROWS}</TBODY></table>'),
+    # RadGrid komut satırı / sayfalayıcı: thead içinde tbody'siz iç tablo
+    "nested_table_in_thead": (f'<table id="{TABLE_ID}"><thead><tr><td><table class="rgCommandTable">'
+                              f'<tr><td>Yenile</td></tr></table></td></tr></thead><tbody>{ROWS}</tbody></table>'),
+    "nested_tbody_in_thead": (f'<table id="{TABLE_ID}"><thead><tr><td><table><tbody><tr><td>Sayfa 1</td></tr>'
+                              f'</tbody></table></td></tr></thead><tbody>{ROWS}</tbody></table>'),
+    # Tablo id'si sayfada tablodan önce (script içinde) geçer
+    "id_in_script_no_tbody": (f'<html><head><script>var grid = $find("{TABLE_ID}"); var s = "<tbody>";</script>'
+                              f'</head><body><table id="{TABLE_ID}">{ROWS}</table></body></html>'),
+    "id_in_script_with_tbody": (f'<html><head><script>var grid = $find("{TABLE_ID}");</script></head>'
+                                f'<body><table id="{TABLE_ID}"><tbody>{ROWS}</tbody></table></body></html>'),
+    "other_table_first": (f'<table id="menu"><tbody><tr><td>Menü</td></tr></tbody></table>'
+                          f'<table id="{TABLE_ID}"><tbody>{ROWS}</tbody></table>'),
+    "empty_tbody": f'<table id="{TABLE_ID}"><tbody></tbody></table>',
+}
+
+
+def _result(parser, html):
+    try:
+        return parser(html, TABLE_ID)
+    except TableNotFound:
+        return TableNotFound
+
+
+@pytest.mark.parametrize("backend", available_backends())
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_backends_match_reference(backend, case):
+    html = CASES[case]
+    assert _result(get_row_parser(backend), html) == _result(parse_rows_soup, html)
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_missing_table_raises(backend):
+    with pytest.raises(TableNotFound):
+        get_row_parser(backend)('<table id="baska"><tbody><tr><td>x</td></tr></tbody></table>', TABLE_ID)
+
+
+def test_reference_reads_rows():
+    assert parse_rows_soup(CASES["tbody"], TABLE_ID) == [
+        ["BİL101", "ProgramlamaI", "Vize : 55Final : 70"],
+        ["MAT101", "Matematik I", "Vize : -"],
+    ]
+    assert parse_rows_soup(CASES["no_tbody"], TABLE_ID) is None
@@ -0,0 +1,67 @@
+"""
+BU DOSYA: HTTP motorunun keep-alive istemcisinin yönlendirme takibini yerel bir
+test sunucusuna karşı test eder.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from services.http_fetch import HttpEngineUnavailable, _KeepAliveClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith("/loop"):
+            self._reply(302, b"", {"Location": "/loop"})
+        elif self.path == "/hop":
+            self._reply(302, b"", {"Location": "/page"})
+        elif self.path == "/nowhere":
+            self._reply(302, b"redirect body")
+        else:
+            self._reply(200, "<html>Notlar</html>".encode("utf-8"),
+                        {"Content-Type": "text/html; charset=utf-8"})
+
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_redirect_is_followed(base_url):
+    client = _KeepAliveClient(timeout=5)
+    try:
+        url, html = client.request("GET", f"{base_url}/hop")
+    finally:
+        client.close()
+    assert url == f"{base_url}/page"
+    assert html == "<html>Notlar</html>"
+
+
+@pytest.mark.parametrize("path", ["/loop", "/nowhere"])
+def test_unfinished_redirect_raises(base_url, path):
+    client = _KeepAliveClient(timeout=5)
+    try:
+        with pytest.raises(HttpEngineUnavailable):
+            client.request("GET", f"{base_url}{path}")
+    finally:
+        client.close()
@@ -0,0 +1,130 @@
+"""
+BU DOSYA: SQLite arka ucunun JSON kayıtlarını içe aktarmasını, satır düzeyi
+yazmasını ve eski şemalı veritabanının yükseltilmesini test eder.
+"""
+
+import json
+import sqlite3
+
+from services.grade_record import GradeRecord
+from services.sqlite_store import (SCHEMA_VERSION, SQLiteDocumentStorage, SQLiteGradeStorageService,
+                                   SQLiteStore)
+from services.storage import GradeStorageService
+
+GRADES = [
+    GradeRecord("Matematik I", "Vize : 55", "", ""),
+    GradeRecord("Fizik I", "Vize : 70", "BA", "Geçti"),
+]
+# Aynı ders anahtarına sahip iki satır (örn. tekrar alınan ders)
+DUPLICATES = [
+    GradeRecord("Seçmeli Ders", "Vize : 40", "", ""),
+    GradeRecord("Seçmeli  Ders", "Vize : 90", "AA", "Geçti"),
+]
+
+
+def _store(tmp_path) -> SQLiteStore:
+    return SQLiteStore(str(tmp_path / "obis.db"))
+
+
+def test_json_snapshot_is_imported_once(tmp_path):
+    json_path = str(tmp_path / "grades_data_24_25_Güz.json")
+    GradeStorageService(json_path).save_grades(GRADES, semester="24/25 Güz", fingerprint="v1:abc")
+    store = _store(tmp_path)
+
+    storage = SQLiteGradeStorageService(json_path, store)
+    data = storage.load_previous_grades()
+    assert data["grades"] == GRADES
+    assert data["semester"] == "24/25 Güz"
+    assert storage.get_fingerprint() == "v1:abc"
+
+    # İçe aktarıldıktan sonra JSON dosyasındaki değişiklikler tekrar aktarılmaz
+    storage.save_grades(GRADES[:1], semester="24/25 Güz")
+    GradeStorageService(json_path).save_grades(GRADES[1:], semester="24/25 Güz")
+    assert SQLiteGradeStorageService(json_path, store).load_previous_grades()["grades"] == GRADES[:1]
+
+
+def test_import_claim_is_rolled_back_with_failed_write(tmp_path, monkeypatch):
+    json_path = str(tmp_path / "grades.json")
+    GradeStorageService(json_path).save_grades(GRADES)
+    store = _store(tmp_path)
+
+    def fail(*args, **kwargs):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(SQLiteGradeStorageService, "_write_rows", fail)
+    try:
+        SQLiteGradeStorageService(json_path, store)
+    except sqlite3.OperationalError:
+        pass
+    assert not store.is_imported(store.doc_key(json_path))
+
+    monkeypatch.undo()
+    assert SQLiteGradeStorageService(json_path, store).load_previous_grades()["grades"] == GRADES
+
+
+def test_non_object_json_snapshot_is_skipped(tmp_path):
+    json_path = str(tmp_path / "grades.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump([1, 2, 3], f)
+    store = _store(tmp_path)
+
+    storage = SQLiteGradeStorageService(json_path, store)
+    assert storage.load_previous_grades() is None
+    assert store.is_imported(store.doc_key(json_path))
+
+
+def test_rows_with_same_course_key_are_kept(tmp_path):
+    assert DUPLICATES[0].key == DUPLICATES[1].key
+    json_path = str(tmp_path / "grades.json")
+    GradeStorageService(json_path).save_grades(DUPLICATES + GRADES)
+    storage = SQLiteGradeStorageService(json_path, _store(tmp_path))
+
+    assert storage.load_previous_grades()["grades"] == DUPLICATES + GRADES
+    assert storage.save_grades(GRADES + DUPLICATES[1:])
+    assert storage.load_previous_grades()["grades"] == GRADES + DUPLICATES[1:]
+
+
+def test_unchanged_grades_are_not_rewritten(tmp_path):
+    storage = SQLiteGradeStorageService(str(tmp_path / "grades.json"), _store(tmp_path))
+    assert storage._write(GRADES, "24/25 Güz", "v1:abc")
+    assert not storage._write(list(GRADES), "24/25 Güz", "v1:abc")
+    assert storage._write(GRADES, "24/25 Güz", "v1:def")
+
+
+def test_document_is_imported_with_values(tmp_path):
+    json_path = tmp_path / "settings.json"
+    json_path.write_text(json.dumps({"interval": 5, "semester": "24/25 Güz"}), encoding="utf-8")
+    store = _store(tmp_path)
+
+    document = SQLiteDocumentStorage(str(json_path), store)
+    assert document.load() == {"interval": 5, "semester": "24/25 Güz"}
+    assert store.is_imported("settings.json")
+
+    document.save({"interval": 10})
+    assert SQLiteDocumentStorage(str(json_path), store).load() == {"interval": 10}
+
+
+def test_version_0_database_is_upgraded(tmp_path):
+    db_path = str(tmp_path / "obis.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE grade_rows (doc TEXT NOT NULL, course_key TEXT NOT NULL, position INTEGER NOT NULL,
+            course TEXT NOT NULL, exams TEXT NOT NULL, letter TEXT NOT NULL, result TEXT NOT NULL,
+            PRIMARY KEY (doc, course_key));
+        CREATE INDEX idx_grade_rows_doc_position ON grade_rows (doc, position);
+        CREATE TABLE grade_snapshots (doc TEXT PRIMARY KEY, timestamp TEXT NOT NULL, semester TEXT, fingerprint TEXT);
+        INSERT INTO grade_snapshots VALUES ('grades.json', '2024-10-01T09:00:00', '24/25 Güz', NULL);
+        INSERT INTO grade_rows VALUES ('grades.json', 'fizik i', 1, 'Fizik I', 'Vize : 70', 'BA', 'Geçti');
+        INSERT INTO grade_rows VALUES ('grades.json', 'matematik i', 0, 'Matematik I', 'Vize : 55', '', '');
+    """)
+    conn.close()
+
+    store = SQLiteStore(db_path)
+    assert store.query("PRAGMA user_version")[0][0] == SCHEMA_VERSION
+    primary_key = [row[1] for row in sorted(store.query("PRAGMA table_info(grade_rows)"), key=lambda r: r[5]) if row[5]]
+    assert primary_key == ["doc", "position"]
+
+    storage = SQLiteGradeStorageService(str(tmp_path / "grades.json"), store)
+    assert storage.load_previous_grades()["grades"] == GRADES
+    assert storage.save_grades(DUPLICATES)
+    assert storage.load_previous_grades()["grades"] == DUPLICATES
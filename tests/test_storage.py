@@ -0,0 +1,133 @@
+"""
+BU DOSYA: GradeStorageService'in atomik kayıt, yedek (.bak) ve bozuk dosya
+kurtarma davranışlarını test eder.
+"""
+
+import json
+import os
+
+from services.grade_record import GradeRecord
+from services.storage import GradeStorageService
+
+GRADES = [
+    GradeRecord("Matematik I", "Vize : 55 Final : -", "", ""),
+    GradeRecord("Fizik I", "Vize : 70 Final : 80", "BA", "Geçti"),
+]
+
+
+def _storage(tmp_path) -> GradeStorageService:
+    return GradeStorageService(str(tmp_path / "grades_data_24_25_Güz.json"))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    storage = _storage(tmp_path)
+    assert storage.save_grades(GRADES, semester="24/25 Güz", fingerprint="v1:abc")
+
+    data = GradeStorageService(storage.file_path).load_previous_grades()
+    assert data["grades"] == GRADES
+    assert data["semester"] == "24/25 Güz"
+    assert data["fingerprint"] == "v1:abc"
+    assert not os.path.exists(storage.file_path + ".tmp")
+
+
+def test_unchanged_grades_are_not_rewritten(tmp_path):
+    storage = _storage(tmp_path)
+    storage.save_grades(GRADES, semester="24/25 Güz")
+    before = os.stat(storage.file_path).st_mtime_ns
+    os.utime(storage.file_path, ns=(before - 10**9, before - 10**9))
+    touched = os.stat(storage.file_path).st_mtime_ns
+
+    fresh = GradeStorageService(storage.file_path)
+    fresh.load_previous_grades()
+    assert fresh.save_grades(list(GRADES), semester="24/25 Güz")
+    assert os.stat(storage.file_path).st_mtime_ns == touched
+    assert not os.path.exists(storage.backup_path)
+
+
+def test_overwritten_snapshot_is_kept_as_backup(tmp_path):
+    storage = _storage(tmp_path)
+    storage.save_grades(GRADES[:1])
+    storage.save_grades(GRADES)
+
+    with open(storage.backup_path, encoding="utf-8") as f:
+        backup = json.load(f)
+    assert [GradeRecord.from_dict(g) for g in backup["grades"]] == GRADES[:1]
+    # Ana dosya yedeğe taşınmaz, kopyalanır
+    assert os.path.exists(storage.file_path)
+
+
+def test_corrupt_primary_falls_back_to_backup(tmp_path):
+    storage = _storage(tmp_path)
+    storage.save_grades(GRADES[:1])
+    storage.save_grades(GRADES)
+    with open(storage.file_path, "w", encoding="utf-8") as f:
+        f.write('{"grades": [')
+
+    data = GradeStorageService(storage.file_path).load_previous_grades()
+    assert data["grades"] == GRADES[:1]
+
+
+def test_non_object_primary_is_treated_as_corrupt(tmp_path):
+    storage = _storage(tmp_path)
+    storage.save_grades(GRADES[:1])
+    storage.save_grades(GRADES)
+    with open(storage.file_path, "w", encoding="utf-8") as f:
+        json.dump(["geçerli", "ama", "liste"], f)
+
+    fresh = GradeStorageService(storage.file_path)
+    assert fresh.load_previous_grades()["grades"] == GRADES[:1]
+    assert fresh.save_grades(GRADES)
+    # Sözlük olmayan ana dosya sağlam yedeğin yerine geçmez
+    with open(storage.backup_path, encoding="utf-8") as f:
+        assert [GradeRecord.from_dict(g) for g in json.load(f)["grades"]] == GRADES[:1]
+
+
+def test_corrupt_primary_is_repaired_even_if_grades_match_backup(tmp_path):
+    storage = _storage(tmp_path)
+    storage.save_grades(GRADES)
+    storage.save_grades(GRADES[:1])
+    with open(storage.file_path, "w", encoding="utf-8") as f:
+        f.write("{bozuk")
+
+    fresh = GradeStorageService(storage.file_path)
+    assert fresh.load_previous_grades()["grades"] == GRADES
+    assert fresh.save_grades(GRADES)
+
+    with open(storage.file_path, encoding="utf-8") as f:
+        repaired = json.load(f)
+    assert [GradeRecord.from_dict(g) for g in repaired["grades"]] == GRADES
+    # Bozuk dosya sağlam yedeğin yerine geçmez
+    with open(storage.backup_path, encoding="utf-8") as f:
+        assert [GradeRecord.from_dict(g) for g in json.load(f)["grades"]] == GRADES
+
+
+def test_missing_files_return_none(tmp_path):
+    assert _storage(tmp_path).load_previous_grades() is None
+
+
+def test_snapshot_cache_hits_until_file_changes(tmp_path):
+    storage = _storage(tmp_path)
+    storage.save_grades(GRADES, fingerprint="v1:abc")
+
+    assert storage.get_fingerprint() == "v1:abc"
+    storage.load_previous_grades()
+    assert storage.get_cache_stats() == {"hits": 2, "misses": 0}
+
+    # Dışarıdan değiştirilen dosya (farklı boyut/mtime) yeniden okunur
+    other = GradeStorageService(storage.file_path)
+    other.save_grades(GRADES[:1], fingerprint="v1:def")
+    assert storage.get_fingerprint() == "v1:def"
+    assert storage.load_previous_grades()["grades"] == GRADES[:1]
+    assert storage.get_cache_stats()["misses"] == 1
+
+
+def test_cached_snapshot_is_not_mutated_by_callers(tmp_path):
+    storage = _storage(tmp_path)
+    storage.save_grades(GRADES)
+
+    data = storage.load_previous_grades()
+    data["grades"].clear()
+    data["semester"] = "değişti"
+    again = storage.load_previous_grades()
+    assert again["grades"] == GRADES
+    assert "semester" not in again